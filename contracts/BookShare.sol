@@ -254,6 +254,141 @@ contract BookShare is OrgShareBase {
             allowed[_addr[SENDER]][_auth] = allowed[_addr[SENDER]][_auth].sub(_value);
         }
 
+        _updateBalances(_addr, _id, _rating, _country, _value);
+    }
+
+    /**
+        @notice Transfer shares to many recipients
+        @dev
+            The sender is resolved and checked by orgCode once for the entire
+            call. Each transfer is otherwise the same as a call to transfer(),
+            including module hooks and events.
+        @param _to Array of recipients
+        @param _value Array of amounts being transferred
+        @return bool success
+     */
+    function transferMany(
+        address[] _to,
+        uint256[] _value
+    )
+        public
+        returns (bool)
+    {
+        require(_to.length == _value.length); // dev: length mismatch
+        (
+            bytes32 _authID,
+            bytes32[] memory _id,
+            uint8[] memory _rating,
+            uint16[] memory _country
+        ) = orgCode.transferSharesMany(
+            msg.sender,
+            msg.sender,
+            _to,
+            _getZeroMany(msg.sender, _to, _value)
+        );
+        for (uint256 i; i < _to.length; i++) {
+            _transferMany(_authID, _id, _rating, _country, _to[i], _value[i], i + 1);
+        }
+        return true;
+    }
+
+    /**
+        @notice Internal - zero balance booleans for transferMany
+        @dev
+            Receivers are tracked in an open addressed table so that repeated
+            receivers are found without a nested loop.
+        @param _from Sender
+        @param _to Array of recipients
+        @param _value Array of amounts being transferred
+        @return array of zero balance booleans, 4 per recipient
+     */
+    function _getZeroMany(
+        address _from,
+        address[] memory _to,
+        uint256[] memory _value
+    )
+        internal
+        view
+        returns (bool[] _zero)
+    {
+        _zero = new bool[](_to.length * 4);
+        address[] memory _seen = new address[](_to.length * 2);
+        uint256[] memory _sent = new uint256[](_to.length * 2);
+        uint256 _balance = balances[_from];
+        for (uint256 i; i < _to.length; i++) {
+            uint256 x = uint256(_to[i]) % _seen.length;
+            while (_seen[x] != 0x00 && _seen[x] != _to[i]) {
+                x = (x + 1) % _seen.length;
+            }
+            bool _first = (_seen[x] == 0x00);
+            _seen[x] = _to[i];
+            _sent[x] = _sent[x].add(_value[i]);
+            _zero[i * 4] = (_balance == _value[i]);
+            _zero[i * 4 + 1] = (_first && balances[_to[i]] == 0);
+            _zero[i * 4 + 2] = (custBalances[_to[i]][_from] == _sent[x]);
+            _zero[i * 4 + 3] = (_first && custBalances[_from][_to[i]] == 0);
+            if (_to[i] != _from && _balance >= _value[i]) {
+                _balance -= _value[i];
+            }
+        }
+        return _zero;
+    }
+
+    /**
+        @notice Internal - single transfer within transferMany
+        @param _authID ID of caller
+        @param _id Array of sender and recipient IDs
+        @param _rating Array of sender and recipient ratings
+        @param _country Array of sender and recipient countries
+        @param _to Recipient
+        @param _value Amount being transferred
+        @param _idx Index of recipient in the ID, rating and country arrays
+     */
+    function _transferMany(
+        bytes32 _authID,
+        bytes32[] memory _id,
+        uint8[] memory _rating,
+        uint16[] memory _country,
+        address _to,
+        uint256 _value,
+        uint256 _idx
+    )
+        internal
+    {
+        bytes32[2] memory _pairID = [_id[SENDER], _id[_idx]];
+        uint8[2] memory _pairRating = [_rating[SENDER], _rating[_idx]];
+        uint16[2] memory _pairCountry = [_country[SENDER], _country[_idx]];
+        address[2] memory _addr = _checkTransfer(
+            _authID,
+            _pairID,
+            /** is sender a custodian? */
+            (_pairRating[SENDER] == 0 && _pairID[SENDER] != ownerID) ? msg.sender : 0x00,
+            [msg.sender, _to],
+            _pairRating,
+            _pairCountry,
+            _value
+        );
+        _updateBalances(_addr, _pairID, _pairRating, _pairCountry, _value);
+    }
+
+    /**
+        @notice Internal - balance updates, hooks and events after a transfer
+        @dev common logic for _transfer() and _transferMany()
+        @param _addr Array of sender/receiver address
+        @param _id Array of sender/receiver IDs
+        @param _rating Array of sender/receiver ratings
+        @param _country Array of sender/receiver countries
+        @param _value Amount to transfer
+     */
+    function _updateBalances(
+        address[2] _addr,
+        bytes32[2] _id,
+        uint8[2] _rating,
+        uint16[2] _country,
+        uint256 _value
+    )
+        internal
+    {
         /*
             balances are modified regardless of if the transfer involves a
             custodian, to keep sum of balance mapping == totalSupply
@@ -317,7 +452,30 @@ contract BookShare is OrgShareBase {
             uint8[2] memory _rating,
             uint16[2] memory _country
         ) = orgCode.transferShares(msg.sender, _addr[SENDER], _addr[RECEIVER], _zero);
+        _transferCustodian(_value, _authID, _id, _addr, _rating, _country);
+        return true;
+    }
 
+    /**
+        @notice Internal - custodian transfer after the org level checks
+        @dev common logic for transferCustodian() and transferCustodianBatch()
+        @param _value Amount to transfer
+        @param _authID ID of caller
+        @param _id Array of sender/receiver IDs
+        @param _addr Array of sender/receiver addresses
+        @param _rating Array of sender/receiver ratings
+        @param _country Array of sender/receiver countries
+     */
+    function _transferCustodian(
+        uint256 _value,
+        bytes32 _authID,
+        bytes32[2] _id,
+        address[2] _addr,
+        uint8[2] _rating,
+        uint16[2] _country
+    )
+        internal
+    {
         _addr = _checkTransfer(
             _authID,
             _id,
@@ -339,7 +497,6 @@ contract BookShare is OrgShareBase {
             0x00,
             abi.encode(msg.sender, _addr, _id, _rating, _country, _value)
         ));
-        return true;
     }
 
     /**
@@ -352,14 +509,49 @@ contract BookShare is OrgShareBase {
     function mint(address _owner, uint256 _value) external returns (bool) {
         /* msg.sig = 0x40c10f19 */
         if (!_checkPermitted()) return false;
+        _mint(_owner, _value);
+        require(totalSupply <= authorizedSupply); // dev: exceed auth
+        return true;
+    }
+
+    /**
+        @notice Mint new shares to many owners and increase total supply
+        @dev Callable by orgCode or via module
+        @param _owners Array of share owners
+        @param _values Array of number of shares to mint
+        @return bool
+     */
+    function mintBatch(
+        address[] _owners,
+        uint256[] _values
+    )
+        external
+        returns (bool)
+    {
+        /* msg.sig = 0x7c88e3d9 */
+        require(_owners.length == _values.length); // dev: length mismatch
+        if (!_checkPermitted()) return false;
+        for (uint256 i; i < _owners.length; i++) {
+            _mint(_owners[i], _values[i]);
+        }
+        require(totalSupply <= authorizedSupply); // dev: exceed auth
+        return true;
+    }
+
+    /**
+        @notice Internal - shared logic for mint and mintBatch
+        @dev Caller must verify that authorizedSupply is not exceeded
+        @param _owner Owner of the shares
+        @param _value Number of shares to mint
+     */
+    function _mint(address _owner, uint256 _value) internal {
         require(_value > 0); // dev: mint 0
         orgCode.checkTransfer(address(orgCode), address(orgCode), _owner, false);
         uint256 _old = balances[_owner];
         balances[_owner] = _old.add(_value);
         totalSupply = totalSupply.add(_value);
-        require(totalSupply <= authorizedSupply); // dev: exceed auth
         emit Transfer(0x00, _owner, _value);
-        return _modifyTotalSupply(_owner, _old);
+        _modifyTotalSupply(_owner, _old);
     }
 
     /**
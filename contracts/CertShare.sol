@@ -20,10 +20,20 @@ contract CertShare is OrgShareBase {
     /** depending on the intended totalSupply, you may wish to adjust this constant */
     uint256 constant SCOPING_MULTIPLIER = 16;
 
+    /** number of ranges checked for a fit before splitting a larger range */
+    uint256 constant SPLIT_LOOKAHEAD = 8;
+
+    /** maximum number of range entries scanned by one rangesOfPaged call */
+    uint256 constant PAGE_SCAN_LIMIT = 100;
+
     uint48 upperBound;
     uint48[281474976710656] shares;
     mapping (uint48 => Range) rangeMap;
     mapping (address => Balance) balances;
+    /* range pointer => index of pointer in owner's balance ranges array */
+    mapping (uint48 => uint48) rangeIndex;
+    /* owner => custodian (0x00 if none) => number of ranges */
+    mapping (address => mapping (address => uint48)) rangeCount;
 
     struct Balance {
         uint48 balance;
@@ -157,21 +167,113 @@ contract CertShare is OrgShareBase {
         internal
         view
         returns (uint48[2][])
+    {
+        (uint48[2][] memory _ranges, ) = _rangesOfPaged(
+            _owner,
+            _custodian,
+            0,
+            rangeCount[_owner][_custodian],
+            balances[_owner].length
+        );
+        return _ranges;
+    }
+
+    /**
+        @notice Fetch a page of the share ranges owned by an address
+        @dev
+            Ranges are returned in storage order. The order may change after
+            a transfer, so a set of pages is only consistent if all calls are
+            made against the same block. At most PAGE_SCAN_LIMIT entries are
+            scanned per call, so a page may hold fewer than _limit ranges
+            while the returned cursor is still non-zero.
+        @param _owner Address to query
+        @param _custodian Address of custodian (0x00 if none)
+        @param _cursor Position to start from, 0 for the first page
+        @param _limit Maximum number of ranges to return
+        @return Array of [(start, stop),..], cursor for the next call (0 when done)
+     */
+    function rangesOfPaged(
+        address _owner,
+        address _custodian,
+        uint256 _cursor,
+        uint256 _limit
+    )
+        external
+        view
+        returns (uint48[2][], uint256)
+    {
+        return _rangesOfPaged(_owner, _custodian, _cursor, _limit, PAGE_SCAN_LIMIT);
+    }
+
+    /**
+        @notice Fetch the number of share ranges owned by an address
+        @param _owner Address to query
+        @param _custodian Address of custodian (0x00 if none)
+        @return integer
+     */
+    function rangeCountOf(
+        address _owner,
+        address _custodian
+    )
+        external
+        view
+        returns (uint256)
+    {
+        return rangeCount[_owner][_custodian];
+    }
+
+    /**
+        @notice Internal - shared logic for range views
+        @param _owner Address to query
+        @param _custodian Address of custodian
+        @param _cursor Position in the owner's range array to start from
+        @param _limit Maximum number of ranges to return
+        @param _scan Maximum number of range entries to scan
+        @return Array of [(start, stop),..], cursor for the next call (0 when done)
+     */
+    function _rangesOfPaged(
+        address _owner,
+        address _custodian,
+        uint256 _cursor,
+        uint256 _limit,
+        uint256 _scan
+    )
+        internal
+        view
+        returns (uint48[2][] _ranges, uint256)
     {
         Balance storage b = balances[_owner];
+        if (_limit > rangeCount[_owner][_custodian]) {
+            _limit = rangeCount[_owner][_custodian];
+        }
+        _ranges = new uint48[2][](_limit);
+        if (_limit == 0) return (_ranges, 0);
+        uint256 _end = b.length;
+        if (_cursor < _end && _end - _cursor > _scan) {
+            _end = _cursor + _scan;
+        }
         uint256 _count;
-        for (uint256 i; i < b.length; i++) {
-            if (rangeMap[b.ranges[i]].custodian != _custodian) continue;
+        for (; _count < _limit && _cursor < _end; _cursor++) {
+            if (rangeMap[b.ranges[_cursor]].custodian != _custodian) continue;
+            _ranges[_count] = [b.ranges[_cursor], rangeMap[b.ranges[_cursor]].stop];
             _count++;
         }
-        uint48[2][] memory _ranges = new uint48[2][](_count);
-        _count = 0;
-        for (i = 0; i < b.length; i++) {
-            if (rangeMap[b.ranges[i]].custodian != _custodian) continue;
-            _ranges[_count] = [b.ranges[i], rangeMap[b.ranges[i]].stop];
-            _count++;
+        /*
+            cursor is 0 once the end of the array is reached or all ranges are
+            found, otherwise it is the position where scanning stopped
+        */
+        if (_cursor >= b.length || _count == rangeCount[_owner][_custodian]) {
+            _cursor = 0;
         }
-        return _ranges;
+        if (_count == _limit) {
+            return (_ranges, _cursor);
+        }
+        /* fewer ranges found than requested, shorten the array */
+        uint48[2][] memory _found = new uint48[2][](_count);
+        for (uint256 i; i < _count; i++) {
+            _found[i] = _ranges[i];
+        }
+        return (_found, _cursor);
     }
 
     /**
@@ -289,6 +391,12 @@ contract CertShare is OrgShareBase {
 
     /**
         @notice Find ranges that are permitted to transfer
+        @dev
+            Ranges are checked in storage order. Ranges smaller than the
+            remaining value are taken whole and an exact fit ends the search.
+            The first range that would have to be split is held back while up
+            to SPLIT_LOOKAHEAD further ranges are checked for a fit, then it
+            is taken. At most one range is split.
         @param _authID ID of calling authority
         @param _id Array of member IDs
         @param _cust Custodian address
@@ -312,32 +420,97 @@ contract CertShare is OrgShareBase {
         internal
         returns (uint48[] _range)
     {
-        uint256 _count;
         _range = new uint48[](_startRange.length);
-        for (uint256 i; i < _startRange.length; i++) {
-            if(!_checkTime(_startRange[i])) continue;
-            Range storage r = rangeMap[_startRange[i]];
-            if (r.custodian !=_cust) continue;
-            /** hook point for CertShare.checkTransferRange() */
-            if (_callModules(0x2d79c6d7, r.tag, abi.encode(
+        uint256 _count;
+        uint256 _split;
+        for (
+            uint256 i;
+            i < _startRange.length && (_split == 0 || i < _split + SPLIT_LOOKAHEAD);
+            i++
+        ) {
+            uint48 _size = _getRangeSize(_cust, _startRange[i]);
+            if (_size == 0 || (_size > _value && _split != 0)) continue;
+            if (!_checkRangeHook(
+                _addr,
                 _authID,
                 _id,
-                _addr,
                 _rating,
                 _country,
-                uint48[2]([_startRange[i],r.stop])
-            ))) {
-                _range[_count] = _startRange[i];
-                if (r.stop - _range[_count] >= _value) {
-                    return _range;
-                }
-                _value -= (r.stop - _range[_count]);
-                _count++;
+                [_startRange[i], rangeMap[_startRange[i]].stop],
+                rangeMap[_startRange[i]].tag
+            )) {
+                continue;
             }
+            if (_size > _value) {
+                /* hold back the range that must be split */
+                _split = i + 1;
+                continue;
+            }
+            _range[_count] = _startRange[i];
+            if (_size == _value) {
+                return _range;
+            }
+            _value -= _size;
+            _count++;
+        }
+        if (_split != 0) {
+            _range[_count] = _startRange[_split - 1];
+            return _range;
         }
         revert("Insufficient transferable shares");
     }
 
+    /**
+        @notice Internal - call checkTransferRange hook for a single range
+        @param _addr Member address array
+        @param _authID ID of calling authority
+        @param _id Array of member IDs
+        @param _rating Member rating array
+        @param _country Member country array
+        @param _range Range (start, stop) being transferred
+        @param _tag Tag of range
+        @return bool is transfer of the range permitted?
+     */
+    function _checkRangeHook(
+        address[2] _addr,
+        bytes32 _authID,
+        bytes32[2] _id,
+        uint8[2] _rating,
+        uint16[2] _country,
+        uint48[2] _range,
+        bytes2 _tag
+    )
+        internal
+        returns (bool)
+    {
+        if (!_isHookListening(0x2d79c6d7, _tag)) return true;
+        /** hook point for CertShare.checkTransferRange() */
+        return _callModules(
+            0x2d79c6d7,
+            _tag,
+            abi.encode(_addr, _authID, _id, _rating, _country, _range)
+        );
+    }
+
+    /**
+        @notice Internal - get size of a range that may be transferred
+        @param _cust Custodian address
+        @param _pointer Range pointer
+        @return range size, zero if the range is not transferable
+     */
+    function _getRangeSize(
+        address _cust,
+        uint48 _pointer
+    )
+        internal
+        returns (uint48)
+    {
+        if (!_checkTime(_pointer)) return 0;
+        Range storage r = rangeMap[_pointer];
+        if (r.custodian != _cust) return 0;
+        return r.stop - _pointer;
+    }
+
     /**
         @notice Mints new shares
         @param _owner Address to assign new shares to
@@ -357,6 +530,57 @@ contract CertShare is OrgShareBase {
     {
         /* msg.sig = 0x15077ec8 */
         if (!_checkPermitted()) return false;
+        _mint(_owner, _value, _time, _tag);
+        require(totalSupply <= authorizedSupply); // dev: exceed auth
+        return true;
+    }
+
+    /**
+        @notice Mints new shares to many owners
+        @dev New ranges are allocated consecutively in the order given
+        @param _owners Array of addresses to assign new shares to
+        @param _values Array of number of shares to mint
+        @param _times Array of time restrictions to apply to shares
+        @param _tags Array of tags to apply to shares
+        @return Bool success
+     */
+    function mintBatch(
+        address[] _owners,
+        uint48[] _values,
+        uint32[] _times,
+        bytes2[] _tags
+    )
+        external
+        returns (bool)
+    {
+        /* msg.sig = 0x4b5c5715 */
+        require(_owners.length == _values.length); // dev: length mismatch
+        require(_owners.length == _times.length); // dev: length mismatch
+        require(_owners.length == _tags.length); // dev: length mismatch
+        if (!_checkPermitted()) return false;
+        for (uint256 i; i < _owners.length; i++) {
+            _mint(_owners[i], _values[i], _times[i], _tags[i]);
+        }
+        require(totalSupply <= authorizedSupply); // dev: exceed auth
+        return true;
+    }
+
+    /**
+        @notice Internal - shared logic for mint and mintBatch
+        @dev Caller must verify that authorizedSupply is not exceeded
+        @param _owner Address to assign new shares to
+        @param _value Number of shares to mint
+        @param _time Time restriction to apply to shares
+        @param _tag Tag to apply to shares
+     */
+    function _mint(
+        address _owner,
+        uint48 _value,
+        uint32 _time,
+        bytes2 _tag
+    )
+        internal
+    {
         require(_value > 0); // dev: mint 0
         require(upperBound + _value > upperBound); // dev: overflow
         require(upperBound + _value <= 2**48 - 2); // dev: upper bound
@@ -371,19 +595,16 @@ contract CertShare is OrgShareBase {
         } else {
             /* create new range */
             _setRange(_start, _owner, _stop, _time, _tag, 0x00);
-            balances[_owner].ranges[balances[_owner].length] = _start;
-            balances[_owner].length += 1;
+            _replaceInBalanceRange(_owner, 0, _start, 0x00);
         }
         uint48 _old = balances[_owner].balance;
         balances[_owner].balance += _value;
         totalSupply += _value;
         upperBound += _value;
-        require(totalSupply <= authorizedSupply); // dev: exceed auth
         emit RangeSet(_tag, _start, _stop, _time);
         emit Transfer(0x00, _owner, _value);
         emit TransferRange(0x00, _owner, _start, _stop, _value);
         _modifyTotalSupply(_owner, _old);
-        return true;
     }
 
     /**
@@ -408,7 +629,7 @@ contract CertShare is OrgShareBase {
         if (_pointer < _start) {
             _splitRange(_start);
         }
-        _replaceInBalanceRange(_owner, _start, 0);
+        _replaceInBalanceRange(_owner, _start, 0, 0x00);
         uint48 _value = _stop - _start;
         totalSupply -= _value;
         uint48 _old = balances[_owner].balance;
@@ -449,7 +670,7 @@ contract CertShare is OrgShareBase {
             _setRangePointers(_prev, _pointer, 0);
             _setRangePointers(_pointer, r.stop, 0);
             _setRangePointers(_prev, r.stop, _prev);
-            _replaceInBalanceRange(r.owner, _pointer, 0);
+            _replaceInBalanceRange(r.owner, _pointer, 0, r.custodian);
             rangeMap[_prev].stop = r.stop;
             delete rangeMap[_pointer];
             r = rangeMap[_prev];
@@ -461,7 +682,7 @@ contract CertShare is OrgShareBase {
             _setRangePointers(r.stop, _next, 0);
             _setRangePointers(_pointer, r.stop, 0);
             _setRangePointers(_pointer, _next, _pointer);
-            _replaceInBalanceRange(r.owner, r.stop, 0);
+            _replaceInBalanceRange(r.owner, r.stop, 0, r.custodian);
             delete rangeMap[r.stop];
             r.stop = _next;
         }
@@ -529,7 +750,7 @@ contract CertShare is OrgShareBase {
                 _setRangePointers(r.stop, _next, 0);
                 _setRangePointers(_start, r.stop, 0);
                 _setRangePointers(_start, _next, _start);
-                _replaceInBalanceRange(r.owner, r.stop, 0);
+                _replaceInBalanceRange(r.owner, r.stop, 0, r.custodian);
                 delete rangeMap[r.stop];
                 r.stop = _next;
                 continue;
@@ -556,7 +777,7 @@ contract CertShare is OrgShareBase {
 
     /**
         @notice ERC-20 transferFrom standard
-        @dev This will transfer shares starting from balance.ranges[0]
+        @dev Ranges to transfer are selected by _findTransferrableRanges
         @param _from Sender address
         @param _to Receipient address
         @param _value Number of shares to send
@@ -721,7 +942,30 @@ contract CertShare is OrgShareBase {
             uint8[2] memory _rating,
             uint16[2] memory _country
         ) = orgCode.transferShares(msg.sender, _addr[SENDER], _addr[RECEIVER], _zero);
+        _transferCustodian(_value, _authID, _id, _addr, _rating, _country);
+        return true;
+    }
 
+    /**
+        @notice Internal - custodian transfer after the org level checks
+        @dev common logic for transferCustodian() and transferCustodianBatch()
+        @param _value Amount to transfer
+        @param _authID ID of caller
+        @param _id Array of sender/receiver IDs
+        @param _addr Array of sender/receiver addresses
+        @param _rating Array of sender/receiver ratings
+        @param _country Array of sender/receiver countries
+     */
+    function _transferCustodian(
+        uint256 _value,
+        bytes32 _authID,
+        bytes32[2] _id,
+        address[2] _addr,
+        uint8[2] _rating,
+        uint16[2] _country
+    )
+        internal
+    {
         uint48[] memory _range;
         (_addr, _range) = _checkTransfer(
             _authID,
@@ -750,7 +994,6 @@ contract CertShare is OrgShareBase {
             uint48(_value),
             _range
         );
-        return true;
     }
 
     /**
@@ -797,11 +1040,13 @@ contract CertShare is OrgShareBase {
                 _custodian
             );
             /** hook point for CertShare.transferShareRange() */
-            require(_callModules(
-                0x244d5002,
-                rangeMap[_range[i]].tag,
-                abi.encode(_addr, _id, _rating, _country, uint48[2]([_start, _stop]))
-            ));
+            if (_isHookListening(0x244d5002, rangeMap[_range[i]].tag)) {
+                require(_callModules(
+                    0x244d5002,
+                    rangeMap[_range[i]].tag,
+                    abi.encode(_addr, _id, _rating, _country, uint48[2]([_start, _stop]))
+                ));
+            }
             if (_value == 0) {
                 return;
             }
@@ -825,30 +1070,65 @@ contract CertShare is OrgShareBase {
         external
         returns (bool)
     {
-        _checkBounds(_start);
-        _checkBounds(_stop-1);
-        require(_start < _stop); // dev: stop < start
-        uint48 _pointer = _getPointer(_stop-1);
-        require(rangeMap[_pointer].custodian == 0x00); // dev: custodian
-        require(_pointer <= _start); // dev: multiple ranges
-        require(_checkTime(_pointer)); // dev: time
+        uint48[2][] memory _ranges = new uint48[2][](1);
+        _ranges[0] = [_start, _stop];
+        _transferRanges(_to, _ranges);
+        return true;
+    }
 
-        address[2] memory _addr = [msg.sender, _to];
-        uint48[2] memory _range = [_start, _stop];
+    /**
+        @notice transfer shares in many specific index ranges
+        @dev
+            Can send shares into a custodian, but not out of one. Ranges must
+            be given in ascending order and may not overlap.
+        @param _to Receipient address
+        @param _ranges Array of [(start, stop),..] to transfer
+        @return bool success
+     */
+    function transferRanges(
+        address _to,
+        uint48[2][] _ranges
+    )
+        external
+        returns (bool)
+    {
+        require(_ranges.length > 0); // dev: no ranges
+        _transferRanges(_to, _ranges);
+        return true;
+    }
 
-        uint48 _value = _stop - _start;
-        bool[4] memory _zero = [
-            balances[msg.sender].balance == _value,
-            balances[_addr[RECEIVER]].balance == 0,
-            custBalances[_addr[RECEIVER]][_addr[SENDER]] == _value,
-            custBalances[_addr[SENDER]][_addr[RECEIVER]] == 0
-        ];
+    /**
+        @notice Internal - shared logic for transferRange and transferRanges
+        @dev Org permissions and counts are checked once for the total value
+        @param _to Receipient address
+        @param _ranges Array of [(start, stop),..] to transfer
+     */
+    function _transferRanges(address _to, uint48[2][] _ranges) internal {
+        uint48 _value;
+        for (uint256 i; i < _ranges.length; i++) {
+            require(i == 0 || _ranges[i][0] >= _ranges[i-1][1]); // dev: range order
+            _checkTransferRange(_ranges[i][0], _ranges[i][1]);
+            _value += _ranges[i][1] - _ranges[i][0];
+            require(_value >= _ranges[i][1] - _ranges[i][0]); // dev: overflow
+        }
+
+        address[2] memory _addr = [msg.sender, _to];
         (
             bytes32 _authID,
             bytes32[2] memory _id,
             uint8[2] memory _rating,
             uint16[2] memory _country
-        ) = orgCode.transferShares(_addr[SENDER], _addr[SENDER], _addr[RECEIVER], _zero);
+        ) = orgCode.transferShares(
+            _addr[SENDER],
+            _addr[SENDER],
+            _addr[RECEIVER],
+            [
+                balances[msg.sender].balance == _value,
+                balances[_addr[RECEIVER]].balance == 0,
+                custBalances[_addr[RECEIVER]][_addr[SENDER]] == _value,
+                custBalances[_addr[SENDER]][_addr[RECEIVER]] == 0
+            ]
+        );
 
         /* Org shares are held at the OrgCode contract address */
         if (_id[SENDER] == ownerID) {
@@ -860,11 +1140,6 @@ contract CertShare is OrgShareBase {
         if (_id[RECEIVER] == ownerID) {
             _addr[RECEIVER] = address(orgCode);
         }
-
-        require(
-            _addr[SENDER] == rangeMap[_pointer].owner,
-            "Sender does not own range"
-        );
         require(_addr[SENDER] != _addr[RECEIVER], "Cannot send to self");
 
         /* hook point for NFTModule.checkTransfer() */
@@ -874,16 +1149,91 @@ contract CertShare is OrgShareBase {
             abi.encode(_addr, _authID, _id, _rating, _country, _value)
         ));
 
-        /* hook point for NFTModule.checkTransferRange */
-        require(_callModules(
-            0x2d79c6d7,
-            rangeMap[_pointer].tag,
-            abi.encode(_addr, _authID, _id, _rating, _country, _range)
-        ));
+        for (i = 0; i < _ranges.length; i++) {
+            _checkRangeSlice(_addr, _authID, _id, _rating, _country, _ranges[i]);
+        }
 
         address _cust;
         (_cust, _addr) = _adjustBalances(_id, _addr, _rating, _country, _value);
 
+        for (i = 0; i < _ranges.length; i++) {
+            _transferRangeSlice(_id, _addr, _rating, _country, _cust, _ranges[i]);
+        }
+    }
+
+    /**
+        @notice Internal - check that a range may be moved by transferRange
+        @param _start Transfer start index
+        @param _stop Transfer stop index
+     */
+    function _checkTransferRange(uint48 _start, uint48 _stop) internal {
+        _checkBounds(_start);
+        _checkBounds(_stop-1);
+        require(_start < _stop); // dev: stop < start
+        uint48 _pointer = _getPointer(_stop-1);
+        require(rangeMap[_pointer].custodian == 0x00); // dev: custodian
+        require(_pointer <= _start); // dev: multiple ranges
+        require(_checkTime(_pointer)); // dev: time
+    }
+
+    /**
+        @notice Internal - check a single slice within transferRanges
+        @param _addr Array of sender/receiver addresses
+        @param _authID ID of calling authority
+        @param _id Array of sender/receiver ID
+        @param _rating Array of sender/receiver member rating
+        @param _country Array of sender/receiver countries
+        @param _range Slice (start, stop) to transfer
+     */
+    function _checkRangeSlice(
+        address[2] _addr,
+        bytes32 _authID,
+        bytes32[2] _id,
+        uint8[2] _rating,
+        uint16[2] _country,
+        uint48[2] _range
+    )
+        internal
+    {
+        uint48 _pointer = _getPointer(_range[1] - 1);
+        require(
+            _addr[SENDER] == rangeMap[_pointer].owner,
+            "Sender does not own range"
+        );
+        /* hook point for NFTModule.checkTransferRange */
+        require(_checkRangeHook(
+            _addr,
+            _authID,
+            _id,
+            _rating,
+            _country,
+            _range,
+            rangeMap[_pointer].tag
+        ));
+    }
+
+    /**
+        @notice Internal - move a single slice within transferRanges
+        @param _id Array of sender/receiver ID
+        @param _addr Array of sender/receiver addresses
+        @param _rating Array of sender/receiver member rating
+        @param _country Array of sender/receiver countries
+        @param _cust Custodian of new range
+        @param _range Slice (start, stop) to transfer
+     */
+    function _transferRangeSlice(
+        bytes32[2] _id,
+        address[2] _addr,
+        uint8[2] _rating,
+        uint16[2] _country,
+        address _cust,
+        uint48[2] _range
+    )
+        internal
+    {
+        /* pointer may have moved if an earlier slice split the same range */
+        uint48 _pointer = _getPointer(_range[1] - 1);
+        bytes2 _tag = rangeMap[_pointer].tag;
         _transferSingleRange(
             _pointer,
             _addr[SENDER],
@@ -893,11 +1243,13 @@ contract CertShare is OrgShareBase {
             _cust
         );
         /* hook point for CertShare.transferShareRange() */
-        require(_callModules(
-            0x244d5002,
-            rangeMap[_pointer].tag,
-            abi.encode(_addr, _id,  _rating, _country, _range)
-        ));
+        if (_isHookListening(0x244d5002, _tag)) {
+            require(_callModules(
+                0x244d5002,
+                _tag,
+                abi.encode(_addr, _id,  _rating, _country, _range)
+            ));
+        }
     }
 
     /**
@@ -928,12 +1280,12 @@ contract CertShare is OrgShareBase {
         if (_pointer == _start) {
             /* touches both */
             if (_rangeStop == _stop) {
-                _replaceInBalanceRange(_from, _start, 0);
+                _replaceInBalanceRange(_from, _start, 0, r.custodian);
                 bool _left = _compareRanges(_prev, _to, 0, _tag, _custodian);
                 bool _right = _compareRanges(_stop, _to, 0, _tag, _custodian);
                 /* no join */
                 if (!_left && !_right) {
-                    _replaceInBalanceRange(_to, 0, _start);
+                    _replaceInBalanceRange(_to, 0, _start, _custodian);
                     if (_from != _to) {
                         r.owner = _to;
                     }
@@ -952,11 +1304,11 @@ contract CertShare is OrgShareBase {
                 }
                 /* join right */
                 if (!_left) {
-                    _replaceInBalanceRange(_to, _stop, _start);
+                    _replaceInBalanceRange(_to, _stop, _start, _custodian);
                     _setRange(_pointer, _to, rangeMap[_stop].stop, 0, _tag, _custodian);
                 /* join both */
                 } else {
-                    _replaceInBalanceRange(_to, _stop, 0);
+                    _replaceInBalanceRange(_to, _stop, 0, _custodian);
                     delete rangeMap[_pointer];
                     rangeMap[_prev].stop = rangeMap[_stop].stop;
                     _setRangePointers(_prev, _start, 0);
@@ -970,7 +1322,7 @@ contract CertShare is OrgShareBase {
             /* touches left */
             _setRangePointers(_start, _rangeStop, 0);
             _setRange(_stop, _from, _rangeStop, 0, _tag, r.custodian);
-            _replaceInBalanceRange(_from, _start, _stop);
+            _replaceInBalanceRange(_from, _start, _stop, r.custodian);
             delete rangeMap[_pointer];
 
             /* same owner left */
@@ -978,7 +1330,7 @@ contract CertShare is OrgShareBase {
                 _setRangePointers(_prev, _start, 0);
                 _start = _prev;
             } else {
-                _replaceInBalanceRange(_to, 0, _start);
+                _replaceInBalanceRange(_to, 0, _start, _custodian);
             }
             _setRange(_start, _to, _stop, 0, _tag, _custodian);
             return;
@@ -993,22 +1345,22 @@ contract CertShare is OrgShareBase {
         if (_rangeStop == _stop) {
             /* same owner right */
             if (_compareRanges(_stop, _to, 0, _tag, _custodian)) {
-                _replaceInBalanceRange(_to, _stop, _start);
+                _replaceInBalanceRange(_to, _stop, _start, _custodian);
                 _setRangePointers(_stop, rangeMap[_stop].stop, 0);
                 uint48 _next = rangeMap[_stop].stop;
                 delete rangeMap[_stop];
                 _stop = _next;
             } else {
-                _replaceInBalanceRange(_to, 0, _start);
+                _replaceInBalanceRange(_to, 0, _start, _custodian);
             }
             _setRange(_start, _to, _stop, 0, _tag, _custodian);
             return;
         }
 
         /* touches nothing */
-        _replaceInBalanceRange(_to, 0, _start);
+        _replaceInBalanceRange(_to, 0, _start, _custodian);
         _setRange(_start, _to, _stop, 0, _tag, _custodian);
-        _replaceInBalanceRange(_from, 0, _stop);
+        _replaceInBalanceRange(_from, 0, _stop, r.custodian);
         _setRange(_stop, _from, _rangeStop, 0, _tag, r.custodian);
     }
 
@@ -1070,7 +1422,7 @@ contract CertShare is OrgShareBase {
         Range storage r = rangeMap[_pointer];
         uint48 _stop = r.stop;
         r.stop = _split;
-        _replaceInBalanceRange(r.owner, 0, _split);
+        _replaceInBalanceRange(r.owner, 0, _split, r.custodian);
         _setRangePointers(_pointer, _stop, 0);
         _setRangePointers(_pointer, _split, _pointer);
         _setRange(_split, r.owner, _stop, r.time, r.tag, r.custodian);
@@ -1107,38 +1459,43 @@ contract CertShare is OrgShareBase {
 
     /**
         @notice internal - replace value in balance range array
+        @dev Replacing a value must not change the custodian of the range
         @param _addr Balance addresss
         @param _old Share index to remove
         @param _new Share index to add
+        @param _custodian Custodian of the range (0x00 if none)
      */
     function _replaceInBalanceRange(
         address _addr,
         uint48 _old,
-        uint48 _new
+        uint48 _new,
+        address _custodian
     )
         internal
     {
-        uint48[140737488355328] storage r = balances[_addr].ranges;
+        Balance storage b = balances[_addr];
         if (_old == 0) {
             // add a new range to the array
-            r[balances[_addr].length] = _new;
-            balances[_addr].length += 1;
+            b.ranges[b.length] = _new;
+            rangeIndex[_new] = b.length;
+            b.length += 1;
+            rangeCount[_addr][_custodian] += 1;
             return;
         }
-        for (uint256 i; i <= balances[_addr].length; i++) {
-            if (r[i] == _old) {
-                if (_new > 0) {
-                    // replace an existing range
-                    r[i] = _new;
-                } else {
-                    // delete an existing range
-                    balances[_addr].length -= 1;
-                    r[i] = r[balances[_addr].length];
-                }
-                return;
-            }
+        uint48 i = rangeIndex[_old];
+        require(i < b.length && b.ranges[i] == _old);
+        if (_new > 0) {
+            // replace an existing range
+            b.ranges[i] = _new;
+            rangeIndex[_new] = i;
+        } else {
+            // delete an existing range
+            b.length -= 1;
+            rangeCount[_addr][_custodian] -= 1;
+            uint48 _last = b.ranges[b.length];
+            b.ranges[i] = _last;
+            rangeIndex[_last] = i;
         }
-        revert();
     }
 
     /**
@@ -36,8 +36,15 @@ contract IDVerifierOrg is IDVerifierBase {
         @notice Internal function to add new addresses
         @param _id member or authority ID
         @param _addr array of addresses
+        @param _authID ID of the calling authority
      */
-    function _addAddresses(bytes32 _id, address[] _addr) internal {
+    function _addAddresses(
+        bytes32 _id,
+        address[] _addr,
+        bytes32 _authID
+    )
+        internal
+    {
         for (uint256 i; i < _addr.length; i++) {
             Address storage _inv = idMap[_addr[i]];
             /** If address was previous assigned to this member ID
@@ -53,7 +60,7 @@ contract IDVerifierOrg is IDVerifierBase {
                 revert(); // dev: known address
             }
         }
-        emit RegisteredAddresses(_id, _addr, orgCode.getID(msg.sender));
+        emit RegisteredAddresses(_id, _addr, _authID);
     }
 
     /**
@@ -86,15 +93,61 @@ contract IDVerifierOrg is IDVerifierBase {
         require(memberData[_id].country == 0); // dev: member ID
         require(_country > 0); // dev: country 0
         _setMember(0x00, _id, _country, _region, _rating, _expires);
-        emit NewMember(
-            _id,
-            _country,
-            _region,
-            _rating,
-            _expires,
-            orgCode.getID(msg.sender)
-        );
-        _addAddresses(_id, _addr);
+        bytes32 _authID = orgCode.getID(msg.sender);
+        emit NewMember(_id, _country, _region, _rating, _expires, _authID);
+        _addAddresses(_id, _addr, _authID);
+        return true;
+    }
+
+    /**
+        @notice Add many members to this verifier
+        @dev
+            The multisig check is performed once for the entire call.
+            Additional addresses may be associated to each member with
+            registerAddresses or registerAddressesBatch.
+        @param _id Array of member IDs
+        @param _country Array of member country codes
+        @param _region Array of member region codes
+        @param _rating Array of member ratings
+        @param _expires Array of record expirations in epoch time
+        @param _addr Array of addresses, one to register to each member
+        @return bool success
+    */
+    function addMembers(
+        bytes32[] _id,
+        uint16[] _country,
+        bytes3[] _region,
+        uint8[] _rating,
+        uint40[] _expires,
+        address[] _addr
+    )
+        public
+        returns (bool)
+    {
+        require(_id.length == _country.length); // dev: length mismatch
+        require(_id.length == _region.length); // dev: length mismatch
+        require(_id.length == _rating.length); // dev: length mismatch
+        require(_id.length == _expires.length); // dev: length mismatch
+        require(_id.length == _addr.length); // dev: length mismatch
+        if (!_onlyAuthority()) return false;
+        bytes32 _authID = orgCode.getID(msg.sender);
+        address[] memory _single = new address[](1);
+        for (uint256 i; i < _id.length; i++) {
+            require(!orgCode.isAuthorityID(_id[i])); // dev: authority ID
+            require(memberData[_id[i]].country == 0); // dev: member ID
+            require(_country[i] > 0); // dev: country 0
+            _setMember(0x00, _id[i], _country[i], _region[i], _rating[i], _expires[i]);
+            emit NewMember(
+                _id[i],
+                _country[i],
+                _region[i],
+                _rating[i],
+                _expires[i],
+                _authID
+            );
+            _single[0] = _addr[i];
+            _addAddresses(_id[i], _single, _authID);
+        }
         return true;
     }
 
@@ -129,6 +182,37 @@ contract IDVerifierOrg is IDVerifierBase {
         return true;
     }
 
+    /**
+        @notice Update many members
+        @dev The multisig check is performed once for the entire call.
+        @param _id Array of member IDs
+        @param _region Array of member regions
+        @param _rating Array of member ratings
+        @param _expires Array of record expirations in epoch time
+        @return bool success
+     */
+    function updateMembers(
+        bytes32[] _id,
+        bytes3[] _region,
+        uint8[] _rating,
+        uint40[] _expires
+    )
+        public
+        returns (bool)
+    {
+        require(_id.length == _region.length); // dev: length mismatch
+        require(_id.length == _rating.length); // dev: length mismatch
+        require(_id.length == _expires.length); // dev: length mismatch
+        if (!_onlyAuthority()) return false;
+        bytes32 _authID = orgCode.getID(msg.sender);
+        for (uint256 i; i < _id.length; i++) {
+            require(memberData[_id[i]].country != 0); // dev: unknown ID
+            _setMember(0x00, _id[i], 0, _region[i], _rating[i], _expires[i]);
+            emit UpdatedMember(_id[i], _region[i], _rating[i], _expires[i], _authID);
+        }
+        return true;
+    }
+
     /**
         @notice Set or remove an member's restricted status
         @dev This modifies restriciton on all addresses attached to the ID
@@ -167,7 +251,32 @@ contract IDVerifierOrg is IDVerifierBase {
         returns (bool)
     {
         if (!_onlyAuthority()) return false;
-        _addAddresses(_id, _addr);
+        _addAddresses(_id, _addr, orgCode.getID(msg.sender));
+        return true;
+    }
+
+    /**
+        @notice Register addresses to many members
+        @dev The multisig check is performed once for the entire call.
+        @param _id Array of member IDs
+        @param _addr Array of addresses, one to register to each member ID
+        @return bool success
+     */
+    function registerAddressesBatch(
+        bytes32[] _id,
+        address[] _addr
+    )
+        public
+        returns (bool)
+    {
+        require(_id.length == _addr.length); // dev: length mismatch
+        if (!_onlyAuthority()) return false;
+        bytes32 _authID = orgCode.getID(msg.sender);
+        address[] memory _single = new address[](1);
+        for (uint256 i; i < _id.length; i++) {
+            _single[0] = _addr[i];
+            _addAddresses(_id[i], _single, _authID);
+        }
         return true;
     }
 
@@ -198,6 +307,18 @@ contract IDVerifierOrg is IDVerifierBase {
         return true;
     }
 
+    /**
+        @notice Set this verifier as the first queried by the org for addresses
+        @dev Every address must already be registered with this verifier
+        @param _addr Array of addresses
+        @return bool success
+     */
+    function setVerifierHints(address[] _addr) external returns (bool) {
+        if (!_onlyAuthority()) return false;
+        require(orgCode.setVerifierHints(address(this), _addr));
+        return true;
+    }
+
     /**
         @notice Check if an an member is permitted based on ID
         @param _id Member ID to query
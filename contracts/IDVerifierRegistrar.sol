@@ -10,14 +10,27 @@ contract IDVerifierRegistrar is IDVerifierBase {
 
     bytes32 ownerID;
 
+    /*
+        multiSigAuth is a bitfield of signer indexes that have approved
+        each call hash, keyed by signerEpoch. Signer indexes start at 1 and
+        are assigned in the order that addresses are added to the authority.
+        Once all 255 indexes have been assigned, indexes belonging to
+        restricted addresses (tracked in freeSigners) are reused. Reusing
+        an index increments signerEpoch, which discards pending approvals.
+     */
     struct Authority {
-        mapping (bytes32 => address[]) multiSigAuth;
+        mapping (uint32 => mapping (bytes32 => uint256)) multiSigAuth;
         uint256[4] countries;
+        uint256 freeSigners;
         uint32 multiSigThreshold;
         uint32 addressCount;
         bool restricted;
+        uint8 signerCount;
+        uint32 signatureNonce;
+        uint32 signerEpoch;
     }
 
+    bytes32 signedCallHash;
     mapping (bytes32 => Authority) authorityData;
 
     event NewAuthority(bytes32 indexed id);
@@ -50,6 +63,7 @@ contract IDVerifierRegistrar is IDVerifierBase {
         a.multiSigThreshold = _threshold;
         a.addressCount = uint32(_owners.length);
         _addAddresses(ownerID, _owners);
+        _setSignerIndexes(a, _owners);
     }
 
     /**
@@ -65,26 +79,165 @@ contract IDVerifierRegistrar is IDVerifierBase {
         }
         Authority storage a = authorityData[_id];
         bytes32 _callHash = keccak256(msg.data);
-        for (uint256 i; i < a.multiSigAuth[_callHash].length; i++) {
-            require(a.multiSigAuth[_callHash][i] != msg.sender); // dev: repeat caller
+        if (_callHash == signedCallHash) {
+            /* call is being made from executeWithSignatures */
+            delete signedCallHash;
+            emit MultiSigCallApproved(_id, msg.sig, _callHash, msg.sender);
+            return true;
         }
-        if (a.multiSigAuth[_callHash].length + 1 >= a.multiSigThreshold) {
-            delete a.multiSigAuth[_callHash];
+        uint256 _signed = a.multiSigAuth[a.signerEpoch][_callHash];
+        uint256 _bit = uint256(1) << idMap[msg.sender].signerIndex;
+        require(_signed & _bit == 0); // dev: repeat caller
+        uint256 _count = _countBits(_signed) + 1;
+        if (_count >= a.multiSigThreshold) {
+            if (_signed != 0) delete a.multiSigAuth[a.signerEpoch][_callHash];
             emit MultiSigCallApproved(_id, msg.sig, _callHash, msg.sender);
             return true;
         }
-        a.multiSigAuth[_callHash].push(msg.sender);
+        a.multiSigAuth[a.signerEpoch][_callHash] = _signed | _bit;
         emit MultiSigCall(
             _id,
             msg.sig,
             _callHash,
             msg.sender,
-            a.multiSigAuth[_callHash].length,
+            _count,
             a.multiSigThreshold
         );
         return false;
     }
 
+    /**
+        @notice Execute a multisig call using signatures gathered off-chain
+        @dev
+            The caller must be associated with an authority and is counted
+            toward the threshold. Each signature must be made by a different
+            unrestricted address of the same authority, over the hash given
+            by getSignedCallHash. Authority and country permissions are
+            checked in the usual way when the call is executed.
+        @param _data calldata of the call to execute
+        @param _v Array of signature v values
+        @param _r Array of signature r values
+        @param _s Array of signature s values
+        @return bool success
+     */
+    function executeWithSignatures(
+        bytes _data,
+        uint8[] _v,
+        bytes32[] _r,
+        bytes32[] _s
+    )
+        public
+        returns (bool)
+    {
+        require(signedCallHash == 0); // dev: reentrant call
+        require(_v.length == _r.length); // dev: length mismatch
+        require(_v.length == _s.length); // dev: length mismatch
+        bytes32 _authID = idMap[msg.sender].id;
+        Authority storage a = authorityData[_authID];
+        require(a.addressCount > 0); // dev: not authority
+        require(!idMap[msg.sender].restricted); // dev: restricted caller
+        bytes32 _hash = keccak256(abi.encodePacked(
+            "\x19Ethereum Signed Message:\n32",
+            getSignedCallHash(msg.sender, _data)
+        ));
+        uint256 _signed = uint256(1) << idMap[msg.sender].signerIndex;
+        for (uint256 i; i < _v.length; i++) {
+            address _signer = ecrecover(_hash, _v[i], _r[i], _s[i]);
+            require(idMap[_signer].id == _authID); // dev: wrong signer
+            require(!idMap[_signer].restricted); // dev: restricted signer
+            uint256 _bit = uint256(1) << idMap[_signer].signerIndex;
+            require(_signed & _bit == 0); // dev: repeat signer
+            _signed |= _bit;
+        }
+        require(_countBits(_signed) >= a.multiSigThreshold); // dev: below threshold
+        a.signatureNonce += 1;
+        signedCallHash = keccak256(_data);
+        require(address(this).delegatecall(_data)); // dev: call failed
+        if (signedCallHash != 0) delete signedCallHash;
+        return true;
+    }
+
+    /**
+        @notice Get the hash to sign for a call via executeWithSignatures
+        @dev
+            The hash includes a nonce that is incremented each time the
+            caller's authority executes a call with signatures
+        @param _caller Address that will submit the call
+        @param _data calldata of the call to execute
+        @return bytes32 hash
+     */
+    function getSignedCallHash(
+        address _caller,
+        bytes _data
+    )
+        public
+        view
+        returns (bytes32)
+    {
+        bytes32 _authID = idMap[_caller].id;
+        return keccak256(abi.encodePacked(
+            address(this),
+            _authID,
+            authorityData[_authID].signatureNonce,
+            _data
+        ));
+    }
+
+    /**
+        @notice Counts the number of set bits in a bitfield
+        @param _bits bitfield
+        @return number of set bits
+     */
+    function _countBits(uint256 _bits) internal pure returns (uint256 _count) {
+        while (_bits != 0) {
+            _bits &= _bits - 1;
+            _count++;
+        }
+        return _count;
+    }
+
+    /**
+        @notice Returns the position of the lowest set bit in a bitfield
+        @param _bits non-zero bitfield
+        @return bit position
+     */
+    function _lowestBit(uint256 _bits) internal pure returns (uint8 _idx) {
+        for (uint256 i = 128; i > 0; i >>= 1) {
+            if (_bits & ((uint256(1) << i) - 1) == 0) {
+                _bits >>= i;
+                _idx += uint8(i);
+            }
+        }
+        return _idx;
+    }
+
+    /**
+        @notice Internal function to assign signer indexes to authority addresses
+        @dev
+            Every address receives a new index, including re-enabled addresses
+            whose previous index may have been reused. New indexes are assigned
+            until all 255 have been used. After that the lowest index freed by
+            a restricted address is reused and the signer epoch is incremented,
+            so approvals given by the previous holder cannot count again.
+        @param a Authority storage pointer
+        @param _addr array of addresses
+     */
+    function _setSignerIndexes(Authority storage a, address[] memory _addr) internal {
+        for (uint256 i; i < _addr.length; i++) {
+            if (a.signerCount < 255) {
+                a.signerCount += 1;
+                idMap[_addr[i]].signerIndex = a.signerCount;
+                continue;
+            }
+            uint256 _free = a.freeSigners;
+            require(_free != 0); // dev: signer count
+            uint8 _idx = _lowestBit(_free);
+            a.freeSigners = _free ^ (uint256(1) << _idx);
+            a.signerEpoch += 1;
+            idMap[_addr[i]].signerIndex = _idx;
+        }
+    }
+
     /**
         @notice Verifyies authority permission based on country
         @param _country Country relating to the authority's action
@@ -100,6 +253,39 @@ contract IDVerifierRegistrar is IDVerifierBase {
         require(a.countries[_idx] >> (_country - _idx * 256) & uint256(1) == 1); // dev: country
     }
 
+    /**
+        @notice Verifies authority permission for each member's country
+        @dev
+            The check is only repeated when the country changes, so sorting
+            the array by country minimizes the number of checks
+        @param _country Array of country codes
+     */
+    function _authorityCheckBatch(uint16[] memory _country) internal view {
+        for (uint256 i; i < _country.length; i++) {
+            if (i > 0 && _country[i] == _country[i-1]) continue;
+            _authorityCheck(_country[i]);
+        }
+    }
+
+    /**
+        @notice Fetches the countries for an array of member IDs
+        @param _id Array of member IDs
+        @return array of country codes
+     */
+    function _getCountries(
+        bytes32[] memory _id
+    )
+        internal
+        view
+        returns (uint16[] memory _country)
+    {
+        _country = new uint16[](_id.length);
+        for (uint256 i; i < _id.length; i++) {
+            _country[i] = memberData[_id[i]].country;
+        }
+        return _country;
+    }
+
     /**
         @notice Internal function to add new addresses
         @param _id member or authority ID
@@ -189,6 +375,7 @@ contract IDVerifierRegistrar is IDVerifierBase {
         Authority storage a = authorityData[_authID];
         require(a.addressCount == 0); // dev: authority exists
         a.addressCount = _addAddresses(_authID, _addr);
+        _setSignerIndexes(a, _addr);
         require(a.addressCount >= _threshold); // dev: threshold too high
         a.multiSigThreshold = _threshold;
         _setCountries(a.countries, _countries, true);
@@ -325,6 +512,97 @@ contract IDVerifierRegistrar is IDVerifierBase {
         return true;
     }
 
+    /**
+        @notice Add many members to this verifier
+        @dev
+            Authority permission is checked once per run of members from
+            the same country, and the multisig check is performed once for
+            the entire call. Additional addresses may be associated to each
+            member with registerAddresses or registerAddressesBatch.
+        @param _id Array of member IDs
+        @param _country Array of member country codes
+        @param _region Array of member region codes
+        @param _rating Array of member ratings
+        @param _expires Array of record expirations in epoch time
+        @param _addr Array of addresses, one to register to each member
+        @return bool success
+    */
+    function addMembers(
+        bytes32[] _id,
+        uint16[] _country,
+        bytes3[] _region,
+        uint8[] _rating,
+        uint40[] _expires,
+        address[] _addr
+    )
+        public
+        returns (bool)
+    {
+        require(_id.length == _country.length); // dev: length mismatch
+        require(_id.length == _region.length); // dev: length mismatch
+        require(_id.length == _rating.length); // dev: length mismatch
+        require(_id.length == _expires.length); // dev: length mismatch
+        require(_id.length == _addr.length); // dev: length mismatch
+        _authorityCheckBatch(_country);
+        for (uint256 i; i < _id.length; i++) {
+            require(authorityData[_id[i]].addressCount == 0); // dev: authority ID
+            require(memberData[_id[i]].authority == 0); // dev: member ID
+        }
+        if (!_checkMultiSig(false)) return false;
+        bytes32 _authID = idMap[msg.sender].id;
+        address[] memory _single = new address[](1);
+        for (i = 0; i < _id.length; i++) {
+            /* catches an ID that is repeated within the batch */
+            require(memberData[_id[i]].authority == 0); // dev: member ID
+            _setMember(_authID, _id[i], _country[i], _region[i], _rating[i], _expires[i]);
+            emit NewMember(
+                _id[i],
+                _country[i],
+                _region[i],
+                _rating[i],
+                _expires[i],
+                _authID
+            );
+            _single[0] = _addr[i];
+            _addAddresses(_id[i], _single);
+        }
+        return true;
+    }
+
+    /**
+        @notice Update many members
+        @dev
+            Authority permission is checked once per run of members from
+            the same country, and the multisig check is performed once for
+            the entire call.
+        @param _id Array of member IDs
+        @param _region Array of member regions
+        @param _rating Array of member ratings
+        @param _expires Array of record expirations in epoch time
+        @return bool success
+     */
+    function updateMembers(
+        bytes32[] _id,
+        bytes3[] _region,
+        uint8[] _rating,
+        uint40[] _expires
+    )
+        public
+        returns (bool)
+    {
+        require(_id.length == _region.length); // dev: length mismatch
+        require(_id.length == _rating.length); // dev: length mismatch
+        require(_id.length == _expires.length); // dev: length mismatch
+        _authorityCheckBatch(_getCountries(_id));
+        if (!_checkMultiSig(false)) return false;
+        bytes32 _authID = idMap[msg.sender].id;
+        for (uint256 i; i < _id.length; i++) {
+            _setMember(_authID, _id[i], 0, _region[i], _rating[i], _expires[i]);
+            emit UpdatedMember(_id[i], _region[i], _rating[i], _expires[i], _authID);
+        }
+        return true;
+    }
+
     /**
         @notice Set or remove an member's restricted status
         @dev This modifies restriciton on all addresses attached to the ID
@@ -402,6 +680,7 @@ contract IDVerifierRegistrar is IDVerifierBase {
             require(idMap[msg.sender].id == ownerID); // dev: not owner
             require(!idMap[msg.sender].restricted); // dev: restricted address
             a.addressCount += _addAddresses(_id, _addr);
+            _setSignerIndexes(a, _addr);
         } else {
             _authorityCheck(memberData[_id].country);
             _addAddresses(_id, _addr);
@@ -409,6 +688,35 @@ contract IDVerifierRegistrar is IDVerifierBase {
         return true;
     }
 
+    /**
+        @notice Register addresses to many members
+        @dev
+            Authority permission is checked once per run of members from
+            the same country, and the multisig check is performed once for
+            the entire call. Addresses cannot be registered to authorities
+            with this method.
+        @param _id Array of member IDs
+        @param _addr Array of addresses, one to register to each member ID
+        @return bool success
+     */
+    function registerAddressesBatch(
+        bytes32[] _id,
+        address[] _addr
+    )
+        public
+        returns (bool)
+    {
+        require(_id.length == _addr.length); // dev: length mismatch
+        _authorityCheckBatch(_getCountries(_id));
+        if (!_checkMultiSig(false)) return false;
+        address[] memory _single = new address[](1);
+        for (uint256 i; i < _id.length; i++) {
+            _single[0] = _addr[i];
+            _addAddresses(_id[i], _single);
+        }
+        return true;
+    }
+
     /**
         @notice Flags addresses as restricted instead of removing them
         @dev
@@ -441,6 +749,10 @@ contract IDVerifierRegistrar is IDVerifierBase {
             require(idMap[_addr[i]].id == _id); // dev: wrong ID
             require(!idMap[_addr[i]].restricted); // dev: already restricted
             idMap[_addr[i]].restricted = true;
+            if (idMap[_addr[i]].signerIndex != 0) {
+                /* free the index of a restricted authority address */
+                authorityData[_id].freeSigners |= uint256(1) << idMap[_addr[i]].signerIndex;
+            }
         }
         emit RestrictedAddresses(_id, _addr, idMap[msg.sender].id);
         return true;
@@ -61,6 +61,8 @@ contract OrgCode is MultiSig {
     mapping (bytes32 => Account) accounts;
     mapping (address => Share) shares;
     mapping (string => bytes32) documentHashes;
+    /* address => index of verifier to query first when resolving the ID */
+    mapping (address => uint8) verifierHints;
 
     event CountryModified(
         uint16 indexed country,
@@ -72,6 +74,7 @@ contract OrgCode is MultiSig {
     event NewDocumentHash(string indexed document, bytes32 documentHash);
     event GovernanceSet(address indexed governance);
     event VerifierSet(address indexed verifier, bool restricted);
+    event VerifierHintsSet(address indexed verifier, address[] addr);
     event CustodianAdded(address indexed custodian);
     event ShareAdded(address indexed share);
     event EntityRestriction(bytes32 indexed id, bool restricted);
@@ -310,6 +313,42 @@ contract OrgCode is MultiSig {
         revert(); // dev: unknown verifier
     }
 
+    /**
+        @notice Set the verifier to query first for unknown addresses
+        @dev
+            Callable by the verifier itself, or by the org via multisig. A
+            hint only decides the order verifiers are queried in, an ID is
+            still only accepted if the verifier returns it. A verifier may
+            only set hints for addresses that it returns an ID for.
+        @param _verifier address of verifier
+        @param _addr array of member addresses
+        @return bool success
+     */
+    function setVerifierHints(
+        IIDVerifier _verifier,
+        address[] _addr
+    )
+        external
+        returns (bool)
+    {
+        bool _self = msg.sender == address(_verifier);
+        if (!_self) {
+            if (!_checkMultiSig()) return false;
+        }
+        for (uint256 i = 1; i < verifiers.length; i++) {
+            if (verifiers[i].addr != _verifier) continue;
+            for (uint256 x; x < _addr.length; x++) {
+                if (_self) {
+                    require(_verifier.getID(_addr[x]) != 0); // dev: unknown address
+                }
+                verifierHints[_addr[x]] = uint8(i);
+            }
+            emit VerifierHintsSet(_verifier, _addr);
+            return true;
+        }
+        revert(); // dev: unknown verifier
+    }
+
     /**
         @notice Set all information about a country
         @param _country Country to modify
@@ -470,16 +509,7 @@ contract OrgCode is MultiSig {
         _authID = _getID(_auth);
         _id[SENDER] = _getID(_from);
         _id[RECEIVER] = _getID(_to);
-
-        if (_authID == ownerID && idMap[_auth].id != ownerID) {
-            /* This enforces sub-authority permissioning around transfers */
-            Authority storage a = authorityData[idMap[_auth].id];
-            require(
-                a.approvedUntil >= now &&
-                a.signatures[bytes4(_authID == _id[SENDER] ? 0xa9059cbb : 0x23b872dd)],
-                "Authority not permitted"
-            );
-        }
+        _checkAuthority(_auth, _authID, _id[SENDER]);
 
         address _addr = (_authID == _id[SENDER] ? _auth : _from);
         bool[2] memory _permitted;
@@ -500,6 +530,31 @@ contract OrgCode is MultiSig {
         return (_authID, _id, _rating, _country);
     }
 
+    /**
+        @notice internal check of sub-authority transfer permissions
+        @param _auth Caller address
+        @param _authID ID of caller
+        @param _id ID of sender
+     */
+    function _checkAuthority(
+        address _auth,
+        bytes32 _authID,
+        bytes32 _id
+    )
+        internal
+        view
+    {
+        if (_authID == ownerID && idMap[_auth].id != ownerID) {
+            /* This enforces sub-authority permissioning around transfers */
+            Authority storage a = authorityData[idMap[_auth].id];
+            require(
+                a.approvedUntil >= now &&
+                a.signatures[bytes4(_authID == _id ? 0xa9059cbb : 0x23b872dd)],
+                "Authority not permitted"
+            );
+        }
+    }
+
     /**
         @notice internal member ID fetch
         @param _addr Member address
@@ -519,27 +574,25 @@ contract OrgCode is MultiSig {
         ) {
             return _id;
         }
+        uint256 _hint = verifierHints[_addr];
+        if (_hint != 0 && verifiers[_hint].restricted) _hint = 0;
         if (_id == 0) {
+            if (_hint != 0) {
+                _id = _getIDFromVerifier(_addr, _hint);
+                if (_id != 0) return _id;
+            }
             for (uint256 i = 1; i < verifiers.length; i++) {
-                if (!verifiers[i].restricted) {
-                    _id = verifiers[i].addr.getID(_addr);
-                    /* prevent member / authority ID collisions */
-                    if (_id != 0 && authorityData[_id].addressCount == 0) {
-                        idMap[_addr].id = _id;
-                        if (!accounts[_id].set) {
-                            accounts[_id].set = true;
-                            accounts[_id].regKey = uint8(i);
-                        } else if (accounts[_id].regKey != i) {
-                            continue;
-                        }
-                        accounts[_id].regKey = uint8(i);
-                        return _id;
-                    }
-                }
+                if (i == _hint || verifiers[i].restricted) continue;
+                _id = _getIDFromVerifier(_addr, i);
+                if (_id != 0) return _id;
             }
         } else {
+            if (_hint != 0 && _id == verifiers[_hint].addr.getID(_addr)) {
+                accounts[_id].regKey = uint8(_hint);
+                return _id;
+            }
             for (i = 1; i < verifiers.length; i++) {
-                if (verifiers[i].restricted) continue;
+                if (i == _hint || verifiers[i].restricted) continue;
                 if (_id != verifiers[i].addr.getID(_addr)) continue;
                 accounts[_id].regKey = uint8(i);
                 return _id;
@@ -549,6 +602,32 @@ contract OrgCode is MultiSig {
         revert("Address not registered");
     }
 
+    /**
+        @notice Internal - fetch an unknown member ID from a single verifier
+        @param _addr Member address
+        @param _key Index of verifier to query
+        @return bytes32 member ID, or 0 if not found
+     */
+    function _getIDFromVerifier(
+        address _addr,
+        uint256 _key
+    )
+        internal
+        returns (bytes32 _id)
+    {
+        _id = verifiers[_key].addr.getID(_addr);
+        /* prevent member / authority ID collisions */
+        if (_id == 0 || authorityData[_id].addressCount > 0) return 0;
+        idMap[_addr].id = _id;
+        if (!accounts[_id].set) {
+            accounts[_id].set = true;
+            accounts[_id].regKey = uint8(_key);
+        } else if (accounts[_id].regKey != _key) {
+            return 0;
+        }
+        return _id;
+    }
+
     /**
         @notice Internal function for fetching member data from verifiers
         @dev Either _addr or _id may be given as an empty array
@@ -605,6 +684,35 @@ contract OrgCode is MultiSig {
         return (_permitted, _rating, _country);
     }
 
+    /**
+        @notice Internal function for fetching data on a single member
+        @param _addr Member address
+        @param _key Verifier index
+        @return permission, rating, and country of member
+     */
+    function _getMember(
+        address _addr,
+        uint8 _key
+    )
+        internal
+        view
+        returns (
+            bool _permitted,
+            uint8 _rating,
+            uint16 _country
+        )
+    {
+        /* If key == 0 the address belongs to the org or a custodian. */
+        if (_key == 0) return (true, 0, 0);
+        (
+            ,
+            _permitted,
+            _rating,
+            _country
+        ) = verifiers[_key].addr.getMember(_addr);
+        return (_permitted, _rating, _country);
+    }
+
     /**
         @notice internal check if transfer is permitted
         @param _authID id hash of caller
@@ -735,7 +843,220 @@ contract OrgCode is MultiSig {
         )
     {
         (_authID, _id, _rating, _country) = checkTransfer(_auth, _from, _to, _zero[0]);
+        _updateCounts(_id, _rating, _country, _zero);
+        return (_authID, _id, _rating, _country);
+    }
 
+    /**
+        @notice Transfer shares from one sender to many receivers
+        @dev
+            only callable through an OrgShare contract. The caller and sender
+            are resolved once, each receiver is then checked and counted in
+            order, the same as a call to transferShares.
+        @param _auth Caller address
+        @param _from Sender address
+        @param _to Array of receiver addresses
+        @param _zero Array of zero balance booleans, 4 per receiver in the
+                     same order as transferShares
+        @return authority ID, IDs/ratings/countries of the sender followed
+                by each receiver
+     */
+    function transferSharesMany(
+        address _auth,
+        address _from,
+        address[] _to,
+        bool[] _zero
+    )
+        public
+        returns (
+            bytes32 _authID,
+            bytes32[] _id,
+            uint8[] _rating,
+            uint16[] _country
+        )
+    {
+        require(_zero.length == _to.length * 4); // dev: length mismatch
+        _id = new bytes32[](_to.length + 1);
+        _rating = new uint8[](_to.length + 1);
+        _country = new uint16[](_to.length + 1);
+        _authID = _getID(_auth);
+        _id[SENDER] = _getID(_from);
+        _checkAuthority(_auth, _authID, _id[SENDER]);
+        bool[2] memory _permitted;
+        address _addr = (_authID == _id[SENDER] ? _auth : _from);
+        (
+            _permitted[SENDER],
+            _rating[SENDER],
+            _country[SENDER]
+        ) = _getMember(_addr, accounts[idMap[_addr].id].regKey);
+        for (uint256 i = 1; i < _id.length; i++) {
+            _id[i] = _getID(_to[i - 1]);
+            (
+                _permitted[RECEIVER],
+                _rating[i],
+                _country[i]
+            ) = _getMember(_to[i - 1], accounts[_id[i]].regKey);
+            _transferSharesMany(_authID, _permitted, _id, _rating, _country, _zero, i);
+        }
+        return (_authID, _id, _rating, _country);
+    }
+
+    /**
+        @notice internal transfer check and count update for a single receiver
+        @param _authID ID of caller
+        @param _permitted array of permission bools from verifier
+        @param _id array of sender and receiver IDs
+        @param _rating array of sender and receiver ratings
+        @param _country array of sender and receiver countries
+        @param _zero Array of zero balance booleans
+        @param _idx Index of receiver
+     */
+    function _transferSharesMany(
+        bytes32 _authID,
+        bool[2] memory _permitted,
+        bytes32[] memory _id,
+        uint8[] memory _rating,
+        uint16[] memory _country,
+        bool[] memory _zero,
+        uint256 _idx
+    )
+        internal
+    {
+        bytes32[2] memory _pairID = [_id[SENDER], _id[_idx]];
+        uint8[2] memory _pairRating = [_rating[SENDER], _rating[_idx]];
+        uint16[2] memory _pairCountry = [_country[SENDER], _country[_idx]];
+        bool[4] memory _pairZero;
+        for (uint256 i; i < 4; i++) {
+            _pairZero[i] = _zero[(_idx - 1) * 4 + i];
+        }
+        if (accounts[_authID].custodian != 0) {
+            require(accounts[_pairID[RECEIVER]].custodian == 0, "Custodian to Custodian");
+        }
+        /* must be allowed to underflow in case of org zero balance */
+        uint32 _count = accounts[_pairID[SENDER]].count;
+        if (_pairZero[0]) _count -= 1;
+
+        _checkTransfer(_authID, _pairID, _permitted, _pairRating, _pairCountry, _count);
+        _updateCounts(_pairID, _pairRating, _pairCountry, _pairZero);
+    }
+
+    /**
+        @notice Transfer shares between many members within a custodian
+        @dev
+            only callable through an OrgShare contract. Each member is a net
+            position that only sends or only receives, checked and counted
+            once with the custodian as the counterparty. Members whose
+            transfers were netted away before this call are never checked.
+        @param _auth Custodian address
+        @param _addr Array of member addresses, senders first
+        @param _senders Number of senders in _addr
+        @param _zero Array of zero balance booleans, one per member
+            Is sender custodial balance now zero?
+            Was receiver custodial balance zero?
+        @return custodian ID, IDs/ratings/countries of each member
+     */
+    function transferSharesBatch(
+        address _auth,
+        address[] _addr,
+        uint256 _senders,
+        bool[] _zero
+    )
+        public
+        returns (
+            bytes32 _authID,
+            bytes32[] _id,
+            uint8[] _rating,
+            uint16[] _country
+        )
+    {
+        require(_zero.length == _addr.length); // dev: length mismatch
+        require(_senders <= _addr.length); // dev: length mismatch
+        _id = new bytes32[](_addr.length);
+        _rating = new uint8[](_addr.length);
+        _country = new uint16[](_addr.length);
+        _authID = _getID(_auth);
+        require(accounts[_authID].custodian != 0); // dev: not custodian
+        bool _permitted;
+        /* senders are counted first so their slots are free for receivers */
+        for (uint256 i; i < _addr.length; i++) {
+            _id[i] = _getID(_addr[i]);
+            (
+                _permitted,
+                _rating[i],
+                _country[i]
+            ) = _getMember(_addr[i], accounts[_id[i]].regKey);
+            _transferSharesBatch(
+                _authID,
+                _permitted,
+                _id[i],
+                _rating[i],
+                _country[i],
+                _zero[i],
+                i < _senders
+            );
+        }
+        return (_authID, _id, _rating, _country);
+    }
+
+    /**
+        @notice internal transfer check and count update for a net position
+        @param _authID ID of custodian
+        @param _permitted permission bool from verifier
+        @param _id member ID
+        @param _rating member rating
+        @param _country member country
+        @param _zero zero balance boolean
+        @param _send is the member a sender?
+     */
+    function _transferSharesBatch(
+        bytes32 _authID,
+        bool _permitted,
+        bytes32 _id,
+        uint8 _rating,
+        uint16 _country,
+        bool _zero,
+        bool _send
+    )
+        internal
+    {
+        /* the custodian is the counterparty of each position */
+        bytes32[2] memory _pairID = [_authID, _authID];
+        bool[2] memory _pairPermitted = [true, true];
+        uint8[2] memory _pairRating;
+        uint16[2] memory _pairCountry;
+        bool[4] memory _pairZero;
+        uint256 x = (_send ? SENDER : RECEIVER);
+        _pairID[x] = _id;
+        _pairPermitted[x] = _permitted;
+        _pairRating[x] = _rating;
+        _pairCountry[x] = _country;
+        _pairZero[x] = _zero;
+        if (!_send) {
+            require(accounts[_id].custodian == 0, "Custodian to Custodian");
+        }
+        /*
+            the sender count is only used when both members have a rating,
+            one side here is always the custodian
+        */
+        _checkTransfer(_authID, _pairID, _pairPermitted, _pairRating, _pairCountry, 0);
+        _updateCounts(_pairID, _pairRating, _pairCountry, _pairZero);
+    }
+
+    /**
+        @notice internal member count update after a transfer
+        @param _id array of sender and receiver IDs
+        @param _rating array of sender and receiver ratings
+        @param _country array of sender and receiver countries
+        @param _zero Array of zero balance booleans
+     */
+    function _updateCounts(
+        bytes32[2] _id,
+        uint8[2] _rating,
+        uint16[2] _country,
+        bool[4] _zero
+    )
+        internal
+    {
         /* If no transfer of ownership, return true immediately */
         if (_id[SENDER] == _id[RECEIVER]) return;
 
@@ -781,7 +1102,6 @@ contract OrgCode is MultiSig {
                 }
             }
         }
-        return (_authID, _id, _rating, _country);
     }
 
     /**
@@ -8,9 +8,12 @@ pragma solidity 0.4.25;
 contract IDVerifierBaseABC {
 
     function addMember(bytes32, uint16, bytes3, uint8, uint40, address[]) external returns (bool);
+    function addMembers(bytes32[], uint16[], bytes3[], uint8[], uint40[], address[]) public returns (bool);
     function updateMember(bytes32, bytes3, uint8, uint40) external returns (bool);
+    function updateMembers(bytes32[], bytes3[], uint8[], uint40[]) public returns (bool);
     function setMemberRestriction(bytes32, bool) external returns (bool);
     function registerAddresses(bytes32, address[]) external returns (bool);
+    function registerAddressesBatch(bytes32[], address[]) public returns (bool);
     function restrictAddresses(bytes32, address[]) external returns (bool);
     function isPermittedID(bytes32) public view returns (bool);
 
@@ -22,9 +25,11 @@ contract IDVerifierBaseABC {
 */
 contract IDVerifierBase is IDVerifierBaseABC {
 
+    /* signerIndex is only assigned for authority addresses */
     struct Address {
         bytes32 id;
         bool restricted;
+        uint8 signerIndex;
     }
 
     struct Member {
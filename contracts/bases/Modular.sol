@@ -12,6 +12,8 @@ contract Modular {
     struct Module {
         bool active;
         bool set;
+        /* signatures of all permitted hooks */
+        bytes4[] hookSigs;
         /* hooks, permissions */
         mapping(bytes4 => Hook) hooks;
         mapping(bytes4 => bool) permissions;
@@ -22,10 +24,20 @@ contract Modular {
         bool permitted;
         bool active;
         bool always;
+        /* 1-based position in hookSubscribers, 0 if not subscribed */
+        uint256 index;
     }
 
     address[] activeModules;
     mapping (address => Module) moduleData;
+    /* hook signature => active modules with that hook active */
+    mapping (bytes4 => address[]) hookSubscribers;
+    /* hook signature => number of subscribers with always set */
+    mapping (bytes4 => uint256) alwaysSubscribers;
+    /* hook signature => tag first byte => number of modules with tags set */
+    mapping (bytes4 => uint256[256]) tagListeners;
+    /* hook signature => bitfield of tag first bytes with at least one listener */
+    mapping (bytes4 => uint256) tagSummary;
 
     event ModuleAttached(address module, bytes4[] hooks, bytes4[] permissions);
     event ModuleHookSet(address module, bytes4 hook, bool active, bool always);
@@ -61,6 +73,7 @@ contract Modular {
                 uint256 _hookBools
             ) = b.getPermissions();
             for (uint256 i; i < _hooks.length; i++) {
+                m.hookSigs.push(_hooks[i]);
                 m.hooks[_hooks[i]].permitted = true;
                 m.hooks[_hooks[i]].active = _getBool(_hookBools, i);
                 m.hooks[_hooks[i]].always = _getBool(_hookBools, i+128);
@@ -76,6 +89,11 @@ contract Modular {
             }
             m.set = true;
         }
+        for (i = 0; i < m.hookSigs.length; i++) {
+            if (m.hooks[m.hookSigs[i]].active) {
+                _subscribeHook(_module, m.hookSigs[i]);
+            }
+        }
         emit ModuleAttached(_module, _hooks, _permissions);
     }
 
@@ -89,13 +107,17 @@ contract Modular {
             moduleData[_module].active &&
             activeModules.length > 0
         );
-        moduleData[_module].active = false;
+        Module storage m = moduleData[_module];
+        m.active = false;
+        for (uint256 i; i < m.hookSigs.length; i++) {
+            _unsubscribeHook(_module, m.hookSigs[i]);
+        }
         emit ModuleDetached(_module);
         if (activeModules[activeModules.length - 1] == _module) {
             activeModules.length--;
             return;
         }
-        for (uint256 i; i < activeModules.length - 1; i++) {
+        for (i = 0; i < activeModules.length - 1; i++) {
             if (activeModules[i] == _module) {
                 activeModules[i] = activeModules[activeModules.length - 1];
                 activeModules.length--;
@@ -105,6 +127,82 @@ contract Modular {
         revert();
     }
 
+    /**
+        @notice Internal function to add a module to a hook subscriber list
+        @param _module Address of the module
+        @param _sig bytes4 signature of hook point
+     */
+    function _subscribeHook(address _module, bytes4 _sig) internal {
+        Hook storage h = moduleData[_module].hooks[_sig];
+        if (h.index != 0) return;
+        h.index = hookSubscribers[_sig].push(_module);
+        if (h.always) alwaysSubscribers[_sig] += 1;
+    }
+
+    /**
+        @notice Internal function to remove a module from a hook subscriber list
+        @param _module Address of the module
+        @param _sig bytes4 signature of hook point
+     */
+    function _unsubscribeHook(address _module, bytes4 _sig) internal {
+        Hook storage h = moduleData[_module].hooks[_sig];
+        if (h.index == 0) return;
+        address[] storage _subs = hookSubscribers[_sig];
+        address _last = _subs[_subs.length - 1];
+        _subs[h.index - 1] = _last;
+        moduleData[_last].hooks[_sig].index = h.index;
+        _subs.length--;
+        h.index = 0;
+        if (h.always) alwaysSubscribers[_sig] -= 1;
+    }
+
+    /**
+        @notice Internal function to store tag booleans for a hook point
+        @dev Also maintains the tag summary bitfield for the hook point
+        @param h Hook storage pointer
+        @param _sig bytes4 signature of hook point
+        @param _tagBase first byte of tags
+        @param _packedBool new tag bitfield
+     */
+    function _setTagBools(
+        Hook storage h,
+        bytes4 _sig,
+        uint256 _tagBase,
+        uint256 _packedBool
+    )
+        internal
+    {
+        uint256 _old = h.tagBools[_tagBase];
+        if (_old == _packedBool) return;
+        h.tagBools[_tagBase] = _packedBool;
+        if (_old == 0) {
+            if (tagListeners[_sig][_tagBase] == 0) {
+                tagSummary[_sig] = tagSummary[_sig] | uint256(1) << _tagBase;
+            }
+            tagListeners[_sig][_tagBase] += 1;
+        } else if (_packedBool == 0) {
+            tagListeners[_sig][_tagBase] -= 1;
+            if (tagListeners[_sig][_tagBase] == 0) {
+                tagSummary[_sig] = tagSummary[_sig] & ~(uint256(1) << _tagBase);
+            }
+        }
+    }
+
+    /**
+        @notice Check if any module may be called for a hook point and tag
+        @dev
+            Tag listeners are counted whether or not the module is currently
+            active, so a true result does not guarantee a module is called
+        @param _sig bytes4 signature of hook point
+        @param _tag bytes2 tag of related share range
+        @return bool
+     */
+    function _isHookListening(bytes4 _sig, bytes2 _tag) internal view returns (bool) {
+        if (alwaysSubscribers[_sig] > 0) return true;
+        if (_tag == 0x00) return false;
+        return _getBool(tagSummary[_sig], uint256(_tag[0]));
+    }
+
     /**
         @notice Internal function to iterate and call modules
         @param _sig bytes4 signature to call module with
@@ -120,11 +218,12 @@ contract Modular {
         internal
         returns (bool)
     {
-        for (uint256 i; i < activeModules.length; i++) {
-            Hook storage h = moduleData[activeModules[i]].hooks[_sig];
-            if (!h.active) continue;
+        if (!_isHookListening(_sig, _tag)) return true;
+        address[] storage _subs = hookSubscribers[_sig];
+        for (uint256 i; i < _subs.length; i++) {
+            Hook storage h = moduleData[_subs[i]].hooks[_sig];
             if (h.always) {
-                if (!activeModules[i].call(_sig, _data)) return false;
+                if (!_subs[i].call(_sig, _data)) return false;
                 continue;
             }
             if (_tag == 0x00) continue;
@@ -136,7 +235,7 @@ contract Modular {
                 /** hook for entire tag is true */
                 _getBool(_packedBool, uint256(_tag[1]))
             ) {
-                if (!activeModules[i].call(_sig, _data)) return false;
+                if (!_subs[i].call(_sig, _data)) return false;
                 continue;
             }
         }
@@ -162,8 +261,10 @@ contract Modular {
         require (isActiveModule(msg.sender));
         Hook storage h = moduleData[msg.sender].hooks[_sig];
         require (h.permitted);
+        _unsubscribeHook(msg.sender, _sig);
         h.active = _active;
         h.always = _always;
+        if (_active) _subscribeHook(msg.sender, _sig);
         return true;
     }
 
@@ -196,7 +297,7 @@ contract Modular {
                 _packedBool = _packedBool & ~(uint256(1) << uint256(_tags[i]));
             }
         }
-        h.tagBools[uint256(_tagBase)] = _packedBool;
+        _setTagBools(h, _sig, uint256(_tagBase), _packedBool);
         return true;
     }
 
@@ -218,7 +319,7 @@ contract Modular {
         Hook storage h = moduleData[msg.sender].hooks[_sig];
         require (h.permitted);
         for (uint256 i; i < _tagBase.length; i++) {
-            h.tagBools[uint256(_tagBase[i])] = 0;
+            _setTagBools(h, _sig, uint256(_tagBase[i]), 0);
         }
         return true;
     }
@@ -13,17 +13,31 @@ contract MultiSig {
     struct Address {
         bytes32 id;
         bool restricted;
+        uint8 signerIndex;
     }
 
+    /*
+        multiSigAuth is a bitfield of signer indexes that have approved
+        each call hash, keyed by signerEpoch. Signer indexes start at 1 and
+        are assigned in the order that addresses are added to the authority.
+        Once all 255 indexes have been assigned, indexes belonging to
+        restricted addresses (tracked in freeSigners) are reused. Reusing
+        an index increments signerEpoch, which discards pending approvals.
+     */
     struct Authority {
         mapping (bytes4 => bool) signatures;
-        mapping (bytes32 => address[]) multiSigAuth;
+        mapping (uint32 => mapping (bytes32 => uint256)) multiSigAuth;
+        uint256 freeSigners;
         uint32 multiSigThreshold;
         uint32 addressCount;
         uint32 approvedUntil;
+        uint8 signerCount;
+        uint32 signatureNonce;
+        uint32 signerEpoch;
     }
 
     bytes32 public ownerID;
+    bytes32 signedCallHash;
     mapping (address => Address) idMap;
     mapping (bytes32 => Authority) authorityData;
 
@@ -108,21 +122,21 @@ contract MultiSig {
         internal
         returns (uint32 _count)
     {
+        Authority storage a = authorityData[_id];
         for (uint256 i; i < _addr.length; i++) {
             if (idMap[_addr[i]].id == _id && idMap[_addr[i]].restricted) {
+                /* the previous index may have been reused, assign a new one */
                 idMap[_addr[i]].restricted = false;
+                idMap[_addr[i]].signerIndex = _getSignerIndex(a);
             } else if (idMap[_addr[i]].id == 0) {
                 idMap[_addr[i]].id = _id;
+                idMap[_addr[i]].signerIndex = _getSignerIndex(a);
             } else {
                 revert(); // dev: known address
             }
         }
         _count = uint32(_addr.length);
-        emit NewAuthorityAddresses(
-            _id,
-            _addr,
-            authorityData[_id].addressCount.add(_count)
-        );
+        emit NewAuthorityAddresses(_id, _addr, a.addressCount.add(_count));
         return uint32(_count);
     }
 
@@ -193,27 +207,162 @@ contract MultiSig {
             require(authorityData[_authID].signatures[_sig]); // dev: not permitted
             require(authorityData[_authID].approvedUntil >= now); // dev: expired
         }
-        Authority storage a = authorityData[_authID];
-        for (uint256 i; i < a.multiSigAuth[_callHash].length; i++) {
-            require(a.multiSigAuth[_callHash][i] != _sender); // dev: repeat caller
+        if (_callHash == signedCallHash) {
+            /* call is being made from executeWithSignatures */
+            delete signedCallHash;
+            emit MultiSigCallApproved(_authID, _sig, _callHash, _sender);
+            return true;
         }
-        if (a.multiSigAuth[_callHash].length + 1 >= a.multiSigThreshold) {
-            delete a.multiSigAuth[_callHash];
+        Authority storage a = authorityData[_authID];
+        uint256 _signed = a.multiSigAuth[a.signerEpoch][_callHash];
+        uint256 _bit = uint256(1) << idMap[_sender].signerIndex;
+        require(_signed & _bit == 0); // dev: repeat caller
+        uint256 _count = _countBits(_signed) + 1;
+        if (_count >= a.multiSigThreshold) {
+            if (_signed != 0) delete a.multiSigAuth[a.signerEpoch][_callHash];
             emit MultiSigCallApproved(_authID, _sig, _callHash, _sender);
             return true;
         }
-        a.multiSigAuth[_callHash].push(_sender);
+        a.multiSigAuth[a.signerEpoch][_callHash] = _signed | _bit;
         emit MultiSigCall(
             _authID,
             _sig,
             _callHash,
             _sender,
-            a.multiSigAuth[_callHash].length,
+            _count,
             a.multiSigThreshold
         );
         return false;
     }
 
+    /**
+        @notice Execute a multisig call using signatures gathered off-chain
+        @dev
+            The caller must be associated with an authority and is counted
+            toward the threshold. Each signature must be made by a different
+            unrestricted address of the same authority, over the hash given
+            by getSignedCallHash. Permission to call the method is checked
+            in the usual way when the call is executed.
+        @param _data calldata of the call to execute
+        @param _v Array of signature v values
+        @param _r Array of signature r values
+        @param _s Array of signature s values
+        @return bool success
+     */
+    function executeWithSignatures(
+        bytes _data,
+        uint8[] _v,
+        bytes32[] _r,
+        bytes32[] _s
+    )
+        public
+        returns (bool)
+    {
+        require(signedCallHash == 0); // dev: reentrant call
+        require(_v.length == _r.length); // dev: length mismatch
+        require(_v.length == _s.length); // dev: length mismatch
+        bytes32 _authID = idMap[msg.sender].id;
+        Authority storage a = authorityData[_authID];
+        require(a.addressCount > 0); // dev: not authority
+        require(!idMap[msg.sender].restricted); // dev: restricted caller
+        bytes32 _hash = keccak256(abi.encodePacked(
+            "\x19Ethereum Signed Message:\n32",
+            getSignedCallHash(msg.sender, _data)
+        ));
+        uint256 _signed = uint256(1) << idMap[msg.sender].signerIndex;
+        for (uint256 i; i < _v.length; i++) {
+            address _signer = ecrecover(_hash, _v[i], _r[i], _s[i]);
+            require(idMap[_signer].id == _authID); // dev: wrong signer
+            require(!idMap[_signer].restricted); // dev: restricted signer
+            uint256 _bit = uint256(1) << idMap[_signer].signerIndex;
+            require(_signed & _bit == 0); // dev: repeat signer
+            _signed |= _bit;
+        }
+        require(_countBits(_signed) >= a.multiSigThreshold); // dev: below threshold
+        a.signatureNonce += 1;
+        signedCallHash = keccak256(_data);
+        require(address(this).delegatecall(_data)); // dev: call failed
+        if (signedCallHash != 0) delete signedCallHash;
+        return true;
+    }
+
+    /**
+        @notice Get the hash to sign for a call via executeWithSignatures
+        @dev
+            The hash includes a nonce that is incremented each time the
+            caller's authority executes a call with signatures
+        @param _caller Address that will submit the call
+        @param _data calldata of the call to execute
+        @return bytes32 hash
+     */
+    function getSignedCallHash(
+        address _caller,
+        bytes _data
+    )
+        public
+        view
+        returns (bytes32)
+    {
+        bytes32 _authID = idMap[_caller].id;
+        return keccak256(abi.encodePacked(
+            address(this),
+            _authID,
+            authorityData[_authID].signatureNonce,
+            _data
+        ));
+    }
+
+    /**
+        @notice Counts the number of set bits in a bitfield
+        @param _bits bitfield
+        @return number of set bits
+     */
+    function _countBits(uint256 _bits) internal pure returns (uint256 _count) {
+        while (_bits != 0) {
+            _bits &= _bits - 1;
+            _count++;
+        }
+        return _count;
+    }
+
+    /**
+        @notice Returns the position of the lowest set bit in a bitfield
+        @param _bits non-zero bitfield
+        @return bit position
+     */
+    function _lowestBit(uint256 _bits) internal pure returns (uint8 _idx) {
+        for (uint256 i = 128; i > 0; i >>= 1) {
+            if (_bits & ((uint256(1) << i) - 1) == 0) {
+                _bits >>= i;
+                _idx += uint8(i);
+            }
+        }
+        return _idx;
+    }
+
+    /**
+        @notice Internal function to assign a signer index
+        @dev
+            New indexes are assigned until all 255 have been used. After
+            that the lowest index freed by a restricted address is reused
+            and the signer epoch is incremented, so approvals given by the
+            previous holder of the index cannot count toward a new call.
+        @param a Authority storage pointer
+        @return signer index
+     */
+    function _getSignerIndex(Authority storage a) internal returns (uint8) {
+        if (a.signerCount < 255) {
+            a.signerCount += 1;
+            return a.signerCount;
+        }
+        uint256 _free = a.freeSigners;
+        require(_free != 0); // dev: signer count
+        uint8 _idx = _lowestBit(_free);
+        a.freeSigners = _free ^ (uint256(1) << _idx);
+        a.signerEpoch += 1;
+        return _idx;
+    }
+
     /**
         @notice External view to fetch an authority ID from an address
         @param _addr authority address
@@ -420,7 +569,9 @@ contract MultiSig {
 
     /**
         @notice Remove addresses from an authority
-        @dev Once an address has been removed it may never be re-used
+        @dev
+            Once an address has been removed it may only be re-added to the
+            same authority. Its signer index is freed for reuse.
         @param _authID Authority ID
         @param _addr Array of addresses
         @return bool success
@@ -439,6 +590,7 @@ contract MultiSig {
             require(idMap[_addr[i]].id == _authID); // dev: wrong ID
             require(!idMap[_addr[i]].restricted); // dev: already restricted
             idMap[_addr[i]].restricted = true;
+            a.freeSigners |= uint256(1) << idMap[_addr[i]].signerIndex;
         }
         a.addressCount = a.addressCount.sub(uint32(_addr.length));
         require (a.addressCount >= a.multiSigThreshold); // dev: count below threshold
@@ -140,6 +140,104 @@ contract OrgShareBase is OrgShareBaseABC, Modular {
         return true;
     }
 
+    /**
+        @notice Check if many transfers are permitted, without reverting
+        @dev
+            Each transfer is checked independently with a call to
+            checkTransfer. Failed checks return a status code mapped from the
+            revert string, see the code table in the documentation. Reverts
+            without a known string (e.g. from a module) return 255.
+        @param _from Array of sender addresses
+        @param _to Array of recipient addresses
+        @param _value Array of amounts being transferred
+        @return array of status codes, 0 if the transfer is permitted
+     */
+    function checkTransfers(
+        address[] _from,
+        address[] _to,
+        uint256[] _value
+    )
+        public
+        view
+        returns (uint8[] _status)
+    {
+        require(_from.length == _to.length); // dev: length mismatch
+        require(_from.length == _value.length); // dev: length mismatch
+        _status = new uint8[](_from.length);
+        for (uint256 i; i < _from.length; i++) {
+            /* bytes4 signature for checkTransfer() */
+            if (address(this).call(abi.encodeWithSelector(
+                bytes4(0xcc1dd94f),
+                _from[i],
+                _to[i],
+                _value[i]
+            ))) {
+                continue;
+            }
+            _status[i] = _getStatusCode(_getRevertHash());
+        }
+        return _status;
+    }
+
+    /**
+        @notice Internal - hash of the revert string from the last call
+        @return bytes32 hash, or 0 if no revert string was returned
+     */
+    function _getRevertHash() internal pure returns (bytes32 _hash) {
+        assembly {
+            /* Error(string) - selector, offset, length, string */
+            let _size := returndatasize()
+            if gt(_size, 67) {
+                let _ptr := mload(0x40)
+                returndatacopy(_ptr, 0, _size)
+                let _length := mload(add(_ptr, 36))
+                if iszero(gt(add(_length, 68), _size)) {
+                    _hash := keccak256(add(_ptr, 68), _length)
+                }
+            }
+        }
+        return _hash;
+    }
+
+    /**
+        @notice Internal - status code for a checkTransfers revert string
+        @param _hash keccak256 hash of the revert string
+        @return uint8 status code
+     */
+    function _getStatusCode(bytes32 _hash) internal pure returns (uint8) {
+        if (_hash == 0) return 255;
+        bytes32[24] memory _reasons = [
+            keccak256(abi.encodePacked("Cannot send 0 shares")),
+            keccak256(abi.encodePacked("Value too large")),
+            keccak256(abi.encodePacked("Cannot send to self")),
+            keccak256(abi.encodePacked("Insufficient Balance")),
+            keccak256(abi.encodePacked("Insufficient Custodial Balance")),
+            keccak256(abi.encodePacked("Insufficient transferable shares")),
+            keccak256(abi.encodePacked("Restricted Authority Address")),
+            keccak256(abi.encodePacked("Verifier restricted")),
+            keccak256(abi.encodePacked("Address not registered")),
+            keccak256(abi.encodePacked("Authority not permitted")),
+            keccak256(abi.encodePacked("Custodian to Custodian")),
+            keccak256(abi.encodePacked("Transfers locked: Org")),
+            keccak256(abi.encodePacked("Transfers locked: Share")),
+            keccak256(abi.encodePacked("Sender restricted: Org")),
+            keccak256(abi.encodePacked("Sender restricted: Verifier")),
+            keccak256(abi.encodePacked("Authority restricted")),
+            keccak256(abi.encodePacked("Receiver restricted: Org")),
+            keccak256(abi.encodePacked("Receiver restricted: Verifier")),
+            keccak256(abi.encodePacked("Receiver blocked: Country")),
+            keccak256(abi.encodePacked("Receiver blocked: Rating")),
+            keccak256(abi.encodePacked("Total Member Limit")),
+            keccak256(abi.encodePacked("Country Member Limit")),
+            keccak256(abi.encodePacked("Total Member Limit: Rating")),
+            keccak256(abi.encodePacked("Country Member Limit: Rating"))
+        ];
+        for (uint256 i; i < _reasons.length; i++) {
+            if (_reasons[i] == _hash) return uint8(i + 1);
+        }
+        return 255;
+    }
+
     /**
         @notice Check if a custodian internal transfer is permitted
         @dev If a transfer is not allowed, the function will throw
@@ -186,6 +284,223 @@ contract OrgShareBase is OrgShareBaseABC, Modular {
         bool _zero
     ) internal;
 
+    /**
+        @notice Custodian transfer function for many netted transfers
+        @dev
+            called by Custodian.settleBatch. Transfers must already be netted,
+            each address may only send or only receive. The org level checks
+            and member counts are applied once per net position with the
+            custodian as the counterparty, then each transfer is checked and
+            applied individually.
+        @param _from Array of sender addresses
+        @param _to Array of receiver addresses
+        @param _value Array of amounts to transfer
+        @return bool
+     */
+    function transferCustodianBatch(
+        address[] _from,
+        address[] _to,
+        uint256[] _value
+    )
+        public
+        returns (bool)
+    {
+        require(_from.length == _to.length); // dev: length mismatch
+        require(_from.length == _value.length); // dev: length mismatch
+        uint256[] memory _idx = new uint256[](_from.length * 2);
+        (
+            address[] memory _addr,
+            bool[] memory _zero,
+            uint256 _senders
+        ) = _getCustodianPositions(_from, _to, _value, _idx);
+        (
+            bytes32 _authID,
+            bytes32[] memory _id,
+            uint8[] memory _rating,
+            uint16[] memory _country
+        ) = orgCode.transferSharesBatch(msg.sender, _addr, _senders, _zero);
+        _transferCustodianBatch(_value, _authID, _id, _rating, _country, _addr, _idx);
+        return true;
+    }
+
+    /**
+        @notice Internal - net positions for transferCustodianBatch
+        @dev
+            Addresses are tracked in an open addressed table, each entry
+            holds the address and its index + 1 in the upper bits.
+        @param _from Array of sender addresses
+        @param _to Array of receiver addresses
+        @param _value Array of amounts to transfer
+        @param _idx Empty array, set to the sender and receiver position
+                    index of each transfer
+        @return array of position addresses, senders first
+        @return array of zero balance booleans, one per position
+        @return number of sending positions
+     */
+    function _getCustodianPositions(
+        address[] memory _from,
+        address[] memory _to,
+        uint256[] memory _value,
+        uint256[] memory _idx
+    )
+        internal
+        view
+        returns (
+            address[] _addr,
+            bool[] _zero,
+            uint256 _senders
+        )
+    {
+        uint256[] memory _table = new uint256[](_from.length * 4);
+        /* senders are added from the start of _addr, receivers from the end */
+        _addr = new address[](_from.length * 2);
+        uint256[] memory _total = new uint256[](_addr.length);
+        uint256[2] memory _count;
+        for (uint256 i; i < _idx.length; i++) {
+            _idx[i] = _addPosition(
+                (i % 2 == 0 ? _from[i / 2] : _to[i / 2]),
+                i % 2 == 0,
+                _table,
+                _addr,
+                _count
+            );
+            _total[_idx[i]] += _value[i / 2];
+            require(_total[_idx[i]] >= _value[i / 2]); // dev: value overflow
+        }
+        return _compactPositions(_addr, _total, _count, _idx);
+    }
+
+    /**
+        @notice Internal - find or add a net position
+        @param _member Address of the position
+        @param _send Is the position a sender?
+        @param _table Open addressed table of positions
+        @param _addr Array of position addresses
+        @param _count Number of sending and receiving positions
+        @return index of the position in _addr
+     */
+    function _addPosition(
+        address _member,
+        bool _send,
+        uint256[] memory _table,
+        address[] memory _addr,
+        uint256[2] memory _count
+    )
+        internal
+        pure
+        returns (uint256 _idx)
+    {
+        uint256 x = uint256(_member) % _table.length;
+        while (_table[x] != 0 && address(_table[x]) != _member) {
+            x = (x + 1) % _table.length;
+        }
+        if (_table[x] == 0) {
+            _idx = (_send ? _count[0] : _addr.length - 1 - _count[1]);
+            _count[_send ? 0 : 1] += 1;
+            _addr[_idx] = _member;
+            _table[x] = uint256(_member) | ((_idx + 1) << 160);
+            return _idx;
+        }
+        _idx = (_table[x] >> 160) - 1;
+        require((_idx < _count[0]) == _send); // dev: not netted
+        return _idx;
+    }
+
+    /**
+        @notice Internal - close the gap between senders and receivers
+        @param _positions Array of position addresses
+        @param _total Array of total amounts per position
+        @param _count Number of sending and receiving positions
+        @param _idx Array of position indexes, receivers are updated in place
+        @return array of position addresses, senders first
+        @return array of zero balance booleans, one per position
+        @return number of sending positions
+     */
+    function _compactPositions(
+        address[] memory _positions,
+        uint256[] memory _total,
+        uint256[2] memory _count,
+        uint256[] memory _idx
+    )
+        internal
+        view
+        returns (
+            address[] _addr,
+            bool[] _zero,
+            uint256
+        )
+    {
+        uint256 _gap = _positions.length - _count[0] - _count[1];
+        _addr = new address[](_count[0] + _count[1]);
+        _zero = new bool[](_addr.length);
+        for (uint256 i; i < _addr.length; i++) {
+            uint256 x = (i < _count[0] ? i : i + _gap);
+            _addr[i] = _positions[x];
+            /* is sender balance now zero? was receiver balance zero? */
+            _zero[i] = custBalances[_addr[i]][msg.sender] == (
+                i < _count[0] ? _total[x] : 0
+            );
+        }
+        for (i = 1; i < _idx.length; i += 2) {
+            _idx[i] -= _gap;
+        }
+        return (_addr, _zero, _count[0]);
+    }
+
+    /**
+        @notice Internal - apply each transfer of transferCustodianBatch
+        @param _value Array of amounts to transfer
+        @param _authID ID of caller
+        @param _id Array of position IDs
+        @param _rating Array of position ratings
+        @param _country Array of position countries
+        @param _addr Array of position addresses
+        @param _idx Array of sender and receiver position indexes
+     */
+    function _transferCustodianBatch(
+        uint256[] memory _value,
+        bytes32 _authID,
+        bytes32[] memory _id,
+        uint8[] memory _rating,
+        uint16[] memory _country,
+        address[] memory _addr,
+        uint256[] memory _idx
+    )
+        internal
+    {
+        for (uint256 i; i < _value.length; i++) {
+            uint256 _send = _idx[i * 2];
+            uint256 _recv = _idx[i * 2 + 1];
+            _transferCustodian(
+                _value[i],
+                _authID,
+                [_id[_send], _id[_recv]],
+                [_addr[_send], _addr[_recv]],
+                [_rating[_send], _rating[_recv]],
+                [_country[_send], _country[_recv]]
+            );
+        }
+    }
+
+    /**
+        @notice Internal - custodian transfer after the org level checks
+        @dev common logic for transferCustodian() and transferCustodianBatch()
+        @param _value Amount to transfer
+        @param _authID ID of caller
+        @param _id Array of sender/receiver IDs
+        @param _addr Array of sender/receiver addresses
+        @param _rating Array of sender/receiver ratings
+        @param _country Array of sender/receiver countries
+     */
+    function _transferCustodian(
+        uint256 _value,
+        bytes32 _authID,
+        bytes32[2] _id,
+        address[2] _addr,
+        uint8[2] _rating,
+        uint16[2] _country
+    ) internal;
+
     /**
         @notice ERC-20 approve standard
         @dev
@@ -26,6 +26,11 @@ contract OwnedCustodian is Modular, MultiSig {
         address indexed to,
         uint256 value
     );
+    event BatchSettled(
+        address indexed share,
+        uint256 transfers,
+        uint256 legs
+    );
 
     /**
         @notice Custodian constructor
@@ -115,6 +120,52 @@ contract OwnedCustodian is Modular, MultiSig {
         return true;
     }
 
+    /**
+        @notice Transfers shares out of the custodian contract to many recipients
+        @dev
+            callable by custodian authorities and modules. Modules hooked at
+            sentShares are called once per recipient, modules hooked at
+            sentSharesBatch are called once with the full arrays.
+        @param _share Address of the share to transfer
+        @param _to Array of recipient addresses
+        @param _value Array of amounts to transfer
+        @return bool success
+     */
+    function transferMany(
+        IOrgShareBase _share,
+        address[] _to,
+        uint256[] _value
+    )
+        public
+        returns (bool)
+    {
+        if (
+            /* msg.sig = 0x1a9d4dc9 */
+            !isPermittedModule(msg.sender, msg.sig) &&
+            !_checkMultiSig()
+        ) {
+            return false;
+        }
+        require(_to.length == _value.length); // dev: length mismatch
+        for (uint256 i; i < _to.length; i++) {
+            require(_share.transfer(_to[i], _value[i]));
+            /* bytes4 signature for custodian module sentShares() */
+            require(_callModules(
+                0xa110724f,
+                0x00,
+                abi.encode(_share, _to[i], _value[i])
+            ));
+            emit SentShares(_share, _to[i], _value[i]);
+        }
+        /* bytes4 signature for custodian module sentSharesBatch() */
+        require(_callModules(
+            0xcdfd97e3,
+            0x00,
+            abi.encode(_share, _to, _value)
+        ));
+        return true;
+    }
+
     /**
         @notice Add a new share owner
         @dev called by OrgCode when shares are transferred to a custodian
@@ -165,7 +216,173 @@ contract OwnedCustodian is Modular, MultiSig {
         ) {
             return false;
         }
+        _transferInternal(_share, _from, _to, _value);
+        return true;
+    }
+
+    /**
+        @notice Settle many internal transfers as net changes of ownership
+        @dev
+            Transfers are netted per address before any balances change, so
+            only the resulting net legs are applied and checked. Legs are
+            formed by matching net senders and receivers in the order they
+            first appear, and applied with one call to
+            share.transferCustodianBatch. Addresses whose transfers net to
+            zero are never verified or counted.
+        @param _share Address of the share to transfer
+        @param _from Array of sender addresses
+        @param _to Array of recipient addresses
+        @param _value Array of share amounts
+        @return bool success
+     */
+    function settleBatch(
+        IOrgShareBase _share,
+        address[] _from,
+        address[] _to,
+        uint256[] _value
+    )
+        public
+        returns (bool)
+    {
+        if (
+            /* msg.sig = 0x984aa7a7 */
+            !isPermittedModule(msg.sender, msg.sig) &&
+            !_checkMultiSig()
+        ) {
+            return false;
+        }
+        require(_from.length == _to.length); // dev: length mismatch
+        require(_from.length == _value.length); // dev: length mismatch
+        uint256[] memory _table = new uint256[](_from.length * 4);
+        address[] memory _addr = new address[](_from.length * 2);
+        int256[] memory _net = new int256[](_from.length * 2);
+        uint256 _count;
+        for (uint256 i; i < _from.length; i++) {
+            require(int256(_value[i]) >= 0); // dev: value overflow
+            _count = _addNet(_table, _addr, _net, _count, _from[i], -int256(_value[i]));
+            _count = _addNet(_table, _addr, _net, _count, _to[i], int256(_value[i]));
+        }
+        emit BatchSettled(_share, _from.length, _settleLegs(_share, _addr, _net, _count));
+        return true;
+    }
+
+    /**
+        @notice Internal - form and apply the net legs of settleBatch
+        @param _share Address of the share to transfer
+        @param _addr Array of addresses
+        @param _net Array of net positions, same order as _addr
+        @param _count Number of addresses
+        @return number of legs applied
+     */
+    function _settleLegs(
+        IOrgShareBase _share,
+        address[] memory _addr,
+        int256[] memory _net,
+        uint256 _count
+    )
+        internal
+        returns (uint256 _legs)
+    {
+        address[] memory _legFrom = new address[](_count);
+        address[] memory _legTo = new address[](_count);
+        uint256[] memory _legValue = new uint256[](_count);
+        uint256 x;
+        for (uint256 i; i < _count; i++) {
+            while (_net[i] < 0) {
+                while (_net[x] <= 0) x++;
+                uint256 _amount = uint256(-_net[i] < _net[x] ? -_net[i] : _net[x]);
+                _legFrom[_legs] = _addr[i];
+                _legTo[_legs] = _addr[x];
+                _legValue[_legs] = _amount;
+                _net[i] += int256(_amount);
+                _net[x] -= int256(_amount);
+                _legs++;
+            }
+        }
+        if (_legs == 0) return 0;
+        /* shorten the leg arrays to the number of legs formed */
+        assembly {
+            mstore(_legFrom, _legs)
+            mstore(_legTo, _legs)
+            mstore(_legValue, _legs)
+        }
+        _share.transferCustodianBatch(_legFrom, _legTo, _legValue);
+        for (i = 0; i < _legs; i++) {
+            _internalTransferred(_share, _legFrom[i], _legTo[i], _legValue[i]);
+        }
+        return _legs;
+    }
+
+    /**
+        @notice Add an amount to the net position of an address
+        @param _table Open addressed table of addresses seen so far
+        @param _addr Array of addresses seen so far
+        @param _net Array of net positions, same order as _addr
+        @param _count Number of addresses seen so far
+        @param _member Address to update
+        @param _amount Amount to add to the net position
+        @return updated address count
+     */
+    function _addNet(
+        uint256[] memory _table,
+        address[] memory _addr,
+        int256[] memory _net,
+        uint256 _count,
+        address _member,
+        int256 _amount
+    )
+        internal
+        pure
+        returns (uint256)
+    {
+        uint256 x = uint256(_member) % _table.length;
+        while (_table[x] != 0 && address(_table[x]) != _member) {
+            x = (x + 1) % _table.length;
+        }
+        if (_table[x] != 0) {
+            _net[(_table[x] >> 160) - 1] += _amount;
+            return _count;
+        }
+        _table[x] = uint256(_member) | ((_count + 1) << 160);
+        _addr[_count] = _member;
+        _net[_count] = _amount;
+        return _count + 1;
+    }
+
+    /**
+        @notice Internal transfer of share ownership within the custodian
+        @param _share Address of the share to transfer
+        @param _from Sender address
+        @param _to Recipient address
+        @param _value Amount of shares to transfer
+     */
+    function _transferInternal(
+        IOrgShareBase _share,
+        address _from,
+        address _to,
+        uint256 _value
+    )
+        internal
+    {
         _share.transferCustodian([_from, _to], _value);
+        _internalTransferred(_share, _from, _to, _value);
+    }
+
+    /**
+        @notice Internal - module hook and event after an internal transfer
+        @param _share Address of the share transferred
+        @param _from Sender address
+        @param _to Recipient address
+        @param _value Amount of shares transferred
+     */
+    function _internalTransferred(
+        IOrgShareBase _share,
+        address _from,
+        address _to,
+        uint256 _value
+    )
+        internal
+    {
         /* bytes4 signature for custodian module internalTransfer() */
         require(_callModules(
             0x44a29e2a,
@@ -173,7 +390,6 @@ contract OwnedCustodian is Modular, MultiSig {
             abi.encode(_share, _from, _to, _value)
         ));
         emit TransferOwnership(_share, _from, _to, _value);
-        return true;
     }
 
     /**
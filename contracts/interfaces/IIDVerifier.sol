@@ -13,10 +13,13 @@ interface IIDVerifier {
     event UpdatedMember (bytes32 indexed id, bytes3 region, uint8 rating, uint40 expires, bytes32 indexed authority);
 
     function addMember (bytes32, uint16, bytes3, uint8, uint40, address[]) external returns (bool);
+    function addMembers (bytes32[], uint16[], bytes3[], uint8[], uint40[], address[]) external returns (bool);
     function registerAddresses (bytes32, address[]) external returns (bool);
+    function registerAddressesBatch (bytes32[], address[]) external returns (bool);
     function restrictAddresses (bytes32, address[]) external returns (bool);
     function setMemberRestriction (bytes32, bool) external returns (bool);
     function updateMember (bytes32, bytes3, uint8, uint40) external returns (bool);
+    function updateMembers (bytes32[], bytes3[], uint8[], uint40[]) external returns (bool);
     function generateID (string _idString) external pure returns (bytes32);
     function getCountry (bytes32 _id) external view returns (uint16);
     function getExpires (bytes32 _id) external view returns (uint40);
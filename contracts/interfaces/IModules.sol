@@ -209,6 +209,26 @@ contract ICustodianModule is IBaseModule {
         external
         returns (bool);
 
+    /**
+        @notice Custodian sent shares to many recipients
+        @dev
+            Called once after a successful call to transferMany, in addition
+            to sentShares being called for each recipient. Modules should
+            hook one or the other.
+            Hook signature: 0xcdfd97e3
+        @param _share Share address
+        @param _to Array of recipient addresses
+        @param _value Array of amounts transfered
+        @return bool success
+     */
+    function sentSharesBatch(
+        address _share,
+        address[] _to,
+        uint256[] _value
+    )
+        external
+        returns (bool);
+
     /**
         @notice Custodian received shares
         @dev
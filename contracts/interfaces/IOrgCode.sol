@@ -29,6 +29,7 @@ interface IOrgCode {
      function checkMultiSigExternal (address _caller, bytes32 _callHash, bytes4 _sig) external returns (bool);
      function checkTransfer (address _auth, address _from, address _to, bool _zero) external returns (bytes32 _authID, bytes32[2] _id, uint8[2] _rating, uint16[2] _country);
      function detachModule (address _target, address _module) external returns (bool);
+     function executeWithSignatures (bytes _data, uint8[] _v, bytes32[] _r, bytes32[] _s) external returns (bool);
      function modifyAuthorizedSupply (uint256 _value) external returns (bool);
      function modifyShareTotalSupply (address _owner, uint256 _old, uint256 _new) external returns (bytes32 _id, uint8 _rating, uint16 _country);
      function removeAuthorityAddresses (bytes32 _authID, address[] _addr) external returns (bool);
@@ -44,13 +45,17 @@ interface IOrgCode {
      function setMemberLimits (uint32[8] _limits) external returns (bool);
      function setOrgShareRestriction (address _share, bool _restricted) external returns (bool);
      function setVerifier (address _verifier, bool _restricted) external returns (bool);
+     function setVerifierHints (address _verifier, address[] _addr) external returns (bool);
      function transferShares (address _auth, address _from, address _to, bool[4] _zero) external returns (bytes32 _authID, bytes32[2] _id, uint8[2] _rating, uint16[2] _country);
+     function transferSharesBatch (address _auth, address[] _addr, uint256 _senders, bool[] _zero) external returns (bytes32 _authID, bytes32[] _id, uint8[] _rating, uint16[] _country);
+     function transferSharesMany (address _auth, address _from, address[] _to, bool[] _zero) external returns (bytes32 _authID, bytes32[] _id, uint8[] _rating, uint16[] _country);
      function getAuthority (bytes32 _authID) external view returns (uint32 _addressCount, uint32 _threshold, uint32 _approvedUntil);
      function getCountry (uint16 _country) external view returns (uint32 _minRating, uint32[8] _count, uint32[8] _limit);
      function getDocumentHash (string _documentID) external view returns (bytes32);
      function getID (address _addr) external view returns (bytes32 _id);
      function getMemberCounts () external view returns (uint32[8] _counts, uint32[8] _limits);
      function getMemberVerifier (bytes32 _id) external view returns (address);
+     function getSignedCallHash (address _caller, bytes _data) external view returns (bytes32);
      function governance () external view returns (address);
      function isActiveOrgShare (address _share) external view returns (bool);
      function isApprovedAuthority (address _addr, bytes4 _sig) external view returns (bool);
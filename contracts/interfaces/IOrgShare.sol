@@ -22,6 +22,7 @@ contract IOrgShareBase {
     function setHookTags (bytes4 _sig, bool _value, bytes1 _tagBase, bytes1[] _tags) external returns (bool);
     function transfer (address, uint256) external returns (bool);
     function transferCustodian (address[2], uint256) external returns (bool);
+    function transferCustodianBatch (address[] _from, address[] _to, uint256[] _value) external returns (bool);
     function transferFrom (address, address, uint256) external returns (bool);
     function allowance (address _owner, address _spender) external view returns (uint256);
     function authorizedSupply () external view returns (uint256);
@@ -47,6 +48,7 @@ contract IOrgShareBase {
  */
 contract IBookShare is IOrgShareBase {
     function mint(address _owner, uint256 _value) external returns (bool);
+    function mintBatch(address[] _owners, uint256[] _values) external returns (bool);
     function burn(address _owner, uint256 _value) external returns (bool);
 }
 
@@ -57,6 +59,7 @@ contract IBookShare is IOrgShareBase {
 contract ICertShare is IOrgShareBase {
     function burn(uint48 _start, uint48 _stop) external returns (bool);
     function mint(address _owner, uint48 _value, uint32 _time, bytes2 _tag) external returns (bool);
+    function mintBatch(address[] _owners, uint48[] _values, uint32[] _times, bytes2[] _tags) external returns (bool);
     function modifyRange(uint48 _pointer, uint32 _time, bytes2 _tag) public returns (bool);
     function modifyRanges(uint48 _start, uint48 _stop, uint32 _time, bytes2 _tag) public returns (bool);
     function transferRange(address _to, uint48 _start, uint48 _stop) external returns (bool);
@@ -19,8 +19,13 @@ contract DividendModule is CheckpointModuleBase {
     uint256 public dividendAmount;
     uint256 public claimExpiration;
 
-    mapping (address => bool) claimed;
-    mapping (address => mapping (address => bool)) claimedCustodian;
+    address[] holders;
+    mapping (address => uint256) holderIndex;
+
+    /* claim bitmaps keyed by holder index */
+    mapping (uint256 => uint256) claimed;
+    /* custodian contract, holder index */
+    mapping (address => mapping (uint256 => uint256)) claimedCustodian;
 
     event DividendIssued(uint256 time, uint256 amount);
     event DividendClaimed(address beneficiary, uint256 amount);
@@ -92,21 +97,127 @@ contract DividendModule is CheckpointModuleBase {
         return true;
     }
 
+    /**
+        @notice Add addresses to the list of holders paid by sweep
+        @dev Addresses that are already listed are ignored
+        @param _holders Array of holder addresses
+        @return bool
+     */
+    function addHolders(address[] _holders) external returns (bool) {
+        if (!_onlyAuthority()) return false;
+        for (uint256 i; i < _holders.length; i++) {
+            _getHolderIndex(_holders[i]);
+        }
+        return true;
+    }
+
+    /**
+        @notice Pay dividends to listed holders, in order
+        @dev
+            Pays direct balances only, custodied balances are claimed with
+            claimCustodianDividend. Holders that are already paid, are no
+            longer registered or cannot receive ether are skipped.
+        @param _cursor Position in the holder list to start from
+        @param _maxCount Maximum number of holders to process
+        @return uint256 cursor for the next call, equal to holderCount when done
+     */
+    function sweep(uint256 _cursor, uint256 _maxCount) external returns (uint256) {
+        require (dividendAmount > 0);
+        uint256 _end = _cursor.add(_maxCount);
+        if (_end > holders.length) _end = holders.length;
+        for (; _cursor < _end; _cursor++) {
+            address _holder = holders[_cursor];
+            if (!orgCode.isRegisteredMember(_holder)) continue;
+            if (!_setClaimed(claimed, _cursor + 1)) continue;
+            uint256 _value = _getBalance(_holder).mul(dividendAmount).div(totalSupply);
+            if (!_holder.send(_value)) {
+                claimed[(_cursor + 1) / 256] ^= uint256(1) << ((_cursor + 1) % 256);
+                continue;
+            }
+            emit DividendClaimed(_holder, _value);
+        }
+        return _cursor;
+    }
+
+    /**
+        @notice Get the number of listed holders
+        @return uint256
+     */
+    function holderCount() external view returns (uint256) {
+        return holders.length;
+    }
+
+    /**
+        @notice Check if a dividend payment has been claimed
+        @param _beneficiary Address of beneficiary
+        @param _custodian Custodian address (0x00 for a direct balance)
+        @return bool
+     */
+    function isClaimed(
+        address _beneficiary,
+        address _custodian
+    )
+        external
+        view
+        returns (bool)
+    {
+        uint256 _idx = holderIndex[_beneficiary];
+        if (_idx == 0) return false;
+        uint256 _word = (
+            _custodian == 0x00 ?
+            claimed[_idx / 256] :
+            claimedCustodian[_custodian][_idx / 256]
+        );
+        return (_word & (uint256(1) << (_idx % 256))) != 0;
+    }
+
     /**
         @notice Internal shared payment logic
         @param _beneficiary Address to send dividend to
      */
     function _claim(address _beneficiary) internal {
         require(orgCode.isRegisteredMember(_beneficiary));
-        require (!claimed[_beneficiary]);
+        require (_setClaimed(claimed, _getHolderIndex(_beneficiary)));
         uint256 _value = _getBalance(
             _beneficiary
         ).mul(dividendAmount).div(totalSupply);
-        claimed[_beneficiary] = true;
         _beneficiary.transfer(_value);
         emit DividendClaimed(_beneficiary, _value);
     }
 
+    /**
+        @notice Get the index of a holder, adding it to the list if required
+        @param _holder Holder address
+        @return uint256 index, starting from 1
+     */
+    function _getHolderIndex(address _holder) internal returns (uint256) {
+        uint256 _idx = holderIndex[_holder];
+        if (_idx != 0) return _idx;
+        _idx = holders.push(_holder);
+        holderIndex[_holder] = _idx;
+        return _idx;
+    }
+
+    /**
+        @notice Set a bit in a claim bitmap
+        @param _bitmap Claim bitmap
+        @param _idx Holder index
+        @return bool false if the bit was already set
+     */
+    function _setClaimed(
+        mapping (uint256 => uint256) storage _bitmap,
+        uint256 _idx
+    )
+        internal
+        returns (bool)
+    {
+        uint256 _bit = uint256(1) << (_idx % 256);
+        uint256 _word = _bitmap[_idx / 256];
+        if ((_word & _bit) != 0) return false;
+        _bitmap[_idx / 256] = _word | _bit;
+        return true;
+    }
+
     /**
         @notice Trigger a dividend payment to an address, on a custodied balance
         @param _beneficiary Address to send dividend to
@@ -152,12 +263,14 @@ contract DividendModule is CheckpointModuleBase {
      */
     function _claimCustodian(address _beneficiary, address _custodian) internal {
         require(orgCode.isRegisteredMember(_beneficiary));
-        require (!claimedCustodian[_beneficiary][_custodian]);
+        require (_setClaimed(
+            claimedCustodian[_custodian],
+            _getHolderIndex(_beneficiary)
+        ));
         uint256 _value = _getCustodianBalance(
             _beneficiary,
             _custodian
         ).mul(dividendAmount).div(totalSupply);
-        claimedCustodian[_beneficiary][_custodian] = true;
         _beneficiary.transfer(_value);
         emit CustodianDividendClaimed(
             _custodian,
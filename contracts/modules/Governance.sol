@@ -9,6 +9,9 @@ interface IMultiCheckpointModule {
     function totalSupplyAt(address, uint256) external view returns (uint256);
     function balanceAt(address, address, uint256) external view returns (uint256);
     function custodianBalanceAt(address, address, address, uint256) external view returns (uint256);
+    function totalSuppliesAt(address[], uint256) external view returns (uint256[]);
+    function balancesAt(address[], address, uint256) external view returns (uint256[]);
+    function custodianBalancesAt(address[], address, address, uint256) external view returns (uint256[]);
 }
 
 
@@ -42,6 +45,8 @@ contract GovernanceModule {
         uint64 start;
         uint64 end;
         Vote[] votes;
+        /* every distinct share used in this proposal's votes */
+        address[] shares;
         string description;
         address approvalAddress;
         bytes approvalCalldata;
@@ -57,9 +62,11 @@ contract GovernanceModule {
         Share[] shares;
     }
 
+    /* index is the position of the share in Proposal.shares */
     struct Share {
         address addr;
         uint16 multiplier;
+        uint16 index;
     }
 
     event NewProposal(
@@ -257,7 +264,7 @@ contract GovernanceModule {
                 possible TODO - allow this contract to create the checkpoint
              */
             require(checkpoint.checkpointExists(_shares[i], p.checkpoint)); // dev: no checkpoint
-            v.shares[i] = Share(_shares[i], _multipliers[i]);
+            v.shares[i] = Share(_shares[i], _multipliers[i], _shareIndex(p, _shares[i]));
         }
         emit NewVote(
             _id,
@@ -285,11 +292,15 @@ contract GovernanceModule {
         require(p.hasVoted[msg.sender][0x00] == 0); // dev: already voted
         if (p.state == 1) _openVote(p);
         p.hasVoted[msg.sender][0x00] = _vote + 1;
+        uint256[] memory _balances = checkpoint.balancesAt(
+            p.shares,
+            msg.sender,
+            p.checkpoint
+        );
         for (uint256 i; i < p.votes.length; i++) {
-            p.votes[i].counts[_vote] = p.votes[i].counts[_vote].add(_getVotes(
-                p.votes[i].shares,
-                p.checkpoint
-            ));
+            p.votes[i].counts[_vote] = p.votes[i].counts[_vote].add(
+                _sumVotes(p.votes[i].shares, _balances)
+            );
         }
         /** No event is emitted, cuz privacy */
         return true;
@@ -316,17 +327,152 @@ contract GovernanceModule {
         require(p.hasVoted[msg.sender][_custodian] == 0); // dev: has voted with custodian
         uint256 _vote = p.hasVoted[msg.sender][0x00] - 1;
         p.hasVoted[msg.sender][_custodian] = _vote + 1;
+        uint256[] memory _balances = checkpoint.custodianBalancesAt(
+            p.shares,
+            msg.sender,
+            _custodian,
+            p.checkpoint
+        );
         for (uint256 i; i < p.votes.length; i++) {
-            p.votes[i].counts[_vote] += _getCustodianVotes(
-                p.votes[i].shares,
-                _custodian,
-                p.checkpoint
+            p.votes[i].counts[_vote] += _sumVotes(p.votes[i].shares, _balances);
+        }
+        /** No event is emitted, cuz privacy */
+        return true;
+    }
+
+    /**
+        @notice Cast many signed votes on a proposal
+        @dev
+            Each member signs the hash given by getBallotHash. A ballot with
+            a custodian address also counts the member's balance held by
+            that custodian, so the same signature may be included once for
+            each custodian. Balances that have already been counted, and
+            ballots that differ from the member's earlier vote, are skipped.
+        @param _id Proposal ID
+        @param _votes Array of votes as integers (0=no, 1=yes)
+        @param _custodians Array of custodian addresses (0x00 if none)
+        @param _v Array of signature v values
+        @param _r Array of signature r values
+        @param _s Array of signature s values
+        @return bool success
+     */
+    function castVotesBySig(
+        bytes32 _id,
+        uint8[] _votes,
+        address[] _custodians,
+        uint8[] _v,
+        bytes32[] _r,
+        bytes32[] _s
+    )
+        public
+        returns (bool)
+    {
+        require(_votes.length == _custodians.length); // dev: length mismatch
+        require(_votes.length == _v.length); // dev: length mismatch
+        require(_votes.length == _r.length); // dev: length mismatch
+        require(_votes.length == _s.length); // dev: length mismatch
+        Proposal storage p = proposals[_id];
+        require(p.state > 0); // dev: invalid id
+        require(p.state < 3); // dev: proposal has closed
+        require(p.end >= now || p.end == 0); // dev: voting has finished
+        if (p.state == 1) _openVote(p);
+        /* counts are tallied in memory and written once, [vote][yes/no] */
+        uint256[] memory _counts = new uint256[](p.votes.length * 2);
+        for (uint256 i; i < _votes.length; i++) {
+            require(_votes[i] < 2); // dev: invalid vote
+            address _voter = ecrecover(
+                keccak256(abi.encodePacked(
+                    "\x19Ethereum Signed Message:\n32",
+                    getBallotHash(_id, _votes[i])
+                )),
+                _v[i],
+                _r[i],
+                _s[i]
             );
+            require(_voter != 0x00); // dev: invalid signature
+            _castBallot(p, _counts, _voter, _votes[i], _custodians[i]);
+        }
+        for (i = 0; i < _counts.length; i++) {
+            if (_counts[i] == 0) continue;
+            Vote storage v = p.votes[i / 2];
+            v.counts[i % 2] = v.counts[i % 2].add(_counts[i]);
         }
         /** No event is emitted, cuz privacy */
         return true;
     }
 
+    /**
+        @notice Get the hash that a member signs to vote with castVotesBySig
+        @param _id Proposal ID
+        @param _vote Vote boolean as an integer (0=no, 1=yes)
+        @return bytes32 hash
+     */
+    function getBallotHash(bytes32 _id, uint8 _vote) public view returns (bytes32) {
+        return keccak256(abi.encodePacked(address(this), _id, _vote));
+    }
+
+    /**
+        @notice Internal - tally a single signed ballot
+        @dev
+            If the member has already voted, only custodied balances are
+            added. A ballot that differs from their earlier vote is skipped.
+        @param p Proposal struct storage marker
+        @param _counts Array of vote counts being tallied
+        @param _voter Member address
+        @param _vote Vote boolean as an integer (0=no, 1=yes)
+        @param _cust Custodian contract address (0x00 if none)
+     */
+    function _castBallot(
+        Proposal storage p,
+        uint256[] memory _counts,
+        address _voter,
+        uint8 _vote,
+        address _cust
+    )
+        internal
+    {
+        uint256[] memory _balances;
+        if (p.hasVoted[_voter][0x00] == 0) {
+            p.hasVoted[_voter][0x00] = _vote + 1;
+            _balances = checkpoint.balancesAt(p.shares, _voter, p.checkpoint);
+            _tallyVotes(p, _counts, _vote, _balances);
+        } else if (p.hasVoted[_voter][0x00] != _vote + 1) {
+            return;
+        }
+        if (_cust == 0x00 || p.hasVoted[_voter][_cust] != 0) return;
+        p.hasVoted[_voter][_cust] = _vote + 1;
+        _balances = checkpoint.custodianBalancesAt(
+            p.shares,
+            _voter,
+            _cust,
+            p.checkpoint
+        );
+        _tallyVotes(p, _counts, _vote, _balances);
+    }
+
+    /**
+        @notice Internal - add checkpoint balances to tallied vote counts
+        @param p Proposal struct storage marker
+        @param _counts Array of vote counts being tallied
+        @param _vote Vote boolean as an integer (0=no, 1=yes)
+        @param _balances Checkpoint balances, ordered by Proposal.shares
+     */
+    function _tallyVotes(
+        Proposal storage p,
+        uint256[] memory _counts,
+        uint256 _vote,
+        uint256[] memory _balances
+    )
+        internal
+        view
+    {
+        for (uint256 i; i < p.votes.length; i++) {
+            _counts[i * 2 + _vote] = _counts[i * 2 + _vote].add(
+                _sumVotes(p.votes[i].shares, _balances)
+            );
+        }
+    }
+
     /**
         @notice Close a proposal
         @param _id Proposal ID
@@ -363,85 +509,49 @@ contract GovernanceModule {
     function _openVote(Proposal storage p) internal {
         require(now >= p.start); // dev: vote has not started
         p.state = 2;
+        uint256[] memory _supply = checkpoint.totalSuppliesAt(p.shares, p.checkpoint);
         for (uint256 i; i < p.votes.length; i++) {
-            p.votes[i].totalVotes = _getTotalVotes(
-                p.votes[i].shares,
-                p.checkpoint
-            );
+            p.votes[i].totalVotes = _sumVotes(p.votes[i].shares, _supply);
         }
     }
 
     /**
-        @notice Internal - calculate total votes possible
-        @dev
-            TODO - This method and the following two can be combined to a single
-            one using .call() with solidity 0.5.x - but first brownie needs to
-            support multiple compiler versions on a project
-        @param t Storage marker for Share struct
-        @param _time Checkpoint time
-        @return uint256 total possible votes
+        @notice Internal - get the index of a share in a proposal's share list
+        @dev Shares not yet used in the proposal are appended to the list
+        @param p Proposal struct storage marker
+        @param _share Share contract address
+        @return uint16 index
      */
-    function _getTotalVotes(
-        Share[] storage t,
-        uint256 _time
+    function _shareIndex(
+        Proposal storage p,
+        address _share
     )
         internal
-        view
-        returns
-        (uint256 _total)
+        returns (uint16)
     {
-        for (uint256 i; i < t.length; i++) {
-            uint256 _ts = checkpoint.totalSupplyAt(t[i].addr, _time);
-            _total = _total.add(_ts.mul(t[i].multiplier));
+        for (uint256 i; i < p.shares.length; i++) {
+            if (p.shares[i] == _share) return uint16(i);
         }
-        return _total;
+        p.shares.push(_share);
+        return uint16(i);
     }
 
     /**
-        @notice Internal - calculate total votes for an member
+        @notice Internal - calculate votes from checkpoint values
         @param t Storage marker for Share struct
-        @param _time Checkpoint time
+        @param _values Checkpoint values, ordered by Proposal.shares
         @return uint256 total votes
      */
-    function _getVotes(
+    function _sumVotes(
         Share[] storage t,
-        uint256 _time
+        uint256[] memory _values
     )
         internal
         view
         returns (uint256 _total)
     {
         for (uint256 i; i < t.length; i++) {
-            uint256 _bal = checkpoint.balanceAt(t[i].addr, msg.sender, _time);
-            _total = _total.add(_bal.mul(t[i].multiplier));
-        }
-        return _total;
-    }
-
-    /**
-        @notice Internal - calculate total votes for an member via custodian
-        @param t Storage marker for Share struct
-        @param _cust Custodian contract address
-        @param _time Checkpoint time
-        @return uint256 total custodied votes
-     */
-    function _getCustodianVotes(
-        Share[] storage t,
-        address _cust,
-        uint256 _time
-    )
-        internal
-        view
-        returns (uint256 _total)
-    {
-        for (uint256 i; i < t.length; i++) {
-            uint256 _bal = checkpoint.custodianBalanceAt(
-                t[i].addr,
-                msg.sender,
-                _cust,
-                _time
-            );
-            _total = _total.add(_bal.mul(t[i].multiplier));
+            _total = _total.add(_values[t[i].index].mul(t[i].multiplier));
         }
         return _total;
     }
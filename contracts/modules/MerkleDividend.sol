@@ -0,0 +1,230 @@
+pragma solidity 0.4.25;
+
+import "../open-zeppelin/SafeMath.sol";
+import {OrgShareModuleBase} from "./bases/Module.sol";
+
+import "../interfaces/IOrgCode.sol";
+import "../interfaces/IOrgShare.sol";
+
+/**
+    @title Merkle Root Ether Dividend Payment Module
+    @dev
+        attached at OrgShare. Payouts are computed off-chain from checkpoint
+        balances and published as a merkle root of (beneficiary, custodian,
+        amount) leaves. See scripts/merkle_dividend.py
+    @notice Licensed under GNU GPLv3 - https://github.com/zerolawtech/ZAP-Tech/LICENSE
+ */
+contract MerkleDividendModule is OrgShareModuleBase {
+
+    using SafeMath for uint256;
+
+    string public name = "MerkleDividend";
+    bytes32 public merkleRoot;
+    uint256 public dividendAmount;
+    uint256 public claimExpiration;
+
+    /* share holder, custodian contract (0x00 if none) */
+    mapping (address => mapping (address => bool)) claimed;
+
+    event DividendIssued(uint256 time, uint256 amount, bytes32 merkleRoot);
+    event DividendClaimed(address beneficiary, uint256 amount);
+    event DividendExpired(uint256 unclaimedAmount);
+    event CustodianDividendClaimed(
+        address indexed custodian,
+        address beneficiary,
+        uint256 amount
+    );
+
+    /**
+        @notice Base constructor
+        @param _share OrgShare contract address
+        @param _org OrgCode contract address
+     */
+    constructor(
+        IOrgShareBase _share,
+        IOrgCode _org
+    )
+        OrgShareModuleBase(_share, _org)
+        public
+    {
+        return;
+    }
+
+    /**
+        @notice supply permissions and hook points when attaching module
+        @dev
+            permissions: 0xbb2a8522 - detachModule
+            hooks: none
+     */
+    function getPermissions()
+        external
+        pure
+        returns
+    (
+        bytes4[] permissions,
+        bytes4[] hooks,
+        uint256 hookBools
+    )
+    {
+        permissions = new bytes4[](1);
+        permissions[0] = 0xbb2a8522;
+        return (permissions, hooks, 0);
+    }
+
+    /**
+        @notice Issue a dividend
+        @dev
+            Multisig authority check allows any number of authority addresses
+            to send ETH towards the total dividend amount, until threshold is met
+        @param _merkleRoot Merkle root of (beneficiary, custodian, amount) leaves
+        @param _claimPeriod Time in seconds that dividend is claimable
+        @return bool
+     */
+    function issueDividend(
+        bytes32 _merkleRoot,
+        uint256 _claimPeriod
+    )
+        external
+        payable
+        returns (bool)
+    {
+        require (claimExpiration == 0);
+        require (_merkleRoot != 0); // dev: empty root
+        if (!_onlyAuthority()) return false;
+        require (address(this).balance > 0);
+        merkleRoot = _merkleRoot;
+        claimExpiration = now.add(_claimPeriod);
+        dividendAmount = address(this).balance;
+        emit DividendIssued(now, msg.value, _merkleRoot);
+        return true;
+    }
+
+    /**
+        @notice Trigger a dividend payment to an address
+        @dev Any address may call to trigger a dividend payment to a beneficiary
+        @param _beneficiary Address to send dividend to
+        @param _custodian Custodian where the balance is held (0x00 if none)
+        @param _amount Dividend amount, as given in the merkle tree
+        @param _proof Merkle proof for the leaf
+        @return bool
+     */
+    function claimDividend(
+        address _beneficiary,
+        address _custodian,
+        uint256 _amount,
+        bytes32[] _proof
+    )
+        external
+        returns (bool)
+    {
+        require (dividendAmount > 0);
+        _claim(_beneficiary, _custodian, _amount, _proof);
+        return true;
+    }
+
+    /**
+        @notice Trigger many dividend payments at once
+        @dev
+            Proofs are concatenated into a single array, _proofLengths
+            gives the number of proof elements used by each claim
+        @param _beneficiaries Array of addresses to send dividends to
+        @param _custodians Array of custodian addresses (0x00 if none)
+        @param _amounts Array of dividend amounts
+        @param _proofs Concatenated array of merkle proofs
+        @param _proofLengths Array of proof lengths
+        @return bool
+     */
+    function claimMany(
+        address[] _beneficiaries,
+        address[] _custodians,
+        uint256[] _amounts,
+        bytes32[] _proofs,
+        uint8[] _proofLengths
+    )
+        public
+        returns (bool)
+    {
+        require (dividendAmount > 0);
+        require (_beneficiaries.length == _custodians.length); // dev: length mismatch
+        require (_beneficiaries.length == _amounts.length); // dev: length mismatch
+        require (_beneficiaries.length == _proofLengths.length); // dev: length mismatch
+        uint256 _offset;
+        for (uint256 i; i < _beneficiaries.length; i++) {
+            bytes32[] memory _proof = new bytes32[](_proofLengths[i]);
+            for (uint256 x; x < _proof.length; x++) {
+                _proof[x] = _proofs[_offset + x];
+            }
+            _offset += _proof.length;
+            _claim(_beneficiaries[i], _custodians[i], _amounts[i], _proof);
+        }
+        require (_offset == _proofs.length); // dev: length mismatch
+        return true;
+    }
+
+    /**
+        @notice Check if a dividend payment has been claimed
+        @param _beneficiary Address of beneficiary
+        @param _custodian Custodian address (0x00 if none)
+        @return bool
+     */
+    function isClaimed(
+        address _beneficiary,
+        address _custodian
+    )
+        external
+        view
+        returns (bool)
+    {
+        return claimed[_beneficiary][_custodian];
+    }
+
+    /**
+        @notice Internal shared payment logic
+        @param _beneficiary Address to send dividend to
+        @param _custodian Custodian address (0x00 if none)
+        @param _amount Dividend amount
+        @param _proof Merkle proof for the leaf
+     */
+    function _claim(
+        address _beneficiary,
+        address _custodian,
+        uint256 _amount,
+        bytes32[] memory _proof
+    )
+        internal
+    {
+        require (!claimed[_beneficiary][_custodian]); // dev: already claimed
+        bytes32 _hash = keccak256(abi.encodePacked(_beneficiary, _custodian, _amount));
+        for (uint256 i; i < _proof.length; i++) {
+            if (_hash < _proof[i]) {
+                _hash = keccak256(abi.encodePacked(_hash, _proof[i]));
+            } else {
+                _hash = keccak256(abi.encodePacked(_proof[i], _hash));
+            }
+        }
+        require (_hash == merkleRoot); // dev: invalid proof
+        claimed[_beneficiary][_custodian] = true;
+        _beneficiary.transfer(_amount);
+        if (_custodian == 0x00) {
+            emit DividendClaimed(_beneficiary, _amount);
+        } else {
+            emit CustodianDividendClaimed(_custodian, _beneficiary, _amount);
+        }
+    }
+
+    /**
+        @notice Close dividend payments
+        @dev Only callable if claim period has passed or all payments were made
+        @return bool
+     */
+    function closeDividend() external returns (bool) {
+        require (dividendAmount > 0);
+        require (now > claimExpiration || address(this).balance == 0);
+        if (!_onlyAuthority()) return false;
+        emit DividendExpired(address(this).balance);
+        msg.sender.transfer(address(this).balance);
+        require (orgShare.detachModule(address(this)));
+        return true;
+    }
+
+}
@@ -14,23 +14,37 @@ contract MultiCheckpointModule is OrgModuleBase {
 
     using SafeMath for uint256;
 
-    struct Checkpoint {
-        uint256 totalSupply;
-        uint64 previous;
-        uint64 next;
-        bool set;
-        mapping (address => uint256) balances;
-        mapping (address => bool) zeroBalances;
-        mapping (address => mapping(address => uint256)) custBalances;
-        mapping (address => mapping(address => bool)) custZeroBalances;
-    }
-    struct EpochPointers {
-        uint64 previous;
-        uint64 next;
+    /**
+        The hook path advances the checkpoint pointers by at most this many
+        checkpoints per call. Any remaining catch-up is left to
+        advanceCheckpoints, so the cost added to a share transfer is bounded.
+     */
+    uint256 constant MAX_HOOK_STEPS = 4;
+
+    /**
+        Balance histories are append-only arrays sorted by time. Each entry
+        holds the time of a balance change and the value immediately before
+        that change. The value at a checkpoint is held in the first entry at
+        or after the checkpoint time, or is the current value if none exists.
+     */
+    struct Snapshot {
+        uint64 time;
+        uint192 value;
     }
 
-    mapping (address => EpochPointers) pointers;
-    mapping (address => mapping(uint256 => Checkpoint)) checkpointData;
+    /* share => checkpoint times, sorted ascending */
+    mapping (address => uint64[]) timeline;
+    /* share => index in timeline of the first checkpoint not yet advanced past */
+    mapping (address => uint256) nextIndex;
+    /* share => checkpoint time => is set */
+    mapping (address => mapping(uint256 => bool)) checkpointSet;
+
+    /* share => totalSupply history */
+    mapping (address => Snapshot[]) supplyHistory;
+    /* share => owner => balance history */
+    mapping (address => mapping(address => Snapshot[])) balanceHistory;
+    /* share => owner => custodian => balance history */
+    mapping (address => mapping(address => mapping(address => Snapshot[]))) custHistory;
 
     event CheckpointSet(address indexed share, uint64 time);
 
@@ -82,9 +96,36 @@ contract MultiCheckpointModule is OrgModuleBase {
         view
         returns (bool)
     {
-        return checkpointData[_share][_time].set;
+        return checkpointSet[_share][_time];
     }
 
+    /**
+        @notice Get the number of checkpoints set for a share
+        @param _share OrgShare contract address
+        @return uint256 checkpoint count
+     */
+    function checkpointCount(address _share) external view returns (uint256) {
+        return timeline[_share].length;
+    }
+
+    /**
+        @notice Find the latest checkpoint at or before a given time
+        @param _share OrgShare contract address
+        @param _time Epoch time to search from
+        @return uint256 epoch time of checkpoint, or 0 if none exists
+     */
+    function checkpointBefore(
+        address _share,
+        uint256 _time
+    )
+        external
+        view
+        returns (uint256)
+    {
+        uint256 _idx = _searchTimeline(timeline[_share], 0, _time);
+        if (_idx == 0) return 0;
+        return timeline[_share][_idx - 1];
+    }
 
     /**
         @notice Query share checkpoint totalSupply
@@ -100,9 +141,28 @@ contract MultiCheckpointModule is OrgModuleBase {
         view
         returns (uint256)
     {
-        _advanceCheckpoints(_share);
-        require(checkpointData[_share][_time].set);
-        return checkpointData[_share][_time].totalSupply;
+        return _totalSupplyAt(IOrgShareBase(_share), _time);
+    }
+
+    /**
+        @notice Query checkpoint totalSupply for many shares
+        @param _shares Array of OrgShare contract addresses
+        @param _time Checkpoint time
+        @return array of totalSupply at checkpoint
+     */
+    function totalSuppliesAt(
+        address[] _shares,
+        uint256 _time
+    )
+        external
+        view
+        returns (uint256[] _supply)
+    {
+        _supply = new uint256[](_shares.length);
+        for (uint256 i; i < _shares.length; i++) {
+            _supply[i] = _totalSupplyAt(IOrgShareBase(_shares[i]), _time);
+        }
+        return _supply;
     }
 
     /**
@@ -121,14 +181,30 @@ contract MultiCheckpointModule is OrgModuleBase {
         view
         returns (uint256)
     {
-        _advanceCheckpoints(_share);
-        Checkpoint storage c = checkpointData[_share][_time];
-        require(c.set);
-        if (c.balances[_owner] > 0) return c.balances[_owner];
-        if (c.zeroBalances[_owner]) return 0;
-        uint256 _value = _share.balanceOf(_owner);
-        _setBalance(c, _owner, _value);
-        return _value;
+        return _balanceAt(_share, _owner, _time);
+    }
+
+    /**
+        @notice Query checkpoint balances for many shares
+        @param _shares Array of OrgShare contract addresses
+        @param _owner Address of balance to query
+        @param _time Checkpoint time
+        @return array of balances at checkpoint
+     */
+    function balancesAt(
+        address[] _shares,
+        address _owner,
+        uint256 _time
+    )
+        external
+        view
+        returns (uint256[] _balances)
+    {
+        _balances = new uint256[](_shares.length);
+        for (uint256 i; i < _shares.length; i++) {
+            _balances[i] = _balanceAt(IOrgShareBase(_shares[i]), _owner, _time);
+        }
+        return _balances;
     }
 
     /**
@@ -149,71 +225,164 @@ contract MultiCheckpointModule is OrgModuleBase {
         view
         returns (uint256)
     {
-        _advanceCheckpoints(_share);
-        Checkpoint storage c = checkpointData[_share][_time];
-        require(c.set);
-        if (c.custBalances[_owner][_cust] > 0) {
-            return c.custBalances[_owner][_cust];
-        }
-        if (c.custZeroBalances[_owner][_cust]) return 0;
-        uint256 _value = _share.custodianBalanceOf(_owner, _cust);
-        _setCustodianBalance(c, _owner, _cust, _value);
-        return _value;
+        return _custodianBalanceAt(_share, _owner, _cust, _time);
     }
 
     /**
-        @notice Store a checkpoint balance
-        @param c Checkpoint storage pointer
-        @param _owner Address to set
-        @param _value Balance at address
+        @notice Query checkpoint custodied balances for many shares
+        @param _shares Array of OrgShare contract addresses
+        @param _owner Address of balance to query
+        @param _cust Custodian address
+        @param _time Checkpoint time
+        @return array of balances at checkpoint
      */
-    function _setBalance(
-        Checkpoint storage c,
+    function custodianBalancesAt(
+        address[] _shares,
         address _owner,
-        uint256 _value
+        address _cust,
+        uint256 _time
     )
-        private
+        external
+        view
+        returns (uint256[] _balances)
     {
-        while (true) {
-            if (c.balances[_owner] > 0 || c.zeroBalances[_owner]) return;
-            if (_value == 0) {
-                c.zeroBalances[_owner] = true;
-            } else {
-                c.balances[_owner] = _value;
-            }
-            if (c.previous == 0) return;
-            c = checkpointData[msg.sender][c.previous];
+        _balances = new uint256[](_shares.length);
+        for (uint256 i; i < _shares.length; i++) {
+            _balances[i] = _custodianBalanceAt(
+                IOrgShareBase(_shares[i]),
+                _owner,
+                _cust,
+                _time
+            );
         }
+        return _balances;
     }
 
     /**
-        @notice Store custodian checkpoint balance after shares are received
-        @param c Checkpoint storage pointer
-        @param _owner Address of owner
-        @param _cust Address of custodian
-        @param _value Amount transferred
+        @notice Internal - query share checkpoint totalSupply
+        @param _share OrgShare contract address
+        @param _time Checkpoint time
+        @return uint256 totalSupply at checkpoint
      */
-    function _setCustodianBalance(
-        Checkpoint storage c,
+    function _totalSupplyAt(
+        IOrgShareBase _share,
+        uint256 _time
+    )
+        internal
+        view
+        returns (uint256)
+    {
+        require(checkpointSet[_share][_time]);
+        (bool _found, uint256 _value) = _findSnapshot(supplyHistory[_share], _time);
+        if (_found) return _value;
+        return _share.totalSupply();
+    }
+
+    /**
+        @notice Internal - query share checkpoint balance
+        @param _share OrgShare contract address
+        @param _owner Address of balance to query
+        @param _time Checkpoint time
+        @return uint256 balance at checkpoint
+     */
+    function _balanceAt(
+        IOrgShareBase _share,
+        address _owner,
+        uint256 _time
+    )
+        internal
+        view
+        returns (uint256)
+    {
+        require(checkpointSet[_share][_time]);
+        (bool _found, uint256 _value) = _findSnapshot(
+            balanceHistory[_share][_owner],
+            _time
+        );
+        if (_found) return _value;
+        return _share.balanceOf(_owner);
+    }
+
+    /**
+        @notice Internal - query share checkpoint custodied balance
+        @param _share OrgShare contract address
+        @param _owner Address of balance to query
+        @param _cust Custodian address
+        @param _time Checkpoint time
+        @return uint256 balance at checkpoint
+     */
+    function _custodianBalanceAt(
+        IOrgShareBase _share,
         address _owner,
         address _cust,
-        uint256 _value
+        uint256 _time
+    )
+        internal
+        view
+        returns (uint256)
+    {
+        require(checkpointSet[_share][_time]);
+        (bool _found, uint256 _value) = _findSnapshot(
+            custHistory[_share][_owner][_cust],
+            _time
+        );
+        if (_found) return _value;
+        return _share.custodianBalanceOf(_owner, _cust);
+    }
+
+    /**
+        @notice Search a balance history for the value at a checkpoint
+        @dev Binary search for the earliest snapshot at or after _time
+        @param h Balance history storage pointer
+        @param _time Checkpoint time
+        @return bool was a snapshot found?
+        @return uint256 balance at checkpoint
+     */
+    function _findSnapshot(
+        Snapshot[] storage h,
+        uint256 _time
     )
         private
+        view
+        returns (bool, uint256)
     {
-        while (true) {
-            if (
-                c.custBalances[_owner][_cust] > 0 ||
-                c.custZeroBalances[_owner][_cust]
-            ) return;
-            if (_value == 0) {
-                c.custZeroBalances[_owner][_cust] = true;
+        uint256 _low = 0;
+        uint256 _high = h.length;
+        while (_low < _high) {
+            uint256 _mid = (_low + _high) / 2;
+            if (h[_mid].time < _time) {
+                _low = _mid + 1;
             } else {
-                c.custBalances[_owner][_cust] = _value;
+                _high = _mid;
             }
-            if (c.previous == 0) return;
-            c = checkpointData[msg.sender][c.previous];
         }
+        if (_low == h.length) return (false, 0);
+        return (true, h[_low].value);
+    }
+
+    /**
+        @notice Store a checkpoint balance
+        @dev
+            When the checkpoint pointers are current, only the first change
+            after a checkpoint is recorded. If they are still catching up the
+            most recent checkpoint is unknown, so the change is always stored.
+        @param h Balance history storage pointer
+        @param _previous Time of most recently passed checkpoint
+        @param _current Are the checkpoint pointers fully advanced?
+        @param _value Balance before the change
+     */
+    function _setBalance(
+        Snapshot[] storage h,
+        uint256 _previous,
+        bool _current,
+        uint256 _value
+    )
+        private
+    {
+        uint256 _length = h.length;
+        if (_current && _length > 0 && h[_length - 1].time >= _previous) return;
+        require(uint192(_value) == _value);
+        h.push(Snapshot(uint64(now), uint192(_value)));
     }
 
     /**
@@ -235,25 +404,27 @@ contract MultiCheckpointModule is OrgModuleBase {
         returns (bool)
     {
         _onlyShare();
-        uint256 _previous = _advanceCheckpoints(msg.sender);
-        if (_previous == 0) return true;
-        Checkpoint storage c = checkpointData[msg.sender][_previous];
+        (uint256 _previous, bool _current) = _advanceCheckpoints(
+            msg.sender,
+            MAX_HOOK_STEPS
+        );
+        if (_current && _previous == 0) return true;
         IOrgShareBase _share = IOrgShareBase(msg.sender);
         uint256 _bal;
 
         if (_rating[0] == 0 && _id[0] != ownerID) {
             _bal = _share.custodianBalanceOf(_addr[1], _addr[0]).add(_value);
-            _setCustodianBalance(c, _addr[1], _addr[0], _bal);
+            _setBalance(custHistory[msg.sender][_addr[1]][_addr[0]], _previous, _current, _bal);
         } else {
             _bal = _share.balanceOf(_addr[0]).add(_value);
-            _setBalance(c, _addr[0], _bal);
+            _setBalance(balanceHistory[msg.sender][_addr[0]], _previous, _current, _bal);
         }
         if (_rating[1] == 0 && _id[1] != ownerID) {
             _bal = _share.custodianBalanceOf(_addr[0], _addr[1]).sub(_value);
-            _setCustodianBalance(c, _addr[0], _addr[1], _bal);
+            _setBalance(custHistory[msg.sender][_addr[0]][_addr[1]], _previous, _current, _bal);
         } else {
             _bal = _share.balanceOf(_addr[1]).sub(_value);
-            _setBalance(c, _addr[1], _bal);
+            _setBalance(balanceHistory[msg.sender][_addr[1]], _previous, _current, _bal);
         }
         return true;
     }
@@ -277,15 +448,17 @@ contract MultiCheckpointModule is OrgModuleBase {
         returns (bool)
     {
         _onlyShare();
-        uint256 _previous = _advanceCheckpoints(msg.sender);
-        if (_previous == 0) return true;
-        Checkpoint storage c = checkpointData[msg.sender][_previous];
+        (uint256 _previous, bool _current) = _advanceCheckpoints(
+            msg.sender,
+            MAX_HOOK_STEPS
+        );
+        if (_current && _previous == 0) return true;
 
         IOrgShareBase _share = IOrgShareBase(msg.sender);
         uint256 _bal = _share.custodianBalanceOf(_addr[0], _cust).add(_value);
-        _setCustodianBalance(c, _addr[0], _cust, _bal);
+        _setBalance(custHistory[msg.sender][_addr[0]][_cust], _previous, _current, _bal);
         _bal = _share.custodianBalanceOf(_addr[1], _cust).sub(_value);
-        _setCustodianBalance(c, _addr[1], _cust, _bal);
+        _setBalance(custHistory[msg.sender][_addr[1]][_cust], _previous, _current, _bal);
         return true;
     }
 
@@ -308,40 +481,103 @@ contract MultiCheckpointModule is OrgModuleBase {
         returns (bool)
     {
         _onlyShare();
-        _advanceCheckpoints(msg.sender);
-        uint64 _next = pointers[msg.sender].next;
-        if (_next == 0) return true;
-        Checkpoint storage c = checkpointData[msg.sender][_next];
-        c.totalSupply = c.totalSupply.add(_new).sub(_old);
-        _setBalance(c, _addr, _old);
+        (uint256 _previous, bool _current) = _advanceCheckpoints(
+            msg.sender,
+            MAX_HOOK_STEPS
+        );
+        if (_current && _previous == 0) return true;
+        uint256 _supply = IOrgShareBase(msg.sender).totalSupply().add(_old).sub(_new);
+        _setBalance(supplyHistory[msg.sender], _previous, _current, _supply);
+        _setBalance(balanceHistory[msg.sender][_addr], _previous, _current, _old);
         return true;
     }
 
     /**
-        @notice Advance share checkpoint and modify total supply
+        @notice Advance share checkpoint pointers
+        @dev
+            Callable by anyone. Transfers only advance a limited number of
+            checkpoints, this method may be used to catch up the remainder.
         @param _share Share address of checkpoint to advance
+        @param _maxSteps Maximum number of checkpoints to advance
+        @return bool are the checkpoint pointers fully advanced?
+     */
+    function advanceCheckpoints(
+        address _share,
+        uint256 _maxSteps
+    )
+        external
+        returns (bool)
+    {
+        (, bool _current) = _advanceCheckpoints(_share, _maxSteps);
+        return _current;
+    }
+
+    /**
+        @notice Internal - advance share checkpoint pointers
+        @param _share Share address of checkpoint to advance
+        @param _maxSteps Maximum number of checkpoints to advance
         @return epoch time of most recently passed checkpoint
+        @return bool are the checkpoint pointers fully advanced?
      */
-    function _advanceCheckpoints(address _share) private returns (uint256) {
-        EpochPointers storage p = pointers[_share];
-        if (p.next > now || p.next == 0) {
-            return p.previous;
+    function _advanceCheckpoints(
+        address _share,
+        uint256 _maxSteps
+    )
+        private
+        returns (uint256, bool)
+    {
+        uint64[] storage t = timeline[_share];
+        uint256 _start = nextIndex[_share];
+        uint256 i = _start;
+        bool _current = true;
+        for (; i < t.length && t[i] <= now; i++) {
+            if (i == _start + _maxSteps) {
+                _current = false;
+                break;
+            }
         }
-        Checkpoint storage c = checkpointData[_share][p.next];
-        uint64 _prev = p.next;
-        while (c.next != 0) {
-            checkpointData[_share][c.next].totalSupply = c.totalSupply;
-            if (c.next > now) break;
-            _prev = c.next;
-            c = checkpointData[_share][c.next];
+        if (i != _start) nextIndex[_share] = i;
+        if (i == 0) return (0, _current);
+        return (t[i - 1], _current);
+    }
+
+    /**
+        @notice Internal - binary search a checkpoint timeline
+        @param t Timeline storage pointer
+        @param _low Lowest index to search from
+        @param _time Epoch time to search for
+        @return uint256 index of first checkpoint later than _time
+     */
+    function _searchTimeline(
+        uint64[] storage t,
+        uint256 _low,
+        uint256 _time
+    )
+        private
+        view
+        returns (uint256)
+    {
+        uint256 _high = t.length;
+        while (_low < _high) {
+            uint256 _mid = (_low + _high) / 2;
+            if (t[_mid] > _time) {
+                _high = _mid;
+            } else {
+                _low = _mid + 1;
+            }
         }
-        pointers[_share] = EpochPointers(_prev, c.next);
-        return _prev;
+        return _low;
     }
 
     /**
         @notice Set a new checkpoint
-        @dev callable by a permitted authority or share module
+        @dev
+            Callable by a permitted authority or share module. The timeline
+            is kept sorted, so a checkpoint set earlier than other pending
+            checkpoints shifts each of them up one slot. The cost is one
+            storage write per pending checkpoint after the new one.
+            Appending a checkpoint later than all pending ones costs a
+            single write.
         @param _share OrgShare contract address to set checkpoint for
         @param _time Epoch time to set checkpoint at
         @return bool success
@@ -358,24 +594,17 @@ contract MultiCheckpointModule is OrgModuleBase {
         if (!_share.isPermittedModule(msg.sender, 0x17020cc7)) {
             if (!_onlyAuthority()) return false;
         }
-        require(!checkpointData[_share][_time].set); // dev: already set
-        mapping(uint256 => Checkpoint) c = checkpointData[_share];
-        if (pointers[_share].next == 0 || _time < pointers[_share].next) {
-            EpochPointers memory p = pointers[_share];
-            pointers[_share].next = _time;
-            c[_time].totalSupply = _share.totalSupply();
-        } else {
-            uint64 _previous = pointers[_share].next;
-            while (c[_previous].next != 0 && c[_previous].next < _time) {
-                _previous = c[_previous].next;
-            }
-            p = EpochPointers(_previous, c[_previous].next);
+        require(!checkpointSet[_share][_time]); // dev: already set
+        checkpointSet[_share][_time] = true;
+
+        /* checkpoints before nextIndex have passed and are never shifted */
+        uint64[] storage t = timeline[_share];
+        uint256 _idx = _searchTimeline(t, nextIndex[_share], _time);
+        t.length++;
+        for (uint256 i = t.length - 1; i > _idx; i--) {
+            t[i] = t[i - 1];
         }
-        c[p.previous].next = _time;
-        if (p.next != 0) c[p.next].previous = _time;
-        c[_time].previous = p.previous;
-        c[_time].next = p.next;
-        c[_time].set = true;
+        t[_idx] = _time;
         emit CheckpointSet(_share, _time);
         return true;
     }
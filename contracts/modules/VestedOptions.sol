@@ -14,6 +14,7 @@ contract VestedOptions is BookShareModuleBase {
 
     using SafeMath for uint256;
     using SafeMath32 for uint32;
+    using SafeMath64 for uint64;
 
     string public constant name = "Options";
     uint256 constant FINAL_MONTH = 4294944000;
@@ -23,6 +24,11 @@ contract VestedOptions is BookShareModuleBase {
     uint32 public expirationMonths;
     uint32 public gracePeriodMonths;
     uint64 total;
+    uint64 totalVested;
+    uint64 totalExpired;
+
+    /** only the tranche list is used, totals are stored above as uint64 */
+    OptionTotal globalTotal;
 
     /** linked list */
     uint32 totalLength;
@@ -30,10 +36,13 @@ contract VestedOptions is BookShareModuleBase {
     mapping (uint32 => OptionTotal) public totalAtPrice;
     mapping (bytes32 => mapping (uint32 => OptionBase)) optionData;
 
+    /** exercise prices held by each member, sorted ascending */
+    mapping (bytes32 => uint32[]) memberPrices;
+
     /**
-        vestMap is a array of [vested total, expired total] where each entry
-        corresponds to a 30 day period, descending from FINAL_MONTH. length of
-        1657 == 2**32 // 2592000 (seconds in 30 days)
+        tranches is a linked list of [vesting total, expiring total] keyed by
+        month number, where each month corresponds to a 30 day period.
+        nextMonth is the earliest month that has not been processed.
      */
     struct OptionTotal {
         uint32 vested;
@@ -41,22 +50,36 @@ contract VestedOptions is BookShareModuleBase {
         uint32 prev;
         uint32 next;
         uint32 length;
-        uint32[2][1657] vestMap;
+        uint32 nextMonth;
+        mapping (uint32 => TotalTranche) tranches;
+    }
+
+    struct TotalTranche {
+        uint64 vesting;
+        uint64 expiring;
+        uint32 next;
     }
 
     struct OptionBase {
         uint32 start;
         uint32 length;
+        bool listed;
         Option[1657] options;
     }
 
+    /**
+        tranches is sorted by month number ascending, cursor is the index of
+        the first unvested tranche. Each tranche is packed as
+        (month << 32 | amount), four to a storage slot.
+     */
     struct Option {
         bool iso;
         uint32 vested;
         uint32 unvested;
         uint32 expiryDate;
         uint32 length;
-        uint32[1657] vestMap;
+        uint32 cursor;
+        uint64[] tranches;
     }
 
     event EthPegSet(uint256 peg);
@@ -130,16 +153,32 @@ contract VestedOptions is BookShareModuleBase {
         emit EthPegSet(_ethPeg);
     }
 
+    /**
+        @notice get the total number of unexercised, unexpired options
+        @return integer
+     */
     function totalOptions() public view returns (uint256) {
-        uint32 _price = totalLimits[0];
-        while (_price != 0) {
-            uint32 _next = totalAtPrice[_price].next;
-            _updateOptionTotal(_price);
-            _price = _next;
-        }
+        _updateGlobalTotal();
         return total;
     }
 
+    /**
+        @notice get the global option totals
+        @return vested total, unvested total, expired total
+     */
+    function getTotals()
+        external
+        view
+        returns (
+            uint256 _vestedTotal,
+            uint256 _unvestedTotal,
+            uint256 _expiredTotal
+        )
+    {
+        _updateGlobalTotal();
+        return (totalVested, total.sub(totalVested), totalExpired);
+    }
+
     /**
         @notice get total amount of vested options at each exercise price
         @dev array is sorted by exercise price ascending
@@ -153,10 +192,15 @@ contract VestedOptions is BookShareModuleBase {
             uint256[] _totals
         )
     {
-        totalOptions();
+        uint32 _price = totalLimits[0];
+        while (_price != 0) {
+            uint32 _next = totalAtPrice[_price].next;
+            _updateOptionTotal(_price);
+            _price = _next;
+        }
         _exercisePrices = new uint256[](totalLength);
         _totals = new uint256[](totalLength);
-        uint32 _price = totalLimits[0];
+        _price = totalLimits[0];
         for (uint256 i; i < _totals.length; i++) {
             _exercisePrices[i] = _price;
             _totals[i] = totalAtPrice[_price].vested;
@@ -200,32 +244,18 @@ contract VestedOptions is BookShareModuleBase {
             uint256[2][] _exercisePrices
         )
     {
-        uint256 _length;
-        uint32 _price = totalLimits[0];
-        while (_price != 0) {
-            uint32 _next = totalAtPrice[_price].next;
-            if (_updateOptionBase(_id, _price)) {
-                _length++;
+        uint32[] storage _prices = _updateMemberPrices(_id);
+        _exercisePrices = new uint256[2][](_prices.length);
+        for (uint256 i; i < _prices.length; i++) {
+            OptionBase storage o = optionData[_id][_prices[i]];
+            uint256 x = o.start;
+            uint256 _end = x + o.length;
+            _exercisePrices[i] = [uint256(_prices[i]), o.length];
+            for (x; x < _end; x++) {
+                _updateOption(o.options[x]);
+                _vestedTotal = _vestedTotal.add(o.options[x].vested);
+                _unvestedTotal = _unvestedTotal.add(o.options[x].unvested);
             }
-            _price = _next;
-        }
-        _exercisePrices = new uint256[2][](_length);
-        _price = totalLimits[0];
-        uint256 i;
-        while (_price != 0) {
-            OptionBase storage o = optionData[_id][_price];
-            if (o.length > 0) {
-                uint256 x = o.start;
-                uint256 _end = x + o.length;
-                _exercisePrices[i] = [uint256(_price), o.length];
-                i++;
-                for (x; x < _end; x++) {
-                    _updateOption(o.options[x]);
-                    _vestedTotal = _vestedTotal.add(o.options[x].vested);
-                    _unvestedTotal = _unvestedTotal.add(o.options[x].unvested);
-                }
-            }
-            _price = totalAtPrice[_price].next;
         }
         return (_vestedTotal, _unvestedTotal, _exercisePrices);
     }
@@ -259,8 +289,13 @@ contract VestedOptions is BookShareModuleBase {
         Option storage o = b.options[_idx];
 
         _vestMap = new uint32[](o.length);
-        for (uint256 i; i < _vestMap.length; i++) {
-            _vestMap[i] = o.vestMap[_vestMap.length-1-i];
+        uint256 _expires = _getExpiryMonth(o);
+        for (uint256 i = o.cursor; i < o.tranches.length; i++) {
+            uint64 _tranche = o.tranches[i];
+            uint256 x = _expires.sub(uint32(_tranche >> 32));
+            if (x < _vestMap.length) {
+                _vestMap[_vestMap.length-1-x] = uint32(_tranche);
+            }
         }
 
         return (o.vested, o.unvested, o.iso, o.expiryDate, _vestMap);
@@ -284,24 +319,22 @@ contract VestedOptions is BookShareModuleBase {
             uint256 _totalExercisePrice
         )
     {
-        uint32 _price = totalLimits[0];
-        while (_price != 0 && _price < _perShareConsideration) {
+        uint32[] storage _prices = _updateMemberPrices(_id);
+        for (uint256 i; i < _prices.length; i++) {
+            uint32 _price = _prices[i];
+            if (_price >= _perShareConsideration) break;
             OptionBase storage b = optionData[_id][_price];
-            uint32 _next = totalAtPrice[_price].next;
-            if (_updateOptionBase(_id, _price)) {
-                uint256 _total = 0;
-                uint256 x = b.start;
-                uint256 _end = x + b.length;
-                for (x; x < _end; x++) {
-                    Option storage o = b.options[x];
-                    _updateOption(o);
-                    if (o.vested == 0) continue;
-                    _total = _total.add(o.vested);
-                    _totalExercisePrice = _totalExercisePrice.add(o.vested.mul(_price));
-                }
-                _optionCount = _optionCount.add(_total);
+            uint256 _total = 0;
+            uint256 x = b.start;
+            uint256 _end = x + b.length;
+            for (x; x < _end; x++) {
+                Option storage o = b.options[x];
+                _updateOption(o);
+                if (o.vested == 0) continue;
+                _total = _total.add(o.vested);
+                _totalExercisePrice = _totalExercisePrice.add(o.vested.mul(_price));
             }
-            _price = _next;
+            _optionCount = _optionCount.add(_total);
         }
         return (_optionCount, _totalExercisePrice);
     }
@@ -343,36 +376,134 @@ contract VestedOptions is BookShareModuleBase {
         require(_price > 0); // dev: exercise price == 0
         require(_amount.length == _monthsToVest.length); // dev: length mismatch
 
-        /* get storage structs */
+        /* get storage struct */
+        _updateGlobalTotal();
         OptionTotal storage t = _addExercisePrice(_price);
-        Option storage o = _saveOption(_id, _price, _iso);
-
-        uint32 _total;
-        uint256[2] memory _max = [t.length - 1, uint256(expirationMonths)];
-
-        for (uint256 i; i < _amount.length; i++) {
-            require(_monthsToVest[i] < _max[1]); // dev: vest > expiration
-            /* add to Option and OptionTotal vestMaps */
-            uint256 _idx = _max[0] - _monthsToVest[i];
-            t.vestMap[_idx][0] = t.vestMap[_idx][0].add(_amount[i]);
-            _idx = _max[1] - _monthsToVest[i];
-            o.vestMap[_idx] = o.vestMap[_idx].add(_amount[i]);
-            _total = _total.add(_amount[i]);
-        }
-
-        /* store expiration amount */
-        _idx = _max[0] - _max[1];
-        t.vestMap[_idx][1] = t.vestMap[_idx][1].add(_total);
+        uint32 _total = _issueOptions(t, _id, _price, _iso, _amount, _monthsToVest);
 
         /* increase totals, final check */
-        o.unvested = o.unvested.add(_total);
         t.unvested = t.unvested.add(_total);
-        total += _total;
+        total = total.add(_total);
+        require(orgShare.authorizedSupply().sub(orgShare.totalSupply()) >= total); // dev: exceeds authorized
+        return true;
+    }
+
+    /**
+        @notice issue new options to many members
+        @dev
+            vesting amounts and months for every grant are concatenated, _tranches
+            gives the number of array items used by each grant. Grants with the
+            same exercise price should be adjacent so the price totals are only
+            updated once.
+        @param _id array of member IDs
+        @param _price array of exercise prices
+        @param _iso array of iso bools
+        @param _amount concatenated array of option quantities
+        @param _monthsToVest concatenated array of months to vest
+        @param _tranches array of vesting array lengths for each grant
+        @return bool success
+     */
+    function issueOptionsBatch(
+        bytes32[] _id,
+        uint32[] _price,
+        bool[] _iso,
+        uint32[] _amount,
+        uint32[] _monthsToVest,
+        uint16[] _tranches
+    )
+        public
+        returns (bool)
+    {
+        if (!_onlyAuthority()) return false;
+        require(_id.length == _price.length); // dev: length mismatch
+        require(_id.length == _iso.length); // dev: length mismatch
+        require(_id.length == _tranches.length); // dev: length mismatch
+        require(_amount.length == _monthsToVest.length); // dev: length mismatch
+        _updateGlobalTotal();
+
+        uint256 _offset;
+        uint256 i;
+        while (i < _id.length) {
+            require(_price[i] > 0); // dev: exercise price == 0
+            OptionTotal storage t = _addExercisePrice(_price[i]);
+            uint32 _total = 0;
+            /* issue all adjacent grants at this exercise price */
+            do {
+                require(_offset + _tranches[i] <= _amount.length); // dev: length mismatch
+                uint32[] memory _vestAmount = _slice(_amount, _offset, _tranches[i]);
+                uint32[] memory _vestMonths = _slice(_monthsToVest, _offset, _tranches[i]);
+                _offset += _tranches[i];
+                uint32 _issued = _issueOptions(
+                    t,
+                    _id[i],
+                    _price[i],
+                    _iso[i],
+                    _vestAmount,
+                    _vestMonths
+                );
+                _total = _total.add(_issued);
+                i++;
+            } while (i < _id.length && _price[i] == _price[i-1]);
+            t.unvested = t.unvested.add(_total);
+            total = total.add(_total);
+        }
+        require(_offset == _amount.length); // dev: length mismatch
         require(orgShare.authorizedSupply().sub(orgShare.totalSupply()) >= total); // dev: exceeds authorized
-        emit NewOptions( _id, _iso, _price, o.expiryDate, _amount, _monthsToVest);
         return true;
     }
 
+    /**
+        @notice Shared logic for issuing options to a single member
+        @dev does not modify OptionTotal or global totals
+        @param t OptionTotal storage pointer
+        @param _id member ID
+        @param _price exercise price for options being issued
+        @param _iso iso bool
+        @param _amount array, quantities of options to issue
+        @param _monthsToVest array, relative time for options to vest (months from now)
+        @return total number of options issued
+     */
+    function _issueOptions(
+        OptionTotal storage t,
+        bytes32 _id,
+        uint32 _price,
+        bool _iso,
+        uint32[] memory _amount,
+        uint32[] memory _monthsToVest
+    )
+        internal
+        returns (uint32 _total)
+    {
+        Option storage o = _saveOption(_id, _price, _iso);
+        _total = _addTranches(t, o, _amount, _monthsToVest);
+        o.unvested = o.unvested.add(_total);
+        emit NewOptions(_id, _iso, _price, o.expiryDate, _amount, _monthsToVest);
+        return _total;
+    }
+
+    /**
+        @notice Copy part of an array into a new memory array
+        @param _array array to copy from
+        @param _start index to start copying from
+        @param _length number of items to copy
+        @return memory array
+     */
+    function _slice(
+        uint32[] memory _array,
+        uint256 _start,
+        uint256 _length
+    )
+        internal
+        pure
+        returns (uint32[] memory _result)
+    {
+        _result = new uint32[](_length);
+        for (uint256 i; i < _length; i++) {
+            _result[i] = _array[_start + i];
+        }
+        return _result;
+    }
+
     /**
         @notice Add an exercise price to totalAtPrice linked list
         @param _price exercise price to add
@@ -418,6 +549,140 @@ contract VestedOptions is BookShareModuleBase {
         return t;
     }
 
+    /**
+        @notice Add vesting tranches for newly issued options
+        @param t OptionTotal storage pointer
+        @param o Option storage pointer
+        @param _amount array, quantities of options to issue
+        @param _monthsToVest array, relative time for options to vest (months from now)
+        @return total number of options issued
+     */
+    function _addTranches(
+        OptionTotal storage t,
+        Option storage o,
+        uint32[] memory _amount,
+        uint32[] memory _monthsToVest
+    )
+        internal
+        returns (uint32 _total)
+    {
+        uint32 _month = _getMonth().add(1);
+        uint32[2] memory _hint;
+
+        for (uint256 i; i < _amount.length; i++) {
+            require(_monthsToVest[i] < expirationMonths); // dev: vest > expiration
+            /* add to Option, OptionTotal and global tranches */
+            uint32 _vestMonth = _month.add(_monthsToVest[i]);
+            _addOptionTranche(o, _vestMonth, _amount[i]);
+            _hint[0] = _addTotalTranche(t, _hint[0], _vestMonth, _amount[i], 0);
+            _hint[1] = _addTotalTranche(globalTotal, _hint[1], _vestMonth, _amount[i], 0);
+            _total = _total.add(_amount[i]);
+        }
+
+        /* store expiration amount */
+        _month = _getExpiryMonth(o);
+        _addTotalTranche(t, _hint[0], _month, 0, _total);
+        _addTotalTranche(globalTotal, _hint[1], _month, 0, _total);
+        return _total;
+    }
+
+    /**
+        @notice Add an amount to an Option tranche
+        @dev tranches are usually added in ascending order, so search from the end
+        @param o Option storage pointer
+        @param _month month number that the tranche vests
+        @param _amount number of options in the tranche
+     */
+    function _addOptionTranche(
+        Option storage o,
+        uint32 _month,
+        uint32 _amount
+    )
+        internal
+    {
+        uint256 i = o.tranches.length;
+        while (i > o.cursor && uint32(o.tranches[i-1] >> 32) > _month) {
+            i--;
+        }
+        if (i > o.cursor && uint32(o.tranches[i-1] >> 32) == _month) {
+            _amount = _amount.add(uint32(o.tranches[i-1]));
+            o.tranches[i-1] = uint64(_month) << 32 | _amount;
+            return;
+        }
+        o.tranches.length++;
+        for (uint256 x = o.tranches.length - 1; x > i; x--) {
+            o.tranches[x] = o.tranches[x-1];
+        }
+        o.tranches[i] = uint64(_month) << 32 | _amount;
+    }
+
+    /**
+        @notice Add vesting and expiring amounts to an OptionTotal tranche
+        @param t OptionTotal storage pointer
+        @param _hint month number in the linked list to begin searching from
+        @param _month month number of the tranche
+        @param _vesting amount vesting in this month
+        @param _expiring amount expiring in this month
+        @return month number, to be used as the hint for the next call
+     */
+    function _addTotalTranche(
+        OptionTotal storage t,
+        uint32 _hint,
+        uint32 _month,
+        uint64 _vesting,
+        uint64 _expiring
+    )
+        internal
+        returns (uint32)
+    {
+        uint32 _prev = (_hint < _month ? _hint : 0);
+        uint32 _next = (_prev == 0 ? t.nextMonth : t.tranches[_prev].next);
+        while (_next != 0 && _next < _month) {
+            _prev = _next;
+            _next = t.tranches[_next].next;
+        }
+        TotalTranche storage x = t.tranches[_month];
+        if (_next == _month) {
+            x.vesting = x.vesting.add(_vesting);
+            x.expiring = x.expiring.add(_expiring);
+            return _month;
+        }
+        /* add new entry, overwriting any values from a removed list */
+        x.vesting = _vesting;
+        x.expiring = _expiring;
+        x.next = _next;
+        if (_prev == 0) {
+            t.nextMonth = _month;
+        } else {
+            t.tranches[_prev].next = _month;
+        }
+        return _month;
+    }
+
+    /**
+        @notice Remove vesting and expiring amounts from OptionTotal and global tranches
+        @dev the tranche must not have been processed yet
+        @param t OptionTotal storage pointer
+        @param _month month number of the tranche
+        @param _vesting amount to remove from vesting total
+        @param _expiring amount to remove from expiring total
+     */
+    function _reduceTranche(
+        OptionTotal storage t,
+        uint32 _month,
+        uint64 _vesting,
+        uint64 _expiring
+    )
+        internal
+    {
+        TotalTranche storage x = t.tranches[_month];
+        x.vesting = x.vesting.sub(_vesting);
+        x.expiring = x.expiring.sub(_expiring);
+        x = globalTotal.tranches[_month];
+        x.vesting = x.vesting.sub(_vesting);
+        x.expiring = x.expiring.sub(_expiring);
+    }
+
     /**
         @notice Extends an OptionData array if needed, and returns an Option struct
         @param _id member ID
@@ -434,6 +699,18 @@ contract VestedOptions is BookShareModuleBase {
     {
         uint32 _expires = _getEpoch(expirationMonths + 1);
         OptionBase storage b = optionData[_id][_price];
+        if (!b.listed) {
+            /* add exercise price to sorted member price array */
+            b.listed = true;
+            uint32[] storage _prices = memberPrices[_id];
+            uint256 x = _prices.length;
+            _prices.length++;
+            while (x > 0 && _prices[x-1] > _price) {
+                _prices[x] = _prices[x-1];
+                x--;
+            }
+            _prices[x] = _price;
+        }
         uint256 i = b.length + b.start;
         if (b.length > 0 && b.options[i-1].expiryDate == _expires) {
             /* struct exists for this expiration date */
@@ -470,6 +747,7 @@ contract VestedOptions is BookShareModuleBase {
         require (ethPeg.mul(_amount).mul(_price) == msg.value, "Incorrect payment");
 
         bytes32 _id = orgCode.getID(msg.sender);
+        _updateGlobalTotal();
         require(_updateOptionBase(_id, _price), "No options at this price");
 
         uint32 _remaining = _amount;
@@ -480,22 +758,26 @@ contract VestedOptions is BookShareModuleBase {
             Option storage o = b.options[i];
             _updateOption(o);
             if (o.vested == 0) continue;
-            if (o.vested <= _remaining) {
-                _remaining = _remaining.sub(o.vested);
-                o.vested = 0;
-                if (o.unvested == 0) {
-                    o.length = 0;
-                }
-            } else {
-                o.vested = o.vested.sub(_remaining);
-                _remaining = 0;
+            uint32 _exercised = (o.vested < _remaining ? o.vested : _remaining);
+            o.vested = o.vested.sub(_exercised);
+            _remaining = _remaining.sub(_exercised);
+            if (o.vested == 0 && o.unvested == 0) {
+                o.length = 0;
             }
+            /* exercised options no longer expire */
+            _reduceTranche(
+                totalAtPrice[_price],
+                _getExpiryMonth(o),
+                0,
+                _exercised
+            );
             if (_remaining > 0) continue;
 
             /* success! reduce totals */
             totalAtPrice[_price].vested = totalAtPrice[_price].vested.sub(_amount);
             _removeOptionTotal(_price);
-            total -= _amount;
+            total = total.sub(_amount);
+            totalVested = totalVested.sub(_amount);
 
             /* transfer eth, mint shares */
             receiver.transfer(address(this).balance);
@@ -513,26 +795,25 @@ contract VestedOptions is BookShareModuleBase {
      */
     function accellerateVesting(bytes32 _id) external returns (bool) {
         if (!_onlyAuthority()) return false;
+        _updateGlobalTotal();
 
         uint32 _grandTotal;
-        uint32 _price = totalLimits[0];
+        uint32[] storage _prices = _updateMemberPrices(_id);
 
         /* iterate exercise prices */
-        while (_price != 0) {
-            uint32 _next = totalAtPrice[_price].next;
-            if (_updateOptionBase(_id, _price)) {
-                OptionBase storage b = optionData[_id][_price];
-                uint32 _total = 0;
-                /* remove unvested totals from Option vestMaps */
-                _total = _accellerateOrTerminate(b, _price, 0);
-                if (_total > 0) {
-                    /* modify totals */
-                    totalAtPrice[_price].vested = totalAtPrice[_price].vested.add(_total);
-                    _grandTotal = _grandTotal.add(_total);
-                }
+        for (uint256 i; i < _prices.length; i++) {
+            uint32 _price = _prices[i];
+            OptionBase storage b = optionData[_id][_price];
+            uint32 _total = 0;
+            /* remove unvested totals from Option tranches */
+            _total = _accellerateOrTerminate(b, _price, 0);
+            if (_total > 0) {
+                /* modify totals */
+                totalAtPrice[_price].vested = totalAtPrice[_price].vested.add(_total);
+                _grandTotal = _grandTotal.add(_total);
             }
-            _price = _next;
         }
+        totalVested = totalVested.add(_grandTotal);
         emit AccelleratedOptions(_id, _grandTotal);
         return true;
     }
@@ -548,20 +829,17 @@ contract VestedOptions is BookShareModuleBase {
      */
     function terminateOptions(bytes32 _id) external returns (bool) {
         if (!_onlyAuthority()) return false;
+        _updateGlobalTotal();
         uint32 _grandTotal;
-        uint32 _price = totalLimits[0];
-        while (_price != 0) {
-            uint32 _next = totalAtPrice[_price].next;
-            if (_updateOptionBase(_id, _price)) {
-                _grandTotal = _grandTotal.add(_accellerateOrTerminate(
-                    optionData[_id][_price],
-                    _price,
-                    gracePeriodMonths
-                ));
-            }
-            _price = _next;
+        uint32[] storage _prices = _updateMemberPrices(_id);
+        for (uint256 i; i < _prices.length; i++) {
+            _grandTotal = _grandTotal.add(_accellerateOrTerminate(
+                optionData[_id][_prices[i]],
+                _prices[i],
+                gracePeriodMonths
+            ));
         }
-        total -= _grandTotal;
+        total = total.sub(_grandTotal);
         emit TerminatedOptions(_id, _grandTotal);
         return true;
     }
@@ -585,18 +863,17 @@ contract VestedOptions is BookShareModuleBase {
         internal
         returns (uint32 _total)
     {
-        uint32[2][1657] storage _vestMap = totalAtPrice[_price].vestMap;
-        uint256 _max = totalAtPrice[_price].length;
+        OptionTotal storage t = totalAtPrice[_price];
+        uint32 _month;
 
         uint256 i = b.start;
         uint256 _end = i + b.length;
         for (i; i < _end; i++) {
 
-            /* ensure Option vestMap is accurate */
+            /* ensure Option tranches are accurate */
             Option storage o = b.options[i];
             _updateOption(o);
 
-            uint256 _min = _max - o.length;
             if (_gracePeriod == 0) {
                 /* set unvested to vested */
                 if (o.unvested > 0) {
@@ -604,17 +881,23 @@ contract VestedOptions is BookShareModuleBase {
                 }
             } else if (o.length > _gracePeriod) {
                 /* adjust expiration date */
-                _vestMap[_min][1] = _vestMap[_min][1].sub(o.vested).sub(o.unvested);
-                _vestMap[_max-_gracePeriod][1] = _vestMap[_max-_gracePeriod][1].add(o.vested);
+                _reduceTranche(t, _getExpiryMonth(o), 0, o.vested.add(o.unvested));
                 o.expiryDate = _getEpoch(_gracePeriod);
+                _month = _getExpiryMonth(o);
+                _addTotalTranche(t, 0, _month, 0, o.vested);
+                _addTotalTranche(globalTotal, 0, _month, 0, o.vested);
+            } else if (o.unvested > 0) {
+                /* expiry is unchanged, deleted unvested options no longer expire */
+                _reduceTranche(t, _getExpiryMonth(o), 0, o.unvested);
             }
             if (o.unvested == 0) continue;
 
-            /* iterate vestMap, delete unvested options */
-            for (uint256 x = 0; x < o.length; x++) {
-                if (o.vestMap[x] == 0) continue;
-                _vestMap[_min+x][0] = _vestMap[_min+x][0].sub(o.vestMap[x]);
+            /* iterate unvested tranches, delete unvested options */
+            for (uint256 y = o.cursor; y < o.tranches.length; y++) {
+                uint64 _tranche = o.tranches[y];
+                _reduceTranche(t, uint32(_tranche >> 32), uint32(_tranche), 0);
             }
+            o.cursor = uint32(o.tranches.length);
 
             _total = _total.add(o.unvested);
             o.unvested = 0;
@@ -651,8 +934,7 @@ contract VestedOptions is BookShareModuleBase {
     }
 
     /**
-        @notice advance vestMap and update totals for an OptionTotal struct
-        @dev also updates totalOptions and totalVestedOptions
+        @notice process passed tranches and update totals for an OptionTotal struct
         @param _price exercise price to update
         @return boolean - true if OptionTotal was NOT deleted
      */
@@ -664,19 +946,11 @@ contract VestedOptions is BookShareModuleBase {
         if (_length >= t.length) return _length > 0;
 
         /* sum expired and vested options for months that have passed */
-        uint32 _expiredTotal;
-        uint32 _vestedTotal;
-        for (uint256 i = _length; i < t.length; i++) {
-            if (t.vestMap[i][0] == 0 && t.vestMap[i][1] == 0) continue;
-            _expiredTotal = _expiredTotal.add(t.vestMap[i][1]);
-            _vestedTotal = _vestedTotal.add(t.vestMap[i][0]);
-            delete t.vestMap[i];
-        }
+        (uint64 _vestedTotal, uint64 _expiredTotal) = _processTranches(t);
 
         /* adjust totals and remove previous months */
-        t.vested = t.vested.add(_vestedTotal).sub(_expiredTotal);
-        t.unvested = t.unvested.sub(_vestedTotal);
-        total -= _expiredTotal;
+        t.vested = t.vested.add(uint32(_vestedTotal)).sub(uint32(_expiredTotal));
+        t.unvested = t.unvested.sub(uint32(_vestedTotal));
 
         /* only store length if entry was not removed */
         if (_removeOptionTotal(_price)) return false;
@@ -684,6 +958,72 @@ contract VestedOptions is BookShareModuleBase {
         return true;
     }
 
+    /**
+        @notice process passed tranches and update global totals
+        @dev called before any change to total or totalVested
+     */
+    function _updateGlobalTotal() internal {
+        (uint64 _vestedTotal, uint64 _expiredTotal) = _processTranches(globalTotal);
+        if (_vestedTotal == 0 && _expiredTotal == 0) return;
+        totalVested = totalVested.add(_vestedTotal).sub(_expiredTotal);
+        totalExpired = totalExpired.add(_expiredTotal);
+        total = total.sub(_expiredTotal);
+    }
+
+    /**
+        @notice sum and remove tranches for months that have passed
+        @param t OptionTotal storage pointer
+        @return vested total, expired total
+     */
+    function _processTranches(
+        OptionTotal storage t
+    )
+        internal
+        returns (
+            uint64 _vestedTotal,
+            uint64 _expiredTotal
+        )
+    {
+        uint32 _month = _getMonth();
+        uint32 i = t.nextMonth;
+        if (i == 0 || i > _month) return;
+        while (i != 0 && i <= _month) {
+            TotalTranche storage x = t.tranches[i];
+            _vestedTotal = _vestedTotal.add(x.vesting);
+            _expiredTotal = _expiredTotal.add(x.expiring);
+            uint32 _next = x.next;
+            delete t.tranches[i];
+            i = _next;
+        }
+        t.nextMonth = i;
+        return (_vestedTotal, _expiredTotal);
+    }
+
+    /**
+        @notice update a member's OptionBase structs and remove empty prices
+        @param _id member ID
+        @return sorted array of exercise prices where the member holds options
+     */
+    function _updateMemberPrices(bytes32 _id) internal returns (uint32[] storage) {
+        uint32[] storage _prices = memberPrices[_id];
+        uint256 _length;
+        for (uint256 i; i < _prices.length; i++) {
+            uint32 _price = _prices[i];
+            if (!_updateOptionBase(_id, _price)) {
+                optionData[_id][_price].listed = false;
+                continue;
+            }
+            if (_length != i) {
+                _prices[_length] = _price;
+            }
+            _length++;
+        }
+        if (_length != _prices.length) {
+            _prices.length = _length;
+        }
+        return _prices;
+    }
+
     /**
         @notice update start and length values for OptionBase struct
         @dev _updateOption must still be called on remaining Options
@@ -719,7 +1059,7 @@ contract VestedOptions is BookShareModuleBase {
     }
 
     /**
-        @notice advance vestMap and update totals for an Option struct
+        @notice process vested tranches and update totals for an Option struct
         @dev
             this method does not update any totals outside of the struct, it
             should only be called along with _updateOptionTotal
@@ -739,15 +1079,14 @@ contract VestedOptions is BookShareModuleBase {
         }
 
         /* sum vested options for months that have passed */
-        uint256 i = _length;
+        uint32 _month = _getMonth();
+        uint256 i = o.cursor;
         uint32 _vestedTotal;
-        while (_vestedTotal < o.unvested && i < o.length) {
-            if (o.vestMap[i] > 0) {
-                _vestedTotal = _vestedTotal.add(o.vestMap[i]);
-                delete o.vestMap[i];
-            }
+        while (i < o.tranches.length && uint32(o.tranches[i] >> 32) <= _month) {
+            _vestedTotal = _vestedTotal.add(uint32(o.tranches[i]));
             i++;
         }
+        o.cursor = uint32(i);
 
         /* adjust totals and remove previous months */
         o.vested = o.vested.add(_vestedTotal);
@@ -780,9 +1119,25 @@ contract VestedOptions is BookShareModuleBase {
         t.prev = 0;
         t.next = 0;
         t.length = 0;
+        t.nextMonth = 0;
         return true;
     }
 
+    /** @dev get the current month number, counting 30 day periods from epoch 0 */
+    function _getMonth() internal view returns (uint32) {
+        return uint32(FINAL_MONTH.div(2592000).sub(FINAL_MONTH.sub(now).div(2592000)));
+    }
+
+    /**
+        @dev
+            get the month number of the expiring tranche for an Option. The
+            tranche is always filed and reduced under this month, _getMonth
+            rounds up and can differ by one when now is a multiple of 30 days.
+     */
+    function _getExpiryMonth(Option storage o) internal view returns (uint32) {
+        return o.expiryDate / 2592000;
+    }
+
     /** @dev generate an epoch time based on a number of months */
     function _getEpoch(uint32 _months) internal view returns (uint32) {
         uint32 _now = uint32(now.div(2592000).add(1).mul(2592000));
@@ -102,3 +102,21 @@ library SafeMath32 {
     }
 
 }
+
+library SafeMath64 {
+
+    function sub(uint64 _a, uint64 _b) internal pure returns (uint64) {
+        require(_b <= _a);
+        uint64 c = _a - _b;
+
+        return c;
+    }
+
+    function add(uint64 _a, uint64 _b) internal pure returns (uint64) {
+        uint64 c = _a + _b;
+        require(c >= _a);
+
+        return c;
+    }
+
+}
@@ -0,0 +1,297 @@
+#!/usr/bin/python3
+
+import random
+
+from brownie import *
+from scripts.deployment import deploy_contracts
+
+range_module_source = """
+pragma solidity 0.4.25;
+
+interface IModular {
+    function setHookTags(bytes4, bool, bytes1, bytes1[]) external returns (bool);
+}
+
+contract RangeModule {
+
+    IModular owner;
+
+    constructor(address _owner) public { owner = IModular(_owner); }
+    function getOwner() external view returns (address) { return owner; }
+
+    function getPermissions() external pure returns(
+        bytes4[] permissions, bytes4[] hooks, uint256 hookBools
+    ) {
+        bytes4[] memory _hooks = new bytes4[](2);
+        _hooks[0] = 0x2d79c6d7; // checkTransferRange
+        _hooks[1] = 0x244d5002; // transferShareRange
+        return (permissions, _hooks, 3);
+    }
+
+    function setHookTags(
+        bytes4 _sig, bool _value, bytes1 _tagBase, bytes1[] _tags
+    ) external returns (bool) {
+        require(owner.setHookTags(_sig, _value, _tagBase, _tags));
+        return true;
+    }
+
+    function checkTransferRange(
+        address[2], bytes32, bytes32[2], uint8[2], uint16[2], uint48[2]
+    ) external pure returns (bool) {
+        return true;
+    }
+
+    function transferShareRange(
+        address[2], bytes32[2], uint8[2], uint16[2], uint48[2]
+    ) external pure returns (bool) {
+        return true;
+    }
+}"""
+
+
+def range_hooks(counts=(1, 10, 100)):
+    """Gas used by CertShare.transfer across fragmented ranges, with a tag
+    hook module attached that either does or does not listen to the tag."""
+    for listening in (False, True):
+        print("Tag hook listening: {}".format(listening))
+        for count in counts:
+            gas = _transfer_ranges(count, "0x0101" if listening else "0x0202")
+            print(
+                "  {:>4} ranges: {:>9} gas, {:>7} per range".format(
+                    count, gas, gas // count
+                )
+            )
+
+
+def _transfer_ranges(count, tag):
+    rpc.reset()
+    share, org, kyc = deploy_contracts(CertShare)
+    _add_members(kyc, org, accounts[1:4])
+    module = compile_source(range_module_source).RangeModule.deploy(
+        share, {"from": accounts[0]}
+    )
+    org.attachModule(share, module, {"from": accounts[0]})
+    for sig in ("0x2d79c6d7", "0x244d5002"):
+        module.setHookTags(sig, True, "0x01", ["0x00"], {"from": accounts[0]})
+    _fragment(share, count, tag)
+    tx = share.transfer(accounts[3], count, {"from": accounts[1]})
+    return tx.gas_used
+
+
+def _fragment(share, count, tag):
+    # alternate owners so accounts[1] holds `count` separate ranges
+    for i in range(count):
+        share.mint(accounts[1], 1, 0, tag, {"from": accounts[0]})
+        share.mint(accounts[2], 1, 0, tag, {"from": accounts[0]})
+
+
+def _add_members(kyc, org, members):
+    # one member ID per account, all in country 1 with a rating of 1
+    ids = ["0x{:064x}".format(i + 1) for i in range(len(members))]
+    for member_id, account in zip(ids, members):
+        kyc.addMember(
+            member_id, 1, "0x000001", 1, 9999999999, [account], {"from": accounts[0]}
+        )
+    org.setCountries([1], [1], [0], {"from": accounts[0]})
+    return ids
+
+
+def range_fragmentation(transfers=10000, holders=10, supply=1000000, seed=0):
+    """Simulates CertShare range bookkeeping to compare the number of ranges
+    per holder after many random transfers, selecting ranges in storage order
+    or as CertShare does: whole ranges first, holding back the first range
+    that must be split while `lookahead` more ranges are checked for a fit."""
+    for strategy in ("storage", "lookahead"):
+        model = _RangeModel(holders, supply)
+        rng = random.Random(seed)
+        for i in range(transfers):
+            sender = rng.choice([k for k, v in model.balances.items() if v])
+            receiver = rng.choice([k for k in model.balances if k != sender])
+            value = rng.randint(1, model.balance_of(sender))
+            model.transfer(sender, receiver, value, strategy)
+        counts = [len(v) for v in model.balances.values()]
+        print(
+            "{:>8}: {:>6} total ranges, {:>8.1f} average, {:>6} max".format(
+                strategy, sum(counts), sum(counts) / holders, max(counts)
+            )
+        )
+
+
+class _RangeModel:
+    """Mirrors the range and balance array updates in CertShare, ignoring
+    time, tag and custodian values."""
+
+    def __init__(self, holders, supply):
+        # start -> [stop, owner]
+        self.ranges = {}
+        self.balances = dict((i, []) for i in range(holders))
+        for i in range(holders):
+            start = i * supply // holders + 1
+            self.ranges[start] = [(i + 1) * supply // holders + 1, i]
+            self.balances[i].append(start)
+
+    def balance_of(self, owner):
+        return sum(self.ranges[i][0] - i for i in self.balances[owner])
+
+    def transfer(self, sender, receiver, value, strategy):
+        for pointer in self._select(self.balances[sender], value, strategy):
+            amount = min(value, self.ranges[pointer][0] - pointer)
+            self._transfer_single(pointer, sender, receiver, pointer + amount)
+            value -= amount
+
+    def _select(self, pointers, value, strategy):
+        if strategy == "storage":
+            selected = []
+            for pointer in pointers:
+                selected.append(pointer)
+                value -= self.ranges[pointer][0] - pointer
+                if value <= 0:
+                    return selected
+        selected = []
+        split = None
+        for i, pointer in enumerate(pointers):
+            if split is not None and i > split + 8:
+                break
+            size = self.ranges[pointer][0] - pointer
+            if size == value:
+                return selected + [pointer]
+            if size < value:
+                selected.append(pointer)
+                value -= size
+            elif split is None:
+                split = i
+        return selected + [pointers[split]]
+
+    def _replace(self, owner, old, new):
+        array = self.balances[owner]
+        if not old:
+            array.append(new)
+        elif new:
+            array[array.index(old)] = new
+        else:
+            idx = array.index(old)
+            array[idx] = array[-1]
+            array.pop()
+
+    def _previous(self, start):
+        return next((k for k, v in self.ranges.items() if v[0] == start), None)
+
+    def _transfer_single(self, pointer, sender, receiver, stop):
+        range_stop = self.ranges[pointer][0]
+        prev = self._previous(pointer)
+        left = prev is not None and self.ranges[prev][1] == receiver
+        if range_stop == stop:
+            self._replace(sender, pointer, 0)
+            right = stop in self.ranges and self.ranges[stop][1] == receiver
+            if not left and not right:
+                self._replace(receiver, 0, pointer)
+                self.ranges[pointer][1] = receiver
+            elif not right:
+                del self.ranges[pointer]
+                self.ranges[prev][0] = stop
+            elif not left:
+                self._replace(receiver, stop, pointer)
+                self.ranges[pointer] = [self.ranges.pop(stop)[0], receiver]
+            else:
+                self._replace(receiver, stop, 0)
+                del self.ranges[pointer]
+                self.ranges[prev][0] = self.ranges.pop(stop)[0]
+            return
+        self.ranges[stop] = [range_stop, sender]
+        self._replace(sender, pointer, stop)
+        del self.ranges[pointer]
+        if left:
+            self.ranges[prev][0] = stop
+        else:
+            self._replace(receiver, 0, pointer)
+            self.ranges[pointer] = [stop, receiver]
+
+
+def member_batches(sizes=(1, 10, 50, 200)):
+    """Gas used per member by IDVerifierRegistrar.addMembers, updateMembers
+    and registerAddressesBatch, compared to the single member methods."""
+    for size in sizes:
+        rpc.reset()
+        kyc = accounts[0].deploy(IDVerifierRegistrar, [accounts[0]], 1)
+        ids = ["0x{:064x}".format(i + 1) for i in range(size)]
+        single = _single_member_gas(kyc, size)
+        gas = [
+            kyc.addMembers(
+                ids,
+                [1] * size,
+                ["0x000001"] * size,
+                [1] * size,
+                [9999999999] * size,
+                _addresses(size, 1),
+                {"from": accounts[0]},
+            ).gas_used,
+            kyc.updateMembers(
+                ids,
+                ["0x000002"] * size,
+                [2] * size,
+                [9999999999] * size,
+                {"from": accounts[0]},
+            ).gas_used,
+            kyc.registerAddressesBatch(
+                ids, _addresses(size, 2), {"from": accounts[0]}
+            ).gas_used,
+        ]
+        print(
+            "{:>4} members: add {:>7}, update {:>7}, register {:>7} gas per member"
+            " (single add: {})".format(size, *[i // size for i in gas], single)
+        )
+
+
+def _single_member_gas(kyc, size):
+    # gas for one addMember call, made with an ID outside of the batch range
+    return kyc.addMember(
+        "0x{:064x}".format(size + 1),
+        1,
+        "0x000001",
+        1,
+        9999999999,
+        _addresses(1, 3),
+        {"from": accounts[0]},
+    ).gas_used
+
+
+def _addresses(count, prefix):
+    # decimal-only hex strings avoid checksum issues
+    return ["0x{}{:039d}".format(prefix, i) for i in range(count)]
+
+
+def vesting_tranches(counts=(4, 12, 48)):
+    """Gas used by VestedOptions when issuing a grant with one tranche per
+    month, and when exercising the grant once every tranche has vested."""
+    for count in counts:
+        rpc.reset()
+        share, org, kyc = deploy_contracts(BookShare)
+        member_id = _add_members(kyc, org, accounts[1:2])[0]
+        options = accounts[0].deploy(
+            VestedOptions, share, org, 1, count + 1, 6, accounts[0]
+        )
+        org.attachModule(share, options, {"from": accounts[0]})
+        issue = options.issueOptions(
+            member_id,
+            10,
+            False,
+            [100] * count,
+            list(range(count)),
+            {"from": accounts[0]},
+        ).gas_used
+        rpc.sleep(2592000 * (count + 1))
+        exercise = options.exerciseOptions(
+            10, 100 * count, {"from": accounts[1], "value": 1000 * count}
+        ).gas_used
+        print(
+            "{:>3} tranches: issue {:>8} gas, exercise {:>7} gas".format(
+                count, issue, exercise
+            )
+        )
+
+
+def main():
+    range_hooks()
+    range_fragmentation()
+    member_batches()
+    vesting_tranches()
@@ -0,0 +1,94 @@
+#!/usr/bin/python3
+
+from brownie import web3
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+
+def dividend_amounts(checkpoint, share, time, dividend, holders, custodians=()):
+    """Calculates dividend payouts from MultiCheckpointModule balances.
+
+    Args:
+        checkpoint: MultiCheckpointModule attached to the share
+        share: OrgShare contract
+        time: Epoch time of the checkpoint
+        dividend: Total dividend amount, in wei
+        holders: Member addresses to include
+        custodians: Custodian addresses to include
+
+    Balances held by the org are excluded from the total supply, in the
+    same way as DividendModule. Custodian addresses should not be given in
+    holders, their balance is paid through the custodied balance of each
+    beneficiary.
+
+    Returns a list of (beneficiary, custodian, amount) tuples."""
+    total = checkpoint.totalSupplyAt(share, time)
+    total -= checkpoint.balanceAt(share, share.orgCode(), time)
+    leaves = []
+    for holder in holders:
+        balances = [(ZERO_ADDRESS, checkpoint.balanceAt(share, holder, time))]
+        for custodian in custodians:
+            balances.append(
+                (
+                    custodian,
+                    checkpoint.custodianBalanceAt(share, holder, custodian, time),
+                )
+            )
+        for custodian, balance in balances:
+            if balance:
+                leaves.append(
+                    (str(holder), str(custodian), balance * dividend // total)
+                )
+    return leaves
+
+
+def build_tree(leaves):
+    """Builds a merkle tree from (beneficiary, custodian, amount) tuples.
+
+    Pairs are sorted before hashing, matching MerkleDividendModule. A node
+    without a sibling is promoted to the next level unchanged.
+
+    Returns the root and a list of proofs, in the same order as leaves."""
+    if not leaves:
+        raise ValueError("No leaves given")
+    level = [_leaf_hash(*i) for i in leaves]
+    positions = list(range(len(leaves)))
+    proofs = [[] for i in leaves]
+    while len(level) > 1:
+        for idx, pos in enumerate(positions):
+            sibling = pos ^ 1
+            if sibling < len(level):
+                proofs[idx].append("0x" + level[sibling].hex())
+            positions[idx] = pos // 2
+        level = [_node_hash(*level[i : i + 2]) for i in range(0, len(level), 2)]
+    return "0x" + level[0].hex(), proofs
+
+
+def claim_many_args(leaves, proofs):
+    """Formats leaves and proofs as arguments for MerkleDividendModule.claimMany"""
+    return (
+        [i[0] for i in leaves],
+        [i[1] for i in leaves],
+        [i[2] for i in leaves],
+        [x for i in proofs for x in i],
+        [len(i) for i in proofs],
+    )
+
+
+def _leaf_hash(beneficiary, custodian, amount):
+    return bytes(
+        web3.solidityKeccak(
+            ["address", "address", "uint256"],
+            [
+                web3.toChecksumAddress(beneficiary),
+                web3.toChecksumAddress(custodian),
+                amount,
+            ],
+        )
+    )
+
+
+def _node_hash(left, right=None):
+    if right is None:
+        return left
+    return bytes(web3.solidityKeccak(["bytes32", "bytes32"], sorted([left, right])))
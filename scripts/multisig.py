@@ -0,0 +1,49 @@
+#!/usr/bin/python3
+
+from brownie import web3
+
+
+def sign_call(contract, caller, signers, fn_name, *args):
+    """Collects signatures for a call made through executeWithSignatures.
+
+    Args:
+        contract: OrgCode, OwnedCustodian or IDVerifierRegistrar instance
+        caller: Account that will submit the call
+        signers: Other accounts of the same authority approving the call
+        fn_name: Name of the contract method to call
+        *args: Arguments for the method
+
+    Returns the calldata and the v, r and s signature arrays."""
+    data = getattr(contract, fn_name).encode_input(*args)
+    call_hash = contract.getSignedCallHash(caller, data)
+    v, r, s = [], [], []
+    for account in _order_signers(caller, signers):
+        for values, value in zip((v, r, s), sign_hash(account, call_hash)):
+            values.append(value)
+    return data, v, r, s
+
+
+def sign_hash(account, message_hash):
+    """Signs a hash with the Ethereum signed message prefix.
+
+    Returns the v, r and s signature values."""
+    signature = web3.eth.sign(str(account), hexstr=str(message_hash))
+    # some clients return v as 0/1 instead of 27/28
+    v = signature[64] + 27 if signature[64] < 27 else signature[64]
+    return v, "0x" + bytes(signature[:32]).hex(), "0x" + bytes(signature[32:64]).hex()
+
+
+def execute_with_signatures(contract, caller, signers, fn_name, *args):
+    """Signs and submits a call in a single transaction.
+
+    Returns the transaction from executeWithSignatures."""
+    data, v, r, s = sign_call(contract, caller, signers, fn_name, *args)
+    return contract.executeWithSignatures(data, v, r, s, {"from": caller})
+
+
+def _order_signers(caller, signers):
+    # the caller is counted without a signature, and each signer may only
+    # sign once. signatures are ordered by address so the result is stable.
+    addresses = set(str(i).lower() for i in signers)
+    addresses.discard(str(caller).lower())
+    return [web3.toChecksumAddress(i) for i in sorted(addresses)]
@@ -0,0 +1,163 @@
+#!/usr/bin/python3
+
+import pytest
+
+from brownie import accounts
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(approve_many, org, share, cust):
+    share.mint(org, 100000, {"from": accounts[0]})
+    share.transfer(accounts[1], 10000, {"from": accounts[0]})
+    share.transfer(cust, 10000, {"from": accounts[1]})
+
+
+def test_net_balances(share, cust):
+    """settle batch - net balances"""
+    tx = cust.settleBatch(
+        share,
+        [accounts[1], accounts[2], accounts[3]],
+        [accounts[2], accounts[3], accounts[1]],
+        [8000, 6000, 1000],
+        {"from": accounts[0]},
+    )
+    assert cust.balanceOf(share, accounts[1]) == 3000
+    assert cust.balanceOf(share, accounts[2]) == 2000
+    assert cust.balanceOf(share, accounts[3]) == 5000
+    assert tx.events["BatchSettled"]["transfers"] == 3
+    assert tx.events["BatchSettled"]["legs"] == 2
+    assert len(tx.events["TransferOwnership"]) == 2
+
+
+def test_cancel_out(share, cust):
+    """settle batch - transfers cancel out"""
+    tx = cust.settleBatch(
+        share,
+        [accounts[1], accounts[2]],
+        [accounts[2], accounts[1]],
+        [5000, 5000],
+        {"from": accounts[0]},
+    )
+    assert cust.balanceOf(share, accounts[1]) == 10000
+    assert cust.balanceOf(share, accounts[2]) == 0
+    assert tx.events["BatchSettled"]["legs"] == 0
+    assert "TransferOwnership" not in tx.events
+
+
+def test_gross_exceeds_balance(share, cust):
+    """settle batch - gross amount exceeds custodied balance"""
+    cust.settleBatch(
+        share,
+        [accounts[1], accounts[2], accounts[1]],
+        [accounts[2], accounts[1], accounts[2]],
+        [10000, 6000, 6000],
+        {"from": accounts[0]},
+    )
+    assert cust.balanceOf(share, accounts[1]) == 0
+    assert cust.balanceOf(share, accounts[2]) == 10000
+
+
+def test_counts(check_counts, share, cust):
+    """settle batch - only net changes affect member counts"""
+    check_counts(one=(1, 1, 0))
+    cust.settleBatch(
+        share,
+        [accounts[1], accounts[2]],
+        [accounts[2], accounts[3]],
+        [10000, 10000],
+        {"from": accounts[0]},
+    )
+    assert cust.balanceOf(share, accounts[2]) == 0
+    check_counts(two=(1, 1, 0))
+
+
+def test_insufficient_balance(share, cust):
+    """settle batch - net amount exceeds custodied balance"""
+    with pytest.reverts("Insufficient Custodial Balance"):
+        cust.settleBatch(
+            share,
+            [accounts[1], accounts[2]],
+            [accounts[2], accounts[1]],
+            [12000, 1000],
+            {"from": accounts[0]},
+        )
+
+
+def test_length_mismatch(share, cust):
+    """settle batch - array length mismatch"""
+    with pytest.reverts("dev: length mismatch"):
+        cust.settleBatch(
+            share,
+            [accounts[1], accounts[2]],
+            [accounts[2]],
+            [1000, 1000],
+            {"from": accounts[0]},
+        )
+    with pytest.reverts("dev: length mismatch"):
+        cust.settleBatch(
+            share, [accounts[1]], [accounts[2]], [1000, 1000], {"from": accounts[0]}
+        )
+
+
+def test_not_authority(share, cust):
+    """settle batch - not an authority"""
+    with pytest.reverts("dev: not permitted"):
+        cust.settleBatch(
+            share, [accounts[1]], [accounts[2]], [1000], {"from": accounts[1]}
+        )
+
+
+def test_netted_not_verified(kyc, org, share, cust):
+    """settle batch - netted away address is never verified"""
+    org.setEntityRestriction(kyc.getID(accounts[2]), True, {"from": accounts[0]})
+    with pytest.reverts("Receiver restricted: Org"):
+        cust.transferInternal(
+            share, accounts[1], accounts[2], 5000, {"from": accounts[0]}
+        )
+    cust.settleBatch(
+        share,
+        [accounts[1], accounts[2]],
+        [accounts[2], accounts[3]],
+        [5000, 5000],
+        {"from": accounts[0]},
+    )
+    assert cust.balanceOf(share, accounts[1]) == 5000
+    assert cust.balanceOf(share, accounts[2]) == 0
+    assert cust.balanceOf(share, accounts[3]) == 5000
+
+
+def test_member_limit(org, share, cust):
+    """settle batch - net sender frees a slot for the receiver"""
+    org.setMemberLimits((1, 0, 0, 0, 0, 0, 0, 0), {"from": accounts[0]})
+    with pytest.reverts("Total Member Limit"):
+        cust.settleBatch(
+            share, [accounts[1]], [accounts[2]], [5000], {"from": accounts[0]}
+        )
+    cust.settleBatch(
+        share,
+        [accounts[1], accounts[1]],
+        [accounts[2], accounts[2]],
+        [5000, 5000],
+        {"from": accounts[0]},
+    )
+    assert cust.balanceOf(share, accounts[1]) == 0
+    assert cust.balanceOf(share, accounts[2]) == 10000
+
+
+def test_share_not_netted(share):
+    """transfer custodian batch - address sends and receives"""
+    with pytest.reverts("dev: not netted"):
+        share.transferCustodianBatch(
+            [accounts[1], accounts[2]],
+            [accounts[2], accounts[3]],
+            [1000, 1000],
+            {"from": accounts[1]},
+        )
+
+
+def test_share_not_custodian(share):
+    """transfer custodian batch - caller is not a custodian"""
+    with pytest.reverts("dev: not custodian"):
+        share.transferCustodianBatch(
+            [accounts[1]], [accounts[2]], [1000], {"from": accounts[1]}
+        )
@@ -0,0 +1,52 @@
+#!/usr/bin/python3
+
+import pytest
+
+from brownie import accounts
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(approve_many, org, share, cust):
+    share.mint(org, 100000, {"from": accounts[0]})
+    share.transfer(accounts[1], 10000, {"from": accounts[0]})
+    share.transfer(cust, 10000, {"from": accounts[1]})
+
+
+def test_transfer_many(share, cust):
+    """transfer many - balances"""
+    tx = cust.transferMany(
+        share, [accounts[1], accounts[2]], [4000, 3000], {"from": accounts[0]}
+    )
+    assert cust.balanceOf(share, accounts[1]) == 3000
+    assert share.balanceOf(accounts[1]) == 4000
+    assert share.balanceOf(accounts[2]) == 3000
+    assert share.balanceOf(cust) == 3000
+    assert len(tx.events["SentShares"]) == 2
+
+
+def test_counts(check_counts, share, cust):
+    """transfer many - member counts"""
+    cust.transferMany(
+        share, [accounts[1], accounts[3]], [5000, 5000], {"from": accounts[0]}
+    )
+    check_counts(one=(1, 1, 0), two=(1, 1, 0))
+
+
+def test_insufficient_balance(share, cust):
+    """transfer many - exceeds custodied balance"""
+    with pytest.reverts("Insufficient Custodial Balance"):
+        cust.transferMany(
+            share, [accounts[1], accounts[1]], [6000, 6000], {"from": accounts[0]}
+        )
+
+
+def test_length_mismatch(share, cust):
+    """transfer many - array length mismatch"""
+    with pytest.reverts("dev: length mismatch"):
+        cust.transferMany(share, [accounts[1]], [1000, 1000], {"from": accounts[0]})
+
+
+def test_not_authority(share, cust):
+    """transfer many - not an authority"""
+    with pytest.reverts("dev: not permitted"):
+        cust.transferMany(share, [accounts[1]], [1000], {"from": accounts[1]})
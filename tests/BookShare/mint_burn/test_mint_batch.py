@@ -0,0 +1,64 @@
+#!/usr/bin/python3
+
+import pytest
+
+from brownie import accounts
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(approve_many):
+    pass
+
+
+def test_mint_batch(share):
+    """mint to many members"""
+    share.mintBatch(
+        [accounts[1], accounts[2], accounts[3]],
+        [1000, 2000, 3000],
+        {"from": accounts[0]},
+    )
+    assert share.totalSupply() == 6000
+    assert share.balanceOf(accounts[1]) == 1000
+    assert share.balanceOf(accounts[2]) == 2000
+    assert share.balanceOf(accounts[3]) == 3000
+
+
+def test_mint_batch_repeat_owner(org, share):
+    """mint to the same member more than once"""
+    share.mintBatch(
+        [org, accounts[1], accounts[1]], [5000, 1000, 2000], {"from": accounts[0]}
+    )
+    assert share.totalSupply() == 8000
+    assert share.balanceOf(org) == 5000
+    assert share.balanceOf(accounts[1]) == 3000
+
+
+def test_mint_batch_counts(check_counts, share):
+    """member counts"""
+    share.mintBatch(
+        [accounts[1], accounts[2], accounts[3]],
+        [1000, 1000, 1000],
+        {"from": accounts[0]},
+    )
+    check_counts(one=(2, 1, 1), two=(1, 1, 0))
+
+
+def test_mint_batch_length_mismatch(share):
+    """array length mismatch"""
+    with pytest.reverts("dev: length mismatch"):
+        share.mintBatch([accounts[1], accounts[2]], [1000], {"from": accounts[0]})
+
+
+def test_mint_batch_zero(share):
+    """mint 0 shares"""
+    with pytest.reverts("dev: mint 0"):
+        share.mintBatch([accounts[1], accounts[2]], [1000, 0], {"from": accounts[0]})
+
+
+def test_mint_batch_exceed_authorized(share):
+    """combined mint exceeds authorized supply"""
+    with pytest.reverts("dev: exceed auth"):
+        share.mintBatch(
+            [accounts[1], accounts[2]], [600000, 400001], {"from": accounts[0]}
+        )
+    share.mintBatch([accounts[1], accounts[2]], [600000, 400000], {"from": accounts[0]})
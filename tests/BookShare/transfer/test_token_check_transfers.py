@@ -0,0 +1,76 @@
+#!/usr/bin/python3
+
+import pytest
+
+from brownie import accounts
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(approve_many, org, share):
+    share.mint(org, 100000, {"from": accounts[0]})
+    share.transfer(accounts[1], 1000, {"from": accounts[0]})
+
+
+def test_permitted(share):
+    """check transfers - permitted"""
+    assert share.checkTransfers(
+        [accounts[1], accounts[0]], [accounts[2], accounts[3]], [100, 1000]
+    ) == (0, 0)
+
+
+def test_share_codes(share):
+    """check transfers - share level codes"""
+    assert share.checkTransfers(
+        [accounts[1], accounts[1], accounts[1]],
+        [accounts[2], accounts[2], accounts[2]],
+        [0, 2000, 100],
+    ) == (1, 4, 0)
+
+
+def test_not_registered(share):
+    """check transfers - address not registered"""
+    assert share.checkTransfers(
+        [accounts[1], accounts[9]], [accounts[9], accounts[1]], [100, 100]
+    ) == (9, 9)
+
+
+def test_locks(org, share):
+    """check transfers - org and share locks"""
+    org.setOrgShareRestriction(share, True, {"from": accounts[0]})
+    assert share.checkTransfers([accounts[1]], [accounts[2]], [100]) == (13,)
+    org.setGlobalRestriction(True, {"from": accounts[0]})
+    assert share.checkTransfers([accounts[1]], [accounts[2]], [100]) == (12,)
+
+
+def test_restricted(org, share, id1, id2):
+    """check transfers - sender and receiver restricted"""
+    org.setEntityRestriction(id2, True, {"from": accounts[0]})
+    assert share.checkTransfers(
+        [accounts[1], accounts[0]], [accounts[2], accounts[2]], [100, 100]
+    ) == (17, 17)
+    org.setEntityRestriction(id1, True, {"from": accounts[0]})
+    assert share.checkTransfers([accounts[1]], [accounts[3]], [100]) == (14,)
+
+
+def test_country_blocked(org, share):
+    """check transfers - receiver country blocked"""
+    org.setCountry(2, False, 1, [0] * 8, {"from": accounts[0]})
+    assert share.checkTransfers(
+        [accounts[1], accounts[1]], [accounts[2], accounts[3]], [100, 100]
+    ) == (0, 19)
+
+
+def test_member_limit(org, share):
+    """check transfers - member limit"""
+    org.setMemberLimits((1, 0, 0, 0, 0, 0, 0, 0), {"from": accounts[0]})
+    assert share.checkTransfers(
+        [accounts[1], accounts[1]], [accounts[2], accounts[2]], [100, 1000]
+    ) == (21, 0)
+
+
+def test_length_mismatch(share):
+    """check transfers - array length mismatch"""
+    with pytest.reverts("dev: length mismatch"):
+        share.checkTransfers([accounts[1]], [accounts[2], accounts[3]], [100, 100])
+    with pytest.reverts("dev: length mismatch"):
+        share.checkTransfers([accounts[1]], [accounts[2]], [100, 100])
@@ -0,0 +1,103 @@
+#!/usr/bin/python3
+
+import pytest
+
+from brownie import accounts
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(approve_many, org, share):
+    share.mint(org, 100000, {"from": accounts[0]})
+
+
+def test_balances(share):
+    """transfer many - balances"""
+    tx = share.transferMany(
+        [accounts[1], accounts[2], accounts[3]],
+        [1000, 2000, 3000],
+        {"from": accounts[0]},
+    )
+    assert share.balanceOf(accounts[1]) == 1000
+    assert share.balanceOf(accounts[2]) == 2000
+    assert share.balanceOf(accounts[3]) == 3000
+    assert len(tx.events["Transfer"]) == 3
+
+
+def test_repeated_receiver(check_counts, share):
+    """transfer many - repeated receivers"""
+    share.transferMany(
+        [accounts[1], accounts[2], accounts[1]],
+        [1000, 2000, 3000],
+        {"from": accounts[0]},
+    )
+    assert share.balanceOf(accounts[1]) == 4000
+    assert share.balanceOf(accounts[2]) == 2000
+    check_counts(one=(2, 1, 1))
+
+
+def test_member_counts(check_counts, share):
+    """transfer many - member to member, full balance"""
+    share.transfer(accounts[1], 5000, {"from": accounts[0]})
+    check_counts(one=(1, 1, 0))
+    share.transferMany(
+        [accounts[2], accounts[3], accounts[4]],
+        [1000, 1000, 3000],
+        {"from": accounts[1]},
+    )
+    assert share.balanceOf(accounts[1]) == 0
+    check_counts(one=(1, 0, 1), two=(2, 1, 1))
+
+
+def test_member_limit(org, share):
+    """transfer many - member limit applies per receiver"""
+    org.setMemberLimits((2, 0, 0, 0, 0, 0, 0, 0), {"from": accounts[0]})
+    share.transfer(accounts[1], 2000, {"from": accounts[0]})
+    share.transferMany([accounts[1], accounts[2]], [1000, 1000], {"from": accounts[0]})
+    with pytest.reverts("Total Member Limit"):
+        share.transferMany(
+            [accounts[1], accounts[3]], [1000, 1000], {"from": accounts[0]}
+        )
+
+
+def test_sender_zero_balance_limit(org, share):
+    """transfer many - member limit, sender reaches zero balance"""
+    org.setMemberLimits((2, 0, 0, 0, 0, 0, 0, 0), {"from": accounts[0]})
+    share.transfer(accounts[1], 2000, {"from": accounts[0]})
+    share.transfer(accounts[2], 1000, {"from": accounts[0]})
+    with pytest.reverts("Total Member Limit"):
+        share.transferMany(
+            [accounts[3], accounts[2]], [1000, 1000], {"from": accounts[1]}
+        )
+    share.transferMany([accounts[2], accounts[3]], [1000, 1000], {"from": accounts[1]})
+
+
+def test_custodian_receiver(check_counts, share, cust):
+    """transfer many - custodian receiver"""
+    share.transfer(accounts[1], 5000, {"from": accounts[0]})
+    share.transferMany(
+        [cust, accounts[2], cust], [1000, 1000, 3000], {"from": accounts[1]}
+    )
+    assert share.custodianBalanceOf(accounts[1], cust) == 4000
+    assert share.balanceOf(accounts[1]) == 0
+    check_counts(one=(2, 1, 1))
+
+
+def test_insufficient_balance(share):
+    """transfer many - insufficient balance"""
+    share.transfer(accounts[1], 1000, {"from": accounts[0]})
+    with pytest.reverts("Insufficient Balance"):
+        share.transferMany(
+            [accounts[2], accounts[3]], [600, 600], {"from": accounts[1]}
+        )
+
+
+def test_zero(share):
+    """transfer many - zero value"""
+    with pytest.reverts("Cannot send 0 shares"):
+        share.transferMany([accounts[1], accounts[2]], [1000, 0], {"from": accounts[0]})
+
+
+def test_length_mismatch(share):
+    """transfer many - array length mismatch"""
+    with pytest.reverts("dev: length mismatch"):
+        share.transferMany([accounts[1], accounts[2]], [1000], {"from": accounts[0]})
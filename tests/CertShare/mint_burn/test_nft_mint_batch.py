@@ -0,0 +1,80 @@
+#!/usr/bin/python3
+
+import pytest
+
+from brownie import accounts
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(approve_many):
+    pass
+
+
+def test_mint_batch(nft):
+    """mint consecutive ranges to many members"""
+    nft.mintBatch(
+        [accounts[1], accounts[2], accounts[3]],
+        [10000, 5000, 2000],
+        [0, 0, 0],
+        ["0x00", "0x00", "0x00"],
+        {"from": accounts[0]},
+    )
+    assert nft.totalSupply() == 17000
+    assert nft.rangesOf(accounts[1]) == ((1, 10001),)
+    assert nft.rangesOf(accounts[2]) == ((10001, 15001),)
+    assert nft.rangesOf(accounts[3]) == ((15001, 17001),)
+
+
+def test_mint_batch_merge(nft):
+    """consecutive mints to the same owner are merged"""
+    nft.mint(accounts[1], 1000, 0, "0x00", {"from": accounts[0]})
+    nft.mintBatch(
+        [accounts[1], accounts[1], accounts[2]],
+        [1000, 1000, 1000],
+        [0, 0, 0],
+        ["0x00", "0x01", "0x00"],
+        {"from": accounts[0]},
+    )
+    assert nft.rangesOf(accounts[1]) == ((1, 2001), (2001, 3001))
+    assert nft.rangesOf(accounts[2]) == ((3001, 4001),)
+    assert nft.balanceOf(accounts[1]) == 3000
+
+
+def test_mint_batch_length_mismatch(nft):
+    """array length mismatch"""
+    with pytest.reverts("dev: length mismatch"):
+        nft.mintBatch(
+            [accounts[1], accounts[2]],
+            [1000],
+            [0, 0],
+            ["0x00", "0x00"],
+            {"from": accounts[0]},
+        )
+    with pytest.reverts("dev: length mismatch"):
+        nft.mintBatch(
+            [accounts[1], accounts[2]],
+            [1000, 1000],
+            [0],
+            ["0x00", "0x00"],
+            {"from": accounts[0]},
+        )
+    with pytest.reverts("dev: length mismatch"):
+        nft.mintBatch(
+            [accounts[1], accounts[2]],
+            [1000, 1000],
+            [0, 0],
+            ["0x00"],
+            {"from": accounts[0]},
+        )
+
+
+def test_mint_batch_exceed_authorized(nft):
+    """combined mint exceeds authorized supply"""
+    with pytest.reverts("dev: exceed auth"):
+        nft.mintBatch(
+            [accounts[1], accounts[2]],
+            [600000, 400001],
+            [0, 0],
+            ["0x00", "0x00"],
+            {"from": accounts[0]},
+        )
@@ -0,0 +1,84 @@
+#!/usr/bin/python3
+
+import pytest
+
+from brownie import accounts
+
+zero = "0x0000000000000000000000000000000000000000"
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(approve_many, nft):
+    for i in range(5):
+        nft.mint(accounts[1], 1, 0, "0x00", {"from": accounts[0]})
+        nft.mint(accounts[2], 1, 0, "0x00", {"from": accounts[0]})
+
+
+def test_pages(nft):
+    """Paged ranges - iterate with cursor"""
+    assert nft.rangesOfPaged(accounts[1], zero, 0, 2) == (((1, 2), (3, 4)), 2)
+    assert nft.rangesOfPaged(accounts[1], zero, 2, 2) == (((5, 6), (7, 8)), 4)
+    assert nft.rangesOfPaged(accounts[1], zero, 4, 2) == (((9, 10),), 0)
+
+
+def test_limit_exceeds(nft):
+    """Paged ranges - limit exceeds range count"""
+    assert nft.rangesOfPaged(accounts[1], zero, 0, 10) == (
+        ((1, 2), (3, 4), (5, 6), (7, 8), (9, 10)),
+        0,
+    )
+    assert nft.rangesOfPaged(accounts[1], zero, 3, 10) == (((7, 8), (9, 10)), 0)
+
+
+def test_no_ranges(nft):
+    """Paged ranges - no ranges"""
+    assert nft.rangesOfPaged(accounts[3], zero, 0, 10) == ((), 0)
+    assert nft.rangeCountOf(accounts[3], zero) == 0
+
+
+def test_range_count(nft):
+    """Range count - transfer and merge"""
+    assert nft.rangeCountOf(accounts[1], zero) == 5
+    assert nft.rangeCountOf(accounts[2], zero) == 5
+    nft.transferRange(accounts[2], 3, 4, {"from": accounts[1]})
+    assert nft.rangeCountOf(accounts[1], zero) == 4
+    assert nft.rangeCountOf(accounts[2], zero) == 4
+    assert len(nft.rangesOf(accounts[1])) == 4
+
+
+def test_custodian(nft, cust):
+    """Paged ranges - custodian"""
+    nft.transferRange(cust, 1, 2, {"from": accounts[1]})
+    nft.transferRange(cust, 7, 8, {"from": accounts[1]})
+    assert nft.rangeCountOf(accounts[1], zero) == 3
+    assert nft.rangeCountOf(accounts[1], cust) == 2
+    assert nft.rangesOfPaged(accounts[1], cust, 0, 1) == (((1, 2),), 4)
+    assert nft.rangesOfPaged(accounts[1], cust, 4, 1) == (((7, 8),), 0)
+    assert nft.rangesOfPaged(accounts[1], cust, 0, 5) == (((1, 2), (7, 8)), 0)
+    assert nft.rangesOfPaged(accounts[1], zero, 0, 5) == (((9, 10), (3, 4), (5, 6)), 0)
+
+
+def test_burn(nft):
+    """Range count - burn"""
+    nft.burn(5, 6, {"from": accounts[0]})
+    assert nft.rangeCountOf(accounts[1], zero) == 4
+
+
+def test_scan_limit(nft):
+    """Paged ranges - scanning stops after 100 entries"""
+    for i in range(11):
+        nft.mintBatch(
+            [accounts[3], accounts[4]] * 10,
+            [1] * 20,
+            [0] * 20,
+            ["0x00"] * 20,
+            {"from": accounts[0]},
+        )
+    assert nft.rangeCountOf(accounts[3], zero) == 110
+    ranges, cursor = nft.rangesOfPaged(accounts[3], zero, 0, 200)
+    assert len(ranges) == 100
+    assert cursor == 100
+    ranges, cursor = nft.rangesOfPaged(accounts[3], zero, cursor, 200)
+    assert len(ranges) == 10
+    assert cursor == 0
+    assert len(nft.rangesOf(accounts[3])) == 110
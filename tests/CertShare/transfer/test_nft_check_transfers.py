@@ -0,0 +1,50 @@
+#!/usr/bin/python3
+
+import pytest
+
+from brownie import accounts, rpc
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(approve_many, org, nft):
+    nft.mint(org, 100000, 0, "0x00", {"from": accounts[0]})
+    nft.transfer(accounts[1], 1000, {"from": accounts[0]})
+
+
+def test_permitted(nft):
+    """check transfers - permitted"""
+    assert nft.checkTransfers(
+        [accounts[1], accounts[0]], [accounts[2], accounts[3]], [100, 1000]
+    ) == (0, 0)
+
+
+def test_share_codes(nft):
+    """check transfers - share level codes"""
+    assert nft.checkTransfers(
+        [accounts[1], accounts[1], accounts[1], accounts[1]],
+        [accounts[2], accounts[2], accounts[2], accounts[2]],
+        [0, 2 ** 48, 2000, 100],
+    ) == (1, 2, 4, 0)
+
+
+def test_send_to_self(nft):
+    """check transfers - cannot send to self"""
+    assert nft.checkTransfers(
+        [accounts[1], accounts[1]], [accounts[1], accounts[2]], [100, 100]
+    ) == (3, 0)
+
+
+def test_time_locked(nft):
+    """check transfers - insufficient transferable shares"""
+    nft.mint(accounts[2], 1000, rpc.time() + 100, "0x00", {"from": accounts[0]})
+    assert nft.checkTransfers(
+        [accounts[2], accounts[1]], [accounts[1], accounts[2]], [100, 100]
+    ) == (6, 0)
+
+
+def test_length_mismatch(nft):
+    """check transfers - array length mismatch"""
+    with pytest.reverts("dev: length mismatch"):
+        nft.checkTransfers([accounts[1]], [accounts[2], accounts[3]], [100, 100])
+    with pytest.reverts("dev: length mismatch"):
+        nft.checkTransfers([accounts[1]], [accounts[2]], [100, 100])
@@ -82,6 +82,53 @@ def test_one(transfer, ts):
     ts(6)
 
 
+def test_exact_fit(nft):
+    """Exact fit range is sent before splitting a larger range"""
+    nft.transfer(accounts[1], 100, {"from": accounts[0]})
+    nft.transfer(accounts[2], 10, {"from": accounts[0]})
+    nft.transfer(accounts[1], 50, {"from": accounts[0]})
+    nft.transfer(accounts[3], 50, {"from": accounts[1]})
+    assert nft.rangesOf(accounts[1]) == ((1, 101),)
+    assert nft.rangesOf(accounts[3]) == ((111, 161),)
+
+
+def test_whole_before_split(nft):
+    """Smaller ranges are sent whole before a larger range is split"""
+    nft.transfer(accounts[1], 10, {"from": accounts[0]})
+    nft.transfer(accounts[2], 10, {"from": accounts[0]})
+    nft.transfer(accounts[1], 100, {"from": accounts[0]})
+    nft.transfer(accounts[2], 10, {"from": accounts[0]})
+    nft.transfer(accounts[1], 30, {"from": accounts[0]})
+    nft.transfer(accounts[3], 120, {"from": accounts[1]})
+    assert nft.rangesOf(accounts[1]) == ((141, 161),)
+    assert nft.rangesOf(accounts[3]) == ((1, 11), (21, 121), (131, 141))
+
+
+def test_split_lookahead(nft):
+    """Exact fit beyond the lookahead is not searched for"""
+    for i in range(10):
+        nft.transfer(accounts[1], 100, {"from": accounts[0]})
+        nft.transfer(accounts[2], 1, {"from": accounts[0]})
+    nft.transfer(accounts[1], 50, {"from": accounts[0]})
+    nft.transfer(accounts[3], 50, {"from": accounts[1]})
+    assert nft.rangesOf(accounts[3]) == ((1, 51),)
+
+
+def test_gas_per_sender_range(nft, skip_coverage):
+    """Each extra sender range adds less than 400 gas to a transfer"""
+    for i in range(10):
+        nft.transfer(accounts[1], 2, {"from": accounts[0]})
+        nft.transfer(accounts[2], 2, {"from": accounts[0]})
+    for i in range(60):
+        nft.transfer(accounts[2], 2, {"from": accounts[0]})
+        nft.transfer(accounts[4], 2, {"from": accounts[0]})
+    few = nft.transfer(accounts[4], 1, {"from": accounts[1]}).gas_used
+    many = nft.transfer(accounts[4], 1, {"from": accounts[2]}).gas_used
+    # _checkTransfer still copies every sender range to memory, so the cost is
+    # linear in the range count. Only range selection and hook checks are bounded.
+    assert many - few < 60 * 400
+
+
 def test_split(transfer, nft, org, skip_coverage):
     """many ranges"""
     nft.modifyAuthorizedSupply("1000 gwei", {"from": accounts[0]})
@@ -5,6 +5,8 @@ import pytest
 
 from brownie import accounts
 
+zero = "0x0000000000000000000000000000000000000000"
+
 
 @pytest.fixture(scope="module")
 def check_ranges(nft):
@@ -22,6 +24,7 @@ def _check_ranges(nft, upper, *expected_ranges, tags=False):
         account = accounts[num]
         ranges = nft.rangesOf(account)
         assert set(ranges) == set(expected)
+        assert nft.rangeCountOf(account, zero) == len(ranges)
         assert nft.balanceOf(account) == sum((i[1] - i[0]) for i in ranges)
         for start, stop in ranges:
             if stop - start == 1:
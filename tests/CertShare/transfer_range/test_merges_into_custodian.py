@@ -192,6 +192,7 @@ def _check(nft, cust, upper, *expected_ranges):
         )
         ranges = nft.custodianRangesOf(address, cust)
         assert set(ranges) == set(custodied)
+        assert nft.rangeCountOf(address, cust) == len(custodied)
         assert nft.custodianBalanceOf(address, cust) == sum(
             (i[1] - i[0]) for i in custodied
         )
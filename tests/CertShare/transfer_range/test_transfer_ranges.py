@@ -0,0 +1,78 @@
+#!/usr/bin/python3
+
+import pytest
+
+from brownie import accounts
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(approve_many, nft):
+    nft.mint(accounts[1], 10000, 0, "0x00", {"from": accounts[0]})
+    nft.mint(accounts[2], 10000, 0, "0x00", {"from": accounts[0]})
+    nft.mint(accounts[3], 10000, 0, "0x00", {"from": accounts[0]})
+
+
+def test_many_slices(check_ranges, nft):
+    """many slices from one range"""
+    nft.transferRanges(
+        accounts[4], [(100, 200), (300, 400), (5000, 6000)], {"from": accounts[1]}
+    )
+    check_ranges(
+        [(1, 100), (200, 300), (400, 5000), (6000, 10001)],
+        [(10001, 20001)],
+        [(20001, 30001)],
+        [(100, 200), (300, 400), (5000, 6000)],
+    )
+
+
+def test_adjacent_slices(check_ranges, nft):
+    """adjacent slices, merge with receiver"""
+    nft.transferRanges(
+        accounts[2], [(9000, 9500), (9500, 10001)], {"from": accounts[1]}
+    )
+    check_ranges([(1, 9000)], [(9000, 20001)], [(20001, 30001)], [])
+
+
+def test_multiple_source_ranges(check_ranges, nft):
+    """slices from several ranges"""
+    nft.transferRange(accounts[1], 20001, 21001, {"from": accounts[3]})
+    nft.transferRanges(
+        accounts[4], [(5000, 6000), (20500, 21001)], {"from": accounts[1]}
+    )
+    check_ranges(
+        [(1, 5000), (6000, 10001), (20001, 20500)],
+        [(10001, 20001)],
+        [(21001, 30001)],
+        [(5000, 6000), (20500, 21001)],
+    )
+
+
+def test_no_ranges(nft):
+    """no ranges given"""
+    with pytest.reverts("dev: no ranges"):
+        nft.transferRanges(accounts[2], [], {"from": accounts[1]})
+
+
+def test_range_order(nft):
+    """ranges out of order or overlapping"""
+    with pytest.reverts("dev: range order"):
+        nft.transferRanges(accounts[2], [(300, 400), (100, 200)], {"from": accounts[1]})
+    with pytest.reverts("dev: range order"):
+        nft.transferRanges(accounts[2], [(100, 300), (200, 400)], {"from": accounts[1]})
+
+
+def test_not_owner(nft):
+    """one slice not owned by sender"""
+    with pytest.reverts("Sender does not own range"):
+        nft.transferRanges(
+            accounts[3], [(100, 200), (15000, 16000)], {"from": accounts[1]}
+        )
+    assert nft.balanceOf(accounts[1]) == 10000
+
+
+def test_multiple_ranges(nft):
+    """slice spans multiple ranges"""
+    with pytest.reverts("dev: multiple ranges"):
+        nft.transferRanges(
+            accounts[2], [(100, 200), (9000, 11000)], {"from": accounts[1]}
+        )
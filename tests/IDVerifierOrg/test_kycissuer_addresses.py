@@ -56,3 +56,17 @@ def test_owner_add_member_addresses(ikyc):
     )
     assert ikyc.getID(accounts[6]) == "0x123456"
     assert ikyc.getID(accounts[7]) == "0x123456"
+
+
+def test_set_verifier_hints(org, ikyc):
+    """verifier pushes hints to the org"""
+    tx = ikyc.setVerifierHints((accounts[1],), {"from": accounts[0]})
+    assert tx.events["VerifierHintsSet"]["verifier"] == ikyc
+    org.getID.transact(accounts[1])
+    assert org.getMemberVerifier(ikyc.getID(accounts[1])) == ikyc
+
+
+def test_set_verifier_hints_unknown_address(ikyc):
+    """verifier cannot push hints for unregistered addresses"""
+    with pytest.reverts():
+        ikyc.setVerifierHints((accounts[1], accounts[2]), {"from": accounts[0]})
@@ -0,0 +1,83 @@
+#!/usr/bin/python3
+
+import pytest
+
+from brownie import accounts
+
+ids = ["0x1111", "0x2222", "0x3333"]
+
+
+def _add(ikyc, countries=(1, 1, 2)):
+    return ikyc.addMembers(
+        ids,
+        countries,
+        [1] * 3,
+        [1] * 3,
+        [9999999999] * 3,
+        accounts[2:5],
+        {"from": accounts[0]},
+    )
+
+
+def test_add_members(ikyc):
+    """add members"""
+    _add(ikyc)
+    for i in range(3):
+        assert ikyc.isRegistered(ids[i])
+        assert ikyc.getID(accounts[i + 2]) == ids[i]
+    assert ikyc.getCountry(ids[2]) == 2
+
+
+def test_add_members_length(ikyc):
+    """add members - length mismatch"""
+    with pytest.reverts("dev: length mismatch"):
+        ikyc.addMembers(
+            ids,
+            [1, 1],
+            [1] * 3,
+            [1] * 3,
+            [9999999999] * 3,
+            accounts[2:5],
+            {"from": accounts[0]},
+        )
+
+
+def test_add_members_country_zero(ikyc):
+    """add members - country 0"""
+    with pytest.reverts("dev: country 0"):
+        _add(ikyc, (1, 0, 1))
+
+
+def test_add_members_known(ikyc):
+    """add members - known member ID"""
+    _add(ikyc)
+    with pytest.reverts("dev: member ID"):
+        _add(ikyc)
+
+
+def test_update_members(ikyc):
+    """update members"""
+    _add(ikyc)
+    ikyc.updateMembers(
+        ids[:2], ["0x000002"] * 2, [2, 2], [1234567890] * 2, {"from": accounts[0]}
+    )
+    assert ikyc.getRating(ids[0]) == 2
+    assert ikyc.getExpires(ids[1]) == 1234567890
+    assert ikyc.getRating(ids[2]) == 1
+
+
+def test_update_members_unknown(ikyc):
+    """update members - unknown ID"""
+    with pytest.reverts("dev: unknown ID"):
+        ikyc.updateMembers(ids, [1] * 3, [2] * 3, [1] * 3, {"from": accounts[0]})
+
+
+def test_register_addresses_batch(ikyc):
+    """register addresses to many members"""
+    _add(ikyc)
+    ikyc.registerAddressesBatch(
+        [ids[0], ids[0], ids[1]], accounts[5:8], {"from": accounts[0]}
+    )
+    assert ikyc.getID(accounts[5]) == ids[0]
+    assert ikyc.getID(accounts[6]) == ids[0]
+    assert ikyc.getID(accounts[7]) == ids[1]
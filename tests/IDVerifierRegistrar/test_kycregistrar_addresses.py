@@ -188,3 +188,17 @@ def test_authority_restrict_addresses_not_permitted_country(kyc, auth_id):
         kyc.restrictAddresses("0x123456", (accounts[1],), {"from": accounts[-1]})
     kyc.setAuthorityCountries(auth_id, (2,), True, {"from": accounts[0]})
     kyc.restrictAddresses("0x123456", (accounts[1],), {"from": accounts[-1]})
+
+
+def test_signer_index_reuse(kyc, auth_id):
+    """restricted authority addresses free their signer index"""
+    addr = ["0x{:040x}".format(i + 0x1000) for i in range(253)]
+    for i in range(0, 253, 50):
+        kyc.registerAddresses(auth_id, addr[i : i + 50], {"from": accounts[0]})
+    with pytest.reverts("dev: signer count"):
+        kyc.registerAddresses(auth_id, (accounts[3],), {"from": accounts[0]})
+    kyc.restrictAddresses(auth_id, addr[:1], {"from": accounts[0]})
+    kyc.registerAddresses(auth_id, (accounts[3],), {"from": accounts[0]})
+    assert kyc.isApprovedAuthority(accounts[3], 1)
+    with pytest.reverts("dev: signer count"):
+        kyc.registerAddresses(auth_id, addr[:1], {"from": accounts[0]})
@@ -0,0 +1,157 @@
+#!/usr/bin/python3
+
+import pytest
+
+from brownie import accounts
+
+ids = ["0x1111", "0x2222", "0x3333"]
+
+
+def _add(kyc, countries=(1, 1, 2), caller=accounts[0]):
+    return kyc.addMembers(
+        ids,
+        countries,
+        [1] * 3,
+        [1] * 3,
+        [9999999999] * 3,
+        accounts[1:4],
+        {"from": caller},
+    )
+
+
+def test_add_members(kyc):
+    """add members"""
+    _add(kyc)
+    for i in range(3):
+        assert kyc.isRegistered(ids[i])
+        assert kyc.getID(accounts[i + 1]) == ids[i]
+    assert kyc.getCountry(ids[2]) == 2
+
+
+def test_add_members_length(kyc):
+    """add members - length mismatch"""
+    with pytest.reverts("dev: length mismatch"):
+        kyc.addMembers(
+            ids,
+            [1, 1],
+            [1] * 3,
+            [1] * 3,
+            [9999999999] * 3,
+            accounts[1:4],
+            {"from": accounts[0]},
+        )
+    with pytest.reverts("dev: length mismatch"):
+        kyc.addMembers(
+            ids,
+            [1] * 3,
+            [1] * 3,
+            [1] * 3,
+            [9999999999] * 3,
+            accounts[1:3],
+            {"from": accounts[0]},
+        )
+
+
+def test_add_members_country(kyc):
+    """add members - authority not permitted for one country"""
+    with pytest.reverts("dev: country"):
+        _add(kyc, caller=accounts[-1])
+    _add(kyc, (1, 1, 1), accounts[-1])
+
+
+def test_add_members_country_zero(kyc):
+    """add members - country 0"""
+    with pytest.reverts("dev: country 0"):
+        _add(kyc, (1, 1, 0))
+
+
+def test_add_members_repeat(kyc):
+    """add members - repeated member ID"""
+    with pytest.reverts("dev: member ID"):
+        kyc.addMembers(
+            ["0x1111", "0x1111"],
+            [1, 1],
+            [1, 1],
+            [1, 1],
+            [9999999999] * 2,
+            accounts[1:3],
+            {"from": accounts[0]},
+        )
+
+
+def test_add_members_multisig(kyc, auth_id):
+    """add members - multisig is checked once"""
+    kyc.setAuthorityThreshold(auth_id, 2, {"from": accounts[0]})
+    _add(kyc, (1, 1, 1), accounts[-1])
+    assert not kyc.isRegistered(ids[0])
+    _add(kyc, (1, 1, 1), accounts[-2])
+    for i in range(3):
+        assert kyc.isRegistered(ids[i])
+
+
+def test_add_members_registered_multisig(kyc, auth_id):
+    """add members - IDs are checked before the multisig vote"""
+    kyc.setAuthorityThreshold(auth_id, 2, {"from": accounts[0]})
+    _add(kyc, (1, 1, 1))
+    with pytest.reverts("dev: member ID"):
+        _add(kyc, (1, 1, 1), accounts[-1])
+    with pytest.reverts("dev: authority ID"):
+        kyc.addMembers(
+            [auth_id],
+            [1],
+            [1],
+            [1],
+            [9999999999],
+            [accounts[5]],
+            {"from": accounts[-1]},
+        )
+
+
+def test_update_members(kyc):
+    """update members"""
+    _add(kyc)
+    kyc.updateMembers(
+        ids[:2], ["0x000002"] * 2, [2, 2], [1234567890] * 2, {"from": accounts[0]}
+    )
+    assert kyc.getRating(ids[0]) == 2
+    assert kyc.getExpires(ids[1]) == 1234567890
+    assert kyc.getRating(ids[2]) == 1
+
+
+def test_update_members_country(kyc):
+    """update members - authority not permitted for one country"""
+    _add(kyc)
+    with pytest.reverts("dev: country"):
+        kyc.updateMembers(ids, [1] * 3, [2] * 3, [1] * 3, {"from": accounts[-1]})
+
+
+def test_update_members_unknown(kyc):
+    """update members - unknown ID"""
+    with pytest.reverts("dev: country 0"):
+        kyc.updateMembers(ids, [1] * 3, [2] * 3, [1] * 3, {"from": accounts[0]})
+
+
+def test_register_addresses_batch(kyc):
+    """register addresses to many members"""
+    _add(kyc)
+    kyc.registerAddressesBatch(
+        [ids[0], ids[0], ids[1]], accounts[4:7], {"from": accounts[0]}
+    )
+    assert kyc.getID(accounts[4]) == ids[0]
+    assert kyc.getID(accounts[5]) == ids[0]
+    assert kyc.getID(accounts[6]) == ids[1]
+
+
+def test_register_addresses_batch_known(kyc):
+    """register addresses - known address"""
+    _add(kyc)
+    with pytest.reverts("dev: known address"):
+        kyc.registerAddressesBatch(
+            [ids[0], ids[1]], [accounts[4], accounts[4]], {"from": accounts[0]}
+        )
+
+
+def test_register_addresses_batch_authority(kyc, auth_id):
+    """register addresses - authority ID"""
+    with pytest.reverts("dev: country 0"):
+        kyc.registerAddressesBatch([auth_id], [accounts[4]], {"from": accounts[0]})
@@ -0,0 +1,55 @@
+#!/usr/bin/python3
+
+import pytest
+
+from brownie import accounts
+
+from scripts.multisig import sign_call
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(kyc, auth_id):
+    kyc.setAuthorityThreshold(auth_id, 2, {"from": accounts[0]})
+
+
+def _sign(kyc, country):
+    return sign_call(
+        kyc,
+        accounts[-1],
+        [accounts[-2]],
+        "addMember",
+        "0x1234",
+        country,
+        1,
+        1,
+        9999999999,
+        [accounts[3]],
+    )
+
+
+def test_execute(kyc):
+    """execute with signatures"""
+    tx = kyc.executeWithSignatures(*_sign(kyc, 1), {"from": accounts[-1]})
+    assert "MultiSigCallApproved" in tx.events
+    assert kyc.isRegistered("0x1234")
+
+
+def test_country(kyc):
+    """authority not permitted for country"""
+    with pytest.reverts("dev: call failed"):
+        kyc.executeWithSignatures(*_sign(kyc, 2), {"from": accounts[-1]})
+
+
+def test_below_threshold(kyc):
+    """not enough signatures"""
+    data = _sign(kyc, 1)[0]
+    with pytest.reverts("dev: below threshold"):
+        kyc.executeWithSignatures(data, [], [], [], {"from": accounts[-1]})
+
+
+def test_member_caller(kyc):
+    """caller is a member"""
+    kyc.addMember("0x1111", 1, 1, 1, 9999999999, [accounts[4]], {"from": accounts[0]})
+    data, v, r, s = _sign(kyc, 1)
+    with pytest.reverts("dev: not authority"):
+        kyc.executeWithSignatures(data, v, r, s, {"from": accounts[4]})
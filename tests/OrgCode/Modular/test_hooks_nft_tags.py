@@ -154,3 +154,39 @@ def _always(nft, module, sig):
     module.setHook(sig, False, False, {"from": accounts[0]})
     nft.transfer(accounts[2], 1, {"from": accounts[1]})
     nft.transferRange(accounts[2], 401, 410, {"from": accounts[1]})
+
+
+def test_reattach_hook_inactive(org, nft, module):
+    """detach and reattach - inactive hook is not called"""
+    module.setHook("0x244d5002", False, False, {"from": accounts[0]})
+    org.detachModule(nft, module, {"from": accounts[0]})
+    org.attachModule(nft, module, {"from": accounts[0]})
+    nft.transfer(accounts[2], 1, {"from": accounts[1]})
+    module.setHook("0x244d5002", True, True, {"from": accounts[0]})
+    with pytest.reverts():
+        nft.transfer(accounts[2], 1, {"from": accounts[1]})
+
+
+def test_reattach_hook_active(org, nft, module):
+    """detach and reattach - active hook is called"""
+    module.setHook("0x244d5002", True, True, {"from": accounts[0]})
+    org.detachModule(nft, module, {"from": accounts[0]})
+    nft.transfer(accounts[2], 1, {"from": accounts[1]})
+    org.attachModule(nft, module, {"from": accounts[0]})
+    with pytest.reverts():
+        nft.transfer(accounts[2], 1, {"from": accounts[1]})
+
+
+def test_shared_tag_base(org, nft, module):
+    """two modules listening to the same tag base - clear one"""
+    module2 = compile_source(module_source).TestModule.deploy(
+        nft, {"from": accounts[0]}
+    )
+    org.attachModule(nft, module2, {"from": accounts[0]})
+    module.setHookTags("0x244d5002", True, "0xff", ["0x01"], {"from": accounts[0]})
+    module2.setHookTags("0x244d5002", True, "0xff", ["0x01"], {"from": accounts[0]})
+    module.clearHookTags("0x244d5002", ["0xff"], {"from": accounts[0]})
+    with pytest.reverts():
+        nft.transferRange(accounts[2], 401, 410, {"from": accounts[1]})
+    module2.setHookTags("0x244d5002", False, "0xff", ["0x01"], {"from": accounts[0]})
+    nft.transferRange(accounts[2], 401, 410, {"from": accounts[1]})
@@ -185,3 +185,66 @@ def test_authority_remove_from_other(org, id1):
     org.addAuthorityAddresses(id1, accounts[-10:-8], {"from": accounts[-2]})
     with pytest.reverts("dev: wrong authority"):
         org.removeAuthorityAddresses(id1, accounts[-10:-8], {"from": accounts[-1]})
+
+
+def test_signer_index(org, id1):
+    """approvals tracked by signer index"""
+    org.addAuthorityAddresses(id1, accounts[-5:-3], {"from": accounts[0]})
+    org.setAuthorityThreshold(id1, 2, {"from": accounts[0]})
+    accounts[0].transfer(accounts[-5], "1 ether")
+    tx = org.addAuthorityAddresses(id1, [accounts[-6]], {"from": accounts[-2]})
+    assert tx.events["MultiSigCall"]["callCount"] == 1
+    with pytest.reverts("dev: repeat caller"):
+        org.addAuthorityAddresses(id1, [accounts[-6]], {"from": accounts[-2]})
+    tx = org.addAuthorityAddresses(id1, [accounts[-6]], {"from": accounts[-5]})
+    assert "MultiSigCallApproved" in tx.events
+    assert org.getAuthority(id1)[0] == 4
+
+
+def test_signer_index_reapproved(org, id1):
+    """re-approved address receives a new signer index"""
+    org.addAuthorityAddresses(id1, accounts[-5:-3], {"from": accounts[0]})
+    org.removeAuthorityAddresses(id1, [accounts[-5]], {"from": accounts[0]})
+    org.addAuthorityAddresses(id1, [accounts[-5]], {"from": accounts[0]})
+    org.setAuthorityThreshold(id1, 3, {"from": accounts[0]})
+    accounts[0].transfer(accounts[-5], "1 ether")
+    org.addAuthorityAddresses(id1, [accounts[-6]], {"from": accounts[-5]})
+    with pytest.reverts("dev: repeat caller"):
+        org.addAuthorityAddresses(id1, [accounts[-6]], {"from": accounts[-5]})
+    tx = org.addAuthorityAddresses(id1, [accounts[-6]], {"from": accounts[-2]})
+    assert tx.events["MultiSigCall"]["callCount"] == 2
+
+
+def _fill_signers(org, id_, count):
+    addr = ["0x{:040x}".format(i + 0x1000) for i in range(count)]
+    for i in range(0, count, 50):
+        org.addAuthorityAddresses(id_, addr[i : i + 50], {"from": accounts[0]})
+    return addr
+
+
+def test_signer_count_limit(org, ownerid):
+    """signer indexes are reused after an address is removed"""
+    addr = _fill_signers(org, ownerid, 254)
+    with pytest.reverts("dev: signer count"):
+        org.addAuthorityAddresses(ownerid, [accounts[-6]], {"from": accounts[0]})
+    org.removeAuthorityAddresses(ownerid, addr[:2], {"from": accounts[0]})
+    org.addAuthorityAddresses(ownerid, accounts[-6:-4], {"from": accounts[0]})
+    with pytest.reverts("dev: signer count"):
+        org.addAuthorityAddresses(ownerid, [accounts[-4]], {"from": accounts[0]})
+    with pytest.reverts("dev: signer count"):
+        org.addAuthorityAddresses(ownerid, addr[:1], {"from": accounts[0]})
+
+
+def test_signer_index_reuse_clears_approvals(org, id1):
+    """reusing a signer index discards pending approvals"""
+    addr = _fill_signers(org, id1, 254)
+    org.setAuthorityThreshold(id1, 2, {"from": accounts[0]})
+    tx = org.addAuthorityAddresses(id1, [accounts[-6]], {"from": accounts[-2]})
+    assert tx.events["MultiSigCall"]["callCount"] == 1
+    org.removeAuthorityAddresses(id1, addr[:1], {"from": accounts[0]})
+    org.addAuthorityAddresses(id1, [accounts[-5]], {"from": accounts[0]})
+    accounts[0].transfer(accounts[-5], "1 ether")
+    tx = org.addAuthorityAddresses(id1, [accounts[-6]], {"from": accounts[-5]})
+    assert "MultiSigCallApproved" not in tx.events
+    tx = org.addAuthorityAddresses(id1, [accounts[-6]], {"from": accounts[-2]})
+    assert "MultiSigCallApproved" in tx.events
@@ -0,0 +1,93 @@
+#!/usr/bin/python3
+
+import pytest
+
+from brownie import accounts
+
+from scripts.multisig import sign_call
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(org, ownerid):
+    org.addAuthorityAddresses(ownerid, accounts[1:4], {"from": accounts[0]})
+    org.setAuthorityThreshold(ownerid, 3, {"from": accounts[0]})
+
+
+def _sign(org, signers, caller=accounts[0]):
+    return sign_call(org, caller, signers, "setDocumentHash", "doc", "0x1234")
+
+
+def test_execute(org):
+    """execute with signatures"""
+    tx = org.executeWithSignatures(*_sign(org, accounts[1:3]), {"from": accounts[0]})
+    assert "MultiSigCallApproved" in tx.events
+    assert "MultiSigCall" not in tx.events
+    assert org.getDocumentHash("doc") == "0x1234"
+
+
+def test_extra_signatures(org):
+    """more signatures than threshold"""
+    org.executeWithSignatures(*_sign(org, accounts[1:4]), {"from": accounts[0]})
+    assert org.getDocumentHash("doc") == "0x1234"
+
+
+def test_below_threshold(org):
+    """not enough signatures"""
+    with pytest.reverts("dev: below threshold"):
+        org.executeWithSignatures(*_sign(org, [accounts[1]]), {"from": accounts[0]})
+
+
+def test_repeat_signer(org):
+    """repeated signature"""
+    data, v, r, s = _sign(org, [accounts[1]])
+    with pytest.reverts("dev: repeat signer"):
+        org.executeWithSignatures(data, v * 2, r * 2, s * 2, {"from": accounts[0]})
+
+
+def test_caller_signature(org):
+    """signature from caller"""
+    data, v, r, s = _sign(org, [accounts[0]], accounts[1])
+    with pytest.reverts("dev: repeat signer"):
+        org.executeWithSignatures(data, v, r, s, {"from": accounts[0]})
+
+
+def test_replay(org):
+    """signatures cannot be reused"""
+    args = _sign(org, accounts[1:3])
+    org.executeWithSignatures(*args, {"from": accounts[0]})
+    with pytest.reverts("dev: wrong signer"):
+        org.executeWithSignatures(*args, {"from": accounts[0]})
+
+
+def test_wrong_authority(org):
+    """signature from another authority"""
+    org.addAuthority([accounts[4]], [], 2000000000, 1, {"from": accounts[0]})
+    with pytest.reverts("dev: wrong signer"):
+        org.executeWithSignatures(
+            *_sign(org, [accounts[1], accounts[4]]), {"from": accounts[0]}
+        )
+
+
+def test_not_authority(org):
+    """caller is not an authority"""
+    with pytest.reverts("dev: not authority"):
+        org.executeWithSignatures(
+            *_sign(org, accounts[1:3], accounts[7]), {"from": accounts[7]}
+        )
+
+
+def test_not_permitted(org):
+    """authority not permitted to call method"""
+    org.addAuthority(accounts[4:6], [], 2000000000, 2, {"from": accounts[0]})
+    with pytest.reverts("dev: call failed"):
+        org.executeWithSignatures(
+            *_sign(org, [accounts[5]], accounts[4]), {"from": accounts[4]}
+        )
+
+
+def test_pending_approvals(org):
+    """on-chain approvals are not affected"""
+    org.setDocumentHash("doc", "0x1234", {"from": accounts[1]})
+    org.executeWithSignatures(*_sign(org, accounts[1:3]), {"from": accounts[0]})
+    tx = org.setDocumentHash("doc", "0x1234", {"from": accounts[2]})
+    assert tx.events["MultiSigCall"]["callCount"] == 2
@@ -82,3 +82,41 @@ def test_cust_auth_id(org, kyc, rpc):
     org.getID.transact(accounts[1])
     with pytest.reverts("dev: known ID"):
         org.addAuthority([accounts[-1]], [], 2000000000, 1, {"from": accounts[0]})
+
+
+def test_verifier_hint(org, kyc2):
+    """resolve via verifier hint"""
+    kyc2.addMember("0x1234", 1, 1, 1, 9999999999, (accounts[1],), {"from": accounts[0]})
+    org.setVerifierHints(kyc2, [accounts[1]], {"from": accounts[0]})
+    org.getID.transact(accounts[1])
+    assert org.getMemberVerifier("0x1234") == kyc2
+
+
+def test_verifier_hint_wrong(org, kyc, kyc2):
+    """hinted verifier does not know the address"""
+    kyc.addMember("0x1234", 1, 1, 1, 9999999999, (accounts[1],), {"from": accounts[0]})
+    org.setVerifierHints(kyc2, [accounts[1]], {"from": accounts[0]})
+    org.getID.transact(accounts[1])
+    assert org.getMemberVerifier("0x1234") == kyc
+
+
+def test_verifier_hint_restricted(org, kyc, kyc2):
+    """hinted verifier is restricted"""
+    kyc.addMember("0x1234", 1, 1, 1, 9999999999, (accounts[1],), {"from": accounts[0]})
+    kyc2.addMember("0x1234", 1, 1, 1, 9999999999, (accounts[1],), {"from": accounts[0]})
+    org.setVerifierHints(kyc2, [accounts[1]], {"from": accounts[0]})
+    org.setVerifier(kyc2, True, {"from": accounts[0]})
+    org.getID.transact(accounts[1])
+    assert org.getMemberVerifier("0x1234") == kyc
+
+
+def test_verifier_hint_unknown(org):
+    """hint for a verifier that is not associated"""
+    with pytest.reverts("dev: unknown verifier"):
+        org.setVerifierHints(accounts[5], [accounts[1]], {"from": accounts[0]})
+
+
+def test_verifier_hint_not_authority(org, kyc2):
+    """hint set by an unknown address"""
+    with pytest.reverts():
+        org.setVerifierHints(kyc2, [accounts[1]], {"from": accounts[1]})
@@ -59,6 +59,34 @@ def test_custodian_sentShares(check_hooks, share, cust):
     check_hooks(cust.transfer, (share, accounts[0], 100), source, "0xa110724f")
 
 
+def test_custodian_sentShares_many(check_hooks, share, cust):
+    source = """sentShares(
+        address _share,
+        address _to,
+        uint256 _value"""
+    share.transfer(cust, 10000, {"from": accounts[0]})
+    check_hooks(
+        cust.transferMany,
+        (share, [accounts[0], accounts[2]], [100, 200]),
+        source,
+        "0xa110724f",
+    )
+
+
+def test_custodian_sentSharesBatch(check_hooks, share, cust):
+    source = """sentSharesBatch(
+        address _share,
+        address[] _to,
+        uint256[] _value"""
+    share.transfer(cust, 10000, {"from": accounts[0]})
+    check_hooks(
+        cust.transferMany,
+        (share, [accounts[0], accounts[2]], [100, 200]),
+        source,
+        "0xcdfd97e3",
+    )
+
+
 def test_custodian_receivedShares(check_hooks, share, cust):
     source = """receivedShares(
         address _share,
@@ -0,0 +1,17 @@
+#!/usr/bin/python3
+
+import pytest
+
+from brownie import accounts, rpc
+
+
+@pytest.fixture(scope="module")
+def dividend(approve_many, DividendModule, org, share, cust):
+    for i in range(1, 6):
+        share.mint(accounts[i], 1000 * i, {"from": accounts[0]})
+    share.transfer(cust, 500, {"from": accounts[1]})
+    dividend = accounts[0].deploy(DividendModule, share, org, rpc.time() + 100)
+    org.attachModule(share, dividend, {"from": accounts[0]})
+    rpc.sleep(110)
+    dividend.issueDividend(100, {"from": accounts[0], "value": 15000})
+    yield dividend
@@ -0,0 +1,76 @@
+#!/usr/bin/python3
+
+import pytest
+
+from brownie import accounts
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(dividend):
+    dividend.addHolders(accounts[1:6], {"from": accounts[0]})
+
+
+def test_add_holders(dividend):
+    """add holders, ignore duplicates"""
+    assert dividend.holderCount() == 5
+    dividend.addHolders(accounts[2:4], {"from": accounts[0]})
+    assert dividend.holderCount() == 5
+
+
+def test_add_holders_restricted(dividend):
+    """add holders - only authority"""
+    with pytest.reverts():
+        dividend.addHolders(accounts[6:8], {"from": accounts[1]})
+
+
+def test_sweep(dividend):
+    """sweep in chunks"""
+    balances = [i.balance() for i in accounts[1:6]]
+    assert dividend.sweep(0, 2, {"from": accounts[9]}).return_value == 2
+    assert dividend.sweep(2, 2, {"from": accounts[9]}).return_value == 4
+    assert dividend.sweep(4, 2, {"from": accounts[9]}).return_value == 5
+    for i in range(5):
+        assert accounts[i + 1].balance() == balances[i] + (i + 1) * 1000 - (
+            500 if i == 0 else 0
+        )
+        assert dividend.isClaimed(accounts[i + 1], "0x" + "00" * 20)
+    assert dividend.balance() == 500
+
+
+def test_sweep_claimed(dividend):
+    """sweep skips claimed holders"""
+    dividend.claimDividend(accounts[2], {"from": accounts[2]})
+    balance = accounts[2].balance()
+    dividend.sweep(0, 5, {"from": accounts[9]})
+    assert accounts[2].balance() == balance
+    with pytest.reverts():
+        dividend.claimDividend(accounts[3], {"from": accounts[3]})
+
+
+def test_claim_custodian(dividend, cust):
+    """custodied balances are tracked separately"""
+    dividend.sweep(0, 5, {"from": accounts[9]})
+    assert not dividend.isClaimed(accounts[1], cust)
+    dividend.claimCustodianDividend(accounts[1], cust, {"from": accounts[1]})
+    assert dividend.isClaimed(accounts[1], cust)
+    assert dividend.balance() == 0
+    with pytest.reverts():
+        dividend.claimCustodianDividend(accounts[1], cust, {"from": accounts[1]})
+
+
+def test_claim_unlisted(dividend):
+    """claiming adds the holder to the list"""
+    dividend.claimDividend(accounts[6], {"from": accounts[6]})
+    assert dividend.holderCount() == 6
+    assert dividend.isClaimed(accounts[6], "0x" + "00" * 20)
+
+
+def test_claim_many_duplicate(dividend):
+    """an address listed twice is only paid once"""
+    with pytest.reverts():
+        dividend.claimMany([accounts[2], accounts[2]], {"from": accounts[9]})
+    dividend.claimMany([accounts[2], accounts[3]], {"from": accounts[9]})
+    balance = accounts[2].balance()
+    dividend.sweep(0, 5, {"from": accounts[9]})
+    assert accounts[2].balance() == balance
+    assert dividend.balance() == 500
@@ -151,3 +151,16 @@ def test_multi_vote_quorum_not_reached(gov, share, share2):
     assert gov.getVoteResult("0x1234", 1) == 3
     assert gov.getVotePct("0x1234", 0) == (5000, 6666)
     assert gov.getVotePct("0x1234", 1) == (5000, 6666)
+
+
+def test_shared_shares(gov, share, share2, share3):
+    gov.newVote("0x1234", 2000, 0, [share2, share], [1, 1], {"from": accounts[0]})
+    gov.newVote("0x1234", 2000, 0, [share, share3], [2, 1], {"from": accounts[0]})
+    rpc.sleep(210)
+    gov.voteOnProposal("0x1234", 1, {"from": accounts[3]})
+    gov.voteOnProposal("0x1234", 0, {"from": accounts[5]})
+    rpc.sleep(110)
+    gov.closeProposal("0x1234", {"from": accounts[0]})
+    assert gov.getProposalState("0x1234") == 5
+    assert gov.getVotePct("0x1234", 0) == (3333, 0)
+    assert gov.getVotePct("0x1234", 1) == (2857, 0)
@@ -0,0 +1,112 @@
+#!/usr/bin/python3
+
+import pytest
+
+from brownie import accounts, rpc
+
+from scripts.multisig import sign_hash
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(proposal, gov, share, share2, cust):
+    gov.newVote("0x1234", 5000, 0, [share], [1], {"from": accounts[0]})
+    gov.newVote("0x1234", 5000, 0, [share, share2], [1, 2], {"from": accounts[0]})
+    for i in range(1, 4):
+        share.transfer(cust, 500, {"from": accounts[i]})
+
+
+# balances: a[1]    a[2]    a[3]    a[4]    a[5]
+# share:    500     500     500     0       0
+# custody:  500     500     500     0       0
+# share2:   0       0       1000    1000    1000
+
+
+def _ballots(gov, ballots):
+    votes, custodians, v, r, s = [], [], [], [], []
+    for voter, vote, cust in ballots:
+        votes.append(vote)
+        custodians.append(cust)
+        signature = sign_hash(voter, gov.getBallotHash("0x1234", vote))
+        for values, value in zip((v, r, s), signature):
+            values.append(value)
+    return votes, custodians, v, r, s
+
+
+def _check_results(gov):
+    rpc.sleep(110)
+    gov.closeProposal("0x1234", {"from": accounts[0]})
+    assert gov.getProposalState("0x1234") == 4
+    assert gov.getVotePct("0x1234", 0) == (5000, 0)
+    assert gov.getVotePct("0x1234", 1) == (3888, 0)
+
+
+def test_cast_votes(gov, cust):
+    """cast votes by signature"""
+    rpc.sleep(210)
+    ballots = [
+        (accounts[1], 1, cust),
+        (accounts[2], 1, "0x" + "0" * 40),
+        (accounts[3], 0, cust),
+        (accounts[4], 1, "0x" + "0" * 40),
+    ]
+    gov.castVotesBySig("0x1234", *_ballots(gov, ballots), {"from": accounts[9]})
+    _check_results(gov)
+
+
+def test_already_counted(gov, cust):
+    """votes already counted are skipped"""
+    rpc.sleep(210)
+    gov.voteOnProposal("0x1234", 1, {"from": accounts[1]})
+    ballots = [
+        (accounts[1], 1, cust),
+        (accounts[1], 1, cust),
+        (accounts[2], 1, "0x" + "0" * 40),
+        (accounts[3], 0, "0x" + "0" * 40),
+        (accounts[3], 0, cust),
+        (accounts[4], 1, "0x" + "0" * 40),
+    ]
+    gov.castVotesBySig("0x1234", *_ballots(gov, ballots), {"from": accounts[9]})
+    gov.castVotesBySig("0x1234", *_ballots(gov, ballots), {"from": accounts[9]})
+    with pytest.reverts("dev: already voted"):
+        gov.voteOnProposal("0x1234", 1, {"from": accounts[2]})
+    with pytest.reverts("dev: has voted with custodian"):
+        gov.custodialVoteOnProposal("0x1234", cust, {"from": accounts[3]})
+    _check_results(gov)
+
+
+def test_vote_mismatch(gov, cust):
+    """ballot differing from an earlier vote is skipped"""
+    rpc.sleep(210)
+    gov.voteOnProposal("0x1234", 1, {"from": accounts[1]})
+    ballots = [
+        (accounts[1], 0, cust),
+        (accounts[1], 1, cust),
+        (accounts[2], 1, "0x" + "0" * 40),
+        (accounts[3], 0, cust),
+        (accounts[4], 1, "0x" + "0" * 40),
+    ]
+    gov.castVotesBySig("0x1234", *_ballots(gov, ballots), {"from": accounts[9]})
+    _check_results(gov)
+
+
+def test_invalid_vote(gov):
+    """invalid vote"""
+    rpc.sleep(210)
+    ballots = _ballots(gov, [(accounts[1], 2, "0x" + "0" * 40)])
+    with pytest.reverts("dev: invalid vote"):
+        gov.castVotesBySig("0x1234", *ballots, {"from": accounts[9]})
+
+
+def test_length_mismatch(gov):
+    """array length mismatch"""
+    rpc.sleep(210)
+    votes, custodians, v, r, s = _ballots(gov, [(accounts[1], 1, "0x" + "0" * 40)])
+    with pytest.reverts("dev: length mismatch"):
+        gov.castVotesBySig("0x1234", votes, [], v, r, s, {"from": accounts[9]})
+
+
+def test_not_started(gov):
+    """voting has not started"""
+    ballots = _ballots(gov, [(accounts[1], 1, "0x" + "0" * 40)])
+    with pytest.reverts("dev: vote has not started"):
+        gov.castVotesBySig("0x1234", *ballots, {"from": accounts[9]})
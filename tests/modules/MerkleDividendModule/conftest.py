@@ -0,0 +1,32 @@
+#!/usr/bin/python3
+
+import pytest
+
+from brownie import accounts, rpc
+from scripts.merkle_dividend import build_tree, dividend_amounts
+
+
+@pytest.fixture(scope="module")
+def leaves(approve_many, MultiCheckpointModule, org, share, cust):
+    cp = accounts[0].deploy(MultiCheckpointModule, org)
+    org.attachModule(share, cp, {"from": accounts[0]})
+    for i in range(1, 6):
+        share.mint(accounts[i], 3000 * i, {"from": accounts[0]})
+    share.transfer(cust, 1000, {"from": accounts[1]})
+    cptime = rpc.time() + 100
+    cp.newCheckpoint(share, cptime, {"from": accounts[0]})
+    rpc.sleep(110)
+    yield dividend_amounts(cp, share, cptime, 45000, accounts[1:6], [cust])
+
+
+@pytest.fixture(scope="module")
+def tree(leaves):
+    yield build_tree(leaves)
+
+
+@pytest.fixture(scope="module")
+def dividend(MerkleDividendModule, org, share, tree):
+    dividend = accounts[0].deploy(MerkleDividendModule, share, org)
+    org.attachModule(share, dividend, {"from": accounts[0]})
+    dividend.issueDividend(tree[0], 100, {"from": accounts[0], "value": 45000})
+    yield dividend
@@ -0,0 +1,99 @@
+#!/usr/bin/python3
+
+import pytest
+
+from brownie import accounts, rpc
+from scripts.merkle_dividend import build_tree, claim_many_args
+
+
+def test_amounts(leaves, cust):
+    """payouts from checkpoint balances"""
+    assert [i[2] for i in leaves] == [2000, 1000, 6000, 9000, 12000, 15000]
+    assert leaves[1][:2] == (accounts[1], cust)
+
+
+def test_issue(dividend, tree):
+    """issue dividend"""
+    assert dividend.merkleRoot() == tree[0]
+    assert dividend.dividendAmount() == 45000
+    with pytest.reverts():
+        dividend.issueDividend(tree[0], 100, {"from": accounts[0], "value": 1})
+
+
+def test_issue_empty_root(MerkleDividendModule, org, share):
+    """issue with an empty root"""
+    dividend = accounts[0].deploy(MerkleDividendModule, share, org)
+    org.attachModule(share, dividend, {"from": accounts[0]})
+    with pytest.reverts("dev: empty root"):
+        dividend.issueDividend("0x00", 100, {"from": accounts[0], "value": 1})
+
+
+def test_claim(dividend, leaves, tree):
+    """claim each leaf"""
+    for (beneficiary, custodian, amount), proof in zip(leaves, tree[1]):
+        balance = accounts.at(beneficiary).balance()
+        dividend.claimDividend(
+            beneficiary, custodian, amount, proof, {"from": accounts[0]}
+        )
+        assert accounts.at(beneficiary).balance() == balance + amount
+        assert dividend.isClaimed(beneficiary, custodian)
+    assert dividend.balance() == 0
+
+
+def test_claim_twice(dividend, leaves, tree):
+    """claim twice"""
+    dividend.claimDividend(*leaves[0], tree[1][0], {"from": accounts[0]})
+    with pytest.reverts("dev: already claimed"):
+        dividend.claimDividend(*leaves[0], tree[1][0], {"from": accounts[0]})
+
+
+def test_claim_custodian(dividend, leaves, tree):
+    """custodian and direct balances claim separately"""
+    dividend.claimDividend(*leaves[1], tree[1][1], {"from": accounts[0]})
+    assert dividend.isClaimed(leaves[1][0], leaves[1][1])
+    assert not dividend.isClaimed(leaves[0][0], leaves[0][1])
+    dividend.claimDividend(*leaves[0], tree[1][0], {"from": accounts[0]})
+
+
+def test_invalid_proof(dividend, leaves, tree):
+    """wrong amount or proof"""
+    beneficiary, custodian, amount = leaves[2]
+    with pytest.reverts("dev: invalid proof"):
+        dividend.claimDividend(
+            beneficiary, custodian, amount + 1, tree[1][2], {"from": accounts[0]}
+        )
+    with pytest.reverts("dev: invalid proof"):
+        dividend.claimDividend(
+            beneficiary, custodian, amount, tree[1][3], {"from": accounts[0]}
+        )
+
+
+def test_claim_many(dividend, leaves, tree):
+    """claim many"""
+    dividend.claimMany(*claim_many_args(leaves, tree[1]), {"from": accounts[0]})
+    for beneficiary, custodian, amount in leaves:
+        assert dividend.isClaimed(beneficiary, custodian)
+    assert dividend.balance() == 0
+
+
+def test_claim_many_length(dividend, leaves, tree):
+    """claim many - proof lengths mismatch"""
+    args = list(claim_many_args(leaves, tree[1]))
+    args[4][0] -= 1
+    with pytest.reverts("dev: length mismatch"):
+        dividend.claimMany(*args, {"from": accounts[0]})
+
+
+def test_single_leaf():
+    """tree with one leaf"""
+    root, proofs = build_tree([(accounts[1], accounts[2], 100)])
+    assert proofs == [[]]
+
+
+def test_close(dividend, leaves, tree):
+    """close dividend after expiration"""
+    with pytest.reverts():
+        dividend.closeDividend({"from": accounts[0]})
+    rpc.sleep(110)
+    dividend.closeDividend({"from": accounts[0]})
+    assert dividend.balance() == 0
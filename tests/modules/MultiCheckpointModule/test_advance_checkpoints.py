@@ -0,0 +1,67 @@
+#!/usr/bin/python3
+
+import pytest
+
+from brownie import accounts, rpc
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(approve_many, share):
+    for i in range(1, 6):
+        share.mint(accounts[i], 1000 * i, {"from": accounts[0]})
+
+
+def test_advance_no_checkpoints(cp, share):
+    """advance - no checkpoints set"""
+    assert cp.advanceCheckpoints.call(share, 1) is True
+
+
+def test_advance_not_passed(cp, share, cptime):
+    """advance - checkpoint not yet passed"""
+    cp.newCheckpoint(share, cptime, {"from": accounts[0]})
+    assert cp.advanceCheckpoints.call(share, 1) is True
+
+
+def test_advance_partial(cp, share, cptime):
+    """advance - more checkpoints passed than max steps"""
+    for i in range(10):
+        cp.newCheckpoint(share, cptime + i * 10, {"from": accounts[0]})
+    rpc.sleep(300)
+    rpc.mine()
+    assert cp.advanceCheckpoints.call(share, 3) is False
+    cp.advanceCheckpoints(share, 3, {"from": accounts[5]})
+    assert cp.advanceCheckpoints.call(share, 3) is False
+    cp.advanceCheckpoints(share, 3, {"from": accounts[5]})
+    assert cp.advanceCheckpoints.call(share, 3) is True
+
+
+def test_transfer_while_behind(cp, share, cptime):
+    """transfer and mint while checkpoint pointers are behind"""
+    for i in range(20):
+        cp.newCheckpoint(share, cptime + i * 10, {"from": accounts[0]})
+    rpc.sleep(300)
+    share.transfer(accounts[2], 1000, {"from": accounts[1]})
+    share.mint(accounts[3], 3000, {"from": accounts[0]})
+    assert cp.advanceCheckpoints.call(share, 3) is False
+    share.transfer(accounts[1], 500, {"from": accounts[2]})
+    for i in range(20):
+        assert cp.balanceAt(share, accounts[1], cptime + i * 10) == 1000
+        assert cp.balanceAt(share, accounts[2], cptime + i * 10) == 2000
+        assert cp.balanceAt(share, accounts[3], cptime + i * 10) == 3000
+        assert cp.totalSupplyAt(share, cptime + i * 10) == 15000
+
+
+def test_transfer_after_advance(cp, share, cptime):
+    """transfer after keeper has advanced checkpoint pointers"""
+    for i in range(10):
+        cp.newCheckpoint(share, cptime + i * 100, {"from": accounts[0]})
+    rpc.sleep(510)
+    cp.advanceCheckpoints(share, 10, {"from": accounts[5]})
+    share.transfer(accounts[2], 1000, {"from": accounts[1]})
+    rpc.sleep(500)
+    for i in range(6):
+        assert cp.balanceAt(share, accounts[1], cptime + i * 100) == 1000
+        assert cp.balanceAt(share, accounts[2], cptime + i * 100) == 2000
+    for i in range(6, 10):
+        assert cp.balanceAt(share, accounts[1], cptime + i * 100) == 0
+        assert cp.balanceAt(share, accounts[2], cptime + i * 100) == 3000
@@ -0,0 +1,48 @@
+#!/usr/bin/python3
+
+import pytest
+
+from brownie import accounts, rpc
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(approve_many, share):
+    for i in range(1, 6):
+        share.mint(accounts[i], 1000 * i, {"from": accounts[0]})
+
+
+def test_many_checkpoints(cp, share, cptime):
+    """many checkpoints - moved between each"""
+    for i in range(10):
+        cp.newCheckpoint(share, cptime + i * 100, {"from": accounts[0]})
+    rpc.sleep(110)
+    for i in range(10):
+        share.transfer(accounts[2], 100, {"from": accounts[1]})
+        rpc.sleep(100)
+    for i in range(10):
+        assert cp.balanceAt(share, accounts[1], cptime + i * 100) == 1000 - i * 100
+        assert cp.balanceAt(share, accounts[2], cptime + i * 100) == 2000 + i * 100
+
+
+def test_skipped_checkpoints(cp, share, cptime):
+    """many checkpoints - moved once after several have passed"""
+    for i in range(10):
+        cp.newCheckpoint(share, cptime + i * 100, {"from": accounts[0]})
+    rpc.sleep(510)
+    share.transfer(accounts[2], 1000, {"from": accounts[1]})
+    rpc.sleep(500)
+    for i in range(6):
+        assert cp.balanceAt(share, accounts[1], cptime + i * 100) == 1000
+        assert cp.balanceAt(share, accounts[2], cptime + i * 100) == 2000
+    for i in range(6, 10):
+        assert cp.balanceAt(share, accounts[1], cptime + i * 100) == 0
+        assert cp.balanceAt(share, accounts[2], cptime + i * 100) == 3000
+
+
+def test_mint_after(cp, share, cptime):
+    """minted after checkpoint"""
+    cp.newCheckpoint(share, cptime, {"from": accounts[0]})
+    rpc.sleep(110)
+    share.mint(accounts[1], 5000, {"from": accounts[0]})
+    assert cp.balanceAt(share, accounts[1], cptime) == 1000
+    assert share.balanceOf(accounts[1]) == 6000
@@ -0,0 +1,63 @@
+#!/usr/bin/python3
+
+import pytest
+
+from brownie import accounts, rpc
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(approve_many, org, cp, share, share2, cust):
+    org.attachModule(share2, cp, {"from": accounts[0]})
+    for i in range(1, 6):
+        share.mint(accounts[i], 1000 * i, {"from": accounts[0]})
+        share2.mint(accounts[i], 3000 * i, {"from": accounts[0]})
+        share2.transfer(cust, 1000 * i, {"from": accounts[i]})
+
+
+def test_balances_at(cp, share, share2, cptime):
+    """balances for many shares"""
+    cp.newCheckpoint(share, cptime, {"from": accounts[0]})
+    cp.newCheckpoint(share2, cptime, {"from": accounts[0]})
+    rpc.sleep(110)
+    share.transfer(accounts[0], 1000, {"from": accounts[1]})
+    for i in range(1, 6):
+        assert cp.balancesAt([share, share2], accounts[i], cptime) == (
+            1000 * i,
+            2000 * i,
+        )
+    assert cp.balancesAt([share2, share, share2], accounts[1], cptime) == (
+        2000,
+        1000,
+        2000,
+    )
+
+
+def test_totalsupplies_at(cp, share, share2, cptime):
+    """total supplies for many shares"""
+    cp.newCheckpoint(share, cptime, {"from": accounts[0]})
+    cp.newCheckpoint(share2, cptime, {"from": accounts[0]})
+    rpc.sleep(110)
+    share.mint(accounts[1], 1000, {"from": accounts[0]})
+    assert cp.totalSuppliesAt([share, share2], cptime) == (15000, 45000)
+
+
+def test_custodian_balances_at(cp, share, share2, cust, cptime):
+    """custodied balances for many shares"""
+    cp.newCheckpoint(share, cptime, {"from": accounts[0]})
+    cp.newCheckpoint(share2, cptime, {"from": accounts[0]})
+    rpc.sleep(110)
+    for i in range(1, 6):
+        assert cp.custodianBalancesAt([share, share2], accounts[i], cust, cptime) == (
+            0,
+            1000 * i,
+        )
+
+
+def test_no_checkpoint(cp, share, share2, cptime):
+    """one share without checkpoint"""
+    cp.newCheckpoint(share, cptime, {"from": accounts[0]})
+    rpc.sleep(110)
+    with pytest.reverts():
+        cp.balancesAt([share, share2], accounts[1], cptime)
+    with pytest.reverts():
+        cp.totalSuppliesAt([share, share2], cptime)
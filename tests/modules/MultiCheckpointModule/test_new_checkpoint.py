@@ -47,3 +47,33 @@ def test_set_checkpoint_second_share(cp, org, share, share2, cptime):
     org.attachModule(share2, cp, {"from": accounts[0]})
     cp.newCheckpoint(share, cptime, {"from": accounts[0]})
     cp.newCheckpoint(share2, cptime, {"from": accounts[0]})
+
+
+def test_checkpoint_count(cp, share, cptime):
+    """checkpoint count"""
+    assert cp.checkpointCount(share) == 0
+    for i in range(5):
+        cp.newCheckpoint(share, cptime + i * 100, {"from": accounts[0]})
+    assert cp.checkpointCount(share) == 5
+
+
+def test_checkpoint_before(cp, share, cptime):
+    """checkpoint before - set out of order"""
+    for i in (3, 0, 4, 1, 2):
+        cp.newCheckpoint(share, cptime + i * 100, {"from": accounts[0]})
+    assert cp.checkpointBefore(share, cptime - 1) == 0
+    assert cp.checkpointBefore(share, cptime) == cptime
+    for i in range(5):
+        assert cp.checkpointBefore(share, cptime + i * 100 + 50) == cptime + i * 100
+    assert cp.checkpointBefore(share, cptime + 10000) == cptime + 400
+
+
+def test_insert_after_passed(cp, share, cptime):
+    """set a checkpoint earlier than pending ones after others have passed"""
+    cp.newCheckpoint(share, cptime, {"from": accounts[0]})
+    cp.newCheckpoint(share, cptime + 1000, {"from": accounts[0]})
+    rpc.sleep(210)
+    cp.newCheckpoint(share, cptime + 500, {"from": accounts[0]})
+    assert cp.checkpointCount(share) == 3
+    assert cp.checkpointBefore(share, cptime + 999) == cptime + 500
+    assert cp.checkpointBefore(share, cptime + 499) == cptime
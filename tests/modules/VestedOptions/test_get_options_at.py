@@ -74,5 +74,28 @@ def test_multiple(options, id1, issueoptions, sleep):
         options.getOptionsAt(id1, 10, 1)
 
 
+def test_unsorted_tranches(options, id1, sleep):
+    options.issueOptions(
+        id1, 10, False, [100, 200, 300, 50], [4, 1, 4, 0], {"from": accounts[0]}
+    )
+    options.issueOptions(id1, 10, False, [10], [2], {"from": accounts[0]})
+    assert options.getOptionsAt(id1, 10, 0) == (
+        0,
+        660,
+        False,
+        _months(11),
+        [50, 200, 10, 0, 400, 0, 0, 0, 0, 0, 0],
+    )
+    sleep(2)
+    assert options.getOptionsAt(id1, 10, 0) == (
+        250,
+        410,
+        False,
+        _months(9),
+        [10, 0, 400, 0, 0, 0, 0, 0, 0],
+    )
+    assert options.getTotalOptionsAtPrice(10) == (250, 410)
+
+
 def _months(months):
     return int(rpc.time() // 2592000 + 1) * 2592000 + months * 2592000
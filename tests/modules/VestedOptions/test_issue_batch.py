@@ -0,0 +1,120 @@
+#!/usr/bin/python3
+
+import pytest
+
+from brownie import accounts
+
+
+def test_batch(options, id1, id2):
+    """issue to many members and prices"""
+    options.issueOptionsBatch(
+        [id1, id2, id1],
+        [10, 10, 20],
+        [False, False, True],
+        [100, 100, 50, 300],
+        [1, 2, 3, 4],
+        [2, 1, 1],
+        {"from": accounts[0]},
+    )
+    assert options.getOptions(id1) == (0, 500, [(10, 1), (20, 1)])
+    assert options.getOptions(id2) == (0, 50, [(10, 1)])
+    assert options.getTotalOptionsAtPrice(10) == (0, 250)
+    assert options.getTotalOptionsAtPrice(20) == (0, 300)
+    assert options.totalOptions() == 550
+    assert options.getOptionsAt(id1, 20, 0)[2]
+
+
+def test_batch_matches_single(options, id1, id2, sleep):
+    """batch and single grants vest the same"""
+    options.issueOptionsBatch(
+        [id1, id2],
+        [10, 20],
+        [False, False],
+        [100, 200],
+        [1, 2],
+        [1, 1],
+        {"from": accounts[0]},
+    )
+    options.issueOptions(id1, 20, False, [200], [2], {"from": accounts[0]})
+    sleep(4)
+    assert options.getSortedTotals() == ((10, 20), (100, 400))
+    assert options.getTotals() == (500, 0, 0)
+
+
+def test_non_adjacent_prices(options, id1):
+    """same price in non-adjacent grants"""
+    options.issueOptionsBatch(
+        [id1, id1, id1],
+        [10, 20, 10],
+        [False, False, False],
+        [100, 100, 100],
+        [1, 1, 1],
+        [1, 1, 1],
+        {"from": accounts[0]},
+    )
+    assert options.getTotalOptionsAtPrice(10) == (0, 200)
+    assert options.getOptions(id1) == (0, 300, [(10, 1), (20, 1)])
+
+
+def test_length_mismatch(options, id1, id2):
+    """array lengths must match"""
+    with pytest.reverts("dev: length mismatch"):
+        options.issueOptionsBatch(
+            [id1, id2],
+            [10],
+            [False, False],
+            [100, 100],
+            [1, 1],
+            [1, 1],
+            {"from": accounts[0]},
+        )
+    with pytest.reverts("dev: length mismatch"):
+        options.issueOptionsBatch(
+            [id1, id2],
+            [10, 10],
+            [False, False],
+            [100, 100, 100],
+            [1, 1, 1],
+            [1, 1],
+            {"from": accounts[0]},
+        )
+    with pytest.reverts("dev: length mismatch"):
+        options.issueOptionsBatch(
+            [id1, id2],
+            [10, 10],
+            [False, False],
+            [100, 100, 100],
+            [1, 1, 1],
+            [2, 2],
+            {"from": accounts[0]},
+        )
+
+
+def test_exercise_price_zero(options, id1):
+    """exercise price cannot be zero"""
+    with pytest.reverts("dev: exercise price == 0"):
+        options.issueOptionsBatch(
+            [id1], [0], [False], [100], [1], [1], {"from": accounts[0]}
+        )
+
+
+def test_exceeds_authorized_supply(options, id1, id2):
+    """options + shares cannot exceed authorized supply"""
+    with pytest.reverts("dev: exceeds authorized"):
+        options.issueOptionsBatch(
+            [id1, id2],
+            [10, 20],
+            [False, False],
+            [600000, 600000],
+            [1, 1],
+            [1, 1],
+            {"from": accounts[0]},
+        )
+
+
+def test_only_authority(options, id1):
+    """only authority"""
+    with pytest.reverts():
+        options.issueOptionsBatch(
+            [id1], [10], [False], [100], [1], [1], {"from": accounts[1]}
+        )
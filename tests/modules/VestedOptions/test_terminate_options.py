@@ -87,3 +87,18 @@ def test_grace_equals_expiration(options, id1, issueoptions, sleep):
     assert options.getOptions(id1) == (0, 0, [])
     assert options.getTotalOptionsAtPrice(10) == (0, 0)
     assert options.totalOptions() == 0
+
+
+def test_terminate_within_grace(options, id1, sleep):
+    """unvested options terminated inside the grace period"""
+    options.issueOptions(id1, 10, False, [100, 100], [1, 98], {"from": accounts[0]})
+    sleep(96)
+    options.terminateOptions(id1, {"from": accounts[0]})
+    assert options.getOptions(id1) == (100, 0, [(10, 1)])
+    assert options.getTotalOptionsAtPrice(10) == (100, 0)
+    assert options.totalOptions() == 100
+    sleep(10)
+    assert options.getOptions(id1) == (0, 0, [])
+    assert options.getTotalOptionsAtPrice(10) == (0, 0)
+    assert options.totalOptions() == 0
+    assert options.getTotals() == (0, 0, 100)
@@ -29,3 +29,42 @@ def test_issue_exercise(options, id1, issueoptions, sleep):
     assert options.totalOptions() == 100
     options.exerciseOptions(10, 100, {"from": accounts[1], "amount": 1000})
     assert options.totalOptions() == 0
+
+
+def test_get_totals(options, id1, id2, issueoptions, sleep):
+    """global vested, unvested and expired totals"""
+    issueoptions(id1, 10)
+    issueoptions(id2, 20)
+    assert options.getTotals() == (0, 1000, 0)
+    sleep(3)
+    assert options.getTotals() == (400, 600, 0)
+    options.accellerateVesting(id2, {"from": accounts[0]})
+    assert options.getTotals() == (700, 300, 0)
+    options.terminateOptions(id1, {"from": accounts[0]})
+    assert options.getTotals() == (700, 0, 0)
+    sleep(6)
+    assert options.getTotals() == (500, 0, 200)
+    assert options.totalOptions() == 500
+
+
+def test_exercise_then_expire(options, id1, issueoptions, sleep):
+    """partially exercised options expire"""
+    issueoptions(id1, 10)
+    issueoptions(id1, 20)
+    sleep(6)
+    options.exerciseOptions(10, 100, {"from": accounts[1], "amount": 1000})
+    assert options.getTotals() == (900, 0, 0)
+    sleep(100)
+    assert options.getTotals() == (0, 0, 900)
+    assert options.totalOptions() == 0
+    assert options.getTotalOptionsAtPrice(10) == (0, 0)
+    assert options.getOptions(id1) == (0, 0, [])
+
+
+def test_member_prices(options, id1, id2, issueoptions):
+    """member views only include prices held by the member"""
+    issueoptions(id1, 20)
+    issueoptions(id2, 15)
+    issueoptions(id1, 10)
+    assert options.getOptions(id1) == (0, 1000, [(10, 1), (20, 1)])
+    assert options.getOptions(id2) == (0, 500, [(15, 1)])